@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Compares AsyncNum2Words against the synchronous Num2Words client on
+thousands of small files.
+
+Run from the root of the repository:
+
+    python benchmarks/bench_async.py [number of files]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from random import randint, seed
+
+from num2words import AsyncNum2Words, Num2Words
+
+
+def make_files(directory, count):
+    paths = []
+    for i in range(count):
+        path = Path(directory) / f"input{i}.txt"
+        path.write_text(f"We processed {randint(0, 10**12)} records.\n",
+                        encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+async def run_async(paths, max_concurrency):
+    client = AsyncNum2Words(max_concurrency=max_concurrency)
+    return [r async for r in client.as_completed(paths)]
+
+
+def main(count=5000):
+    seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_files(directory, count)
+
+        client = Num2Words()
+        start = time.perf_counter()
+        for path in paths:
+            client(path)
+        sync = time.perf_counter() - start
+        print(f"{'sync Num2Words':>28}: {sync:.3f}s "
+              f"({count / sync:,.0f} files/s)")
+
+        for max_concurrency in (1, 8, 64, 256):
+            start = time.perf_counter()
+            asyncio.run(run_async(paths, max_concurrency))
+            elapsed = time.perf_counter() - start
+            print(f"{f'AsyncNum2Words({max_concurrency})':>28}: "
+                  f"{elapsed:.3f}s ({count / elapsed:,.0f} files/s)")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
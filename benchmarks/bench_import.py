@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Measures the startup cost of the package with ``python -X importtime`` and
+checks it against a budget per scenario. Only the imports that a bare
+``python -c pass`` does not already make are counted, so the interpreter's
+own startup is left out. Bytecode is written by a warm-up run first, so the
+numbers do not include compiling the sources.
+
+Run from the root of the repository, the exit status is 1 if any scenario
+is over budget:
+
+    python benchmarks/bench_import.py [runs per scenario]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = [
+    ("import num2words", ["-c", "import num2words"], 5),
+    ("WordNumeral", ["-c", "from num2words import WordNumeral"], 15),
+    ("Num2Words", ["-c", "from num2words import Num2Words"], 25),
+    ("cli -n", ["-m", "num2words", "-n", "1234"], 30),
+    ("cli -f", ["-m", "num2words", "-f", "tests/test_inputs/test1.txt"], 35),
+]
+"""list: name, python arguments and budget in ms of every scenario"""
+
+
+def import_times(args):
+    """Returns the cumulative import time in us of every top level module"""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run([sys.executable, "-X", "importtime", *args],
+                          env=env, capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def startup(args, baseline):
+    """Returns the import time in ms of the modules baseline does not load"""
+    times = import_times(args)
+    return sum(us for name, us in times.items() if name not in baseline) / 1e3
+
+
+def main(runs=15):
+    baseline = set(import_times(["-c", "pass"]))
+    over = 0
+    print(f"{'scenario':>16}  {'median':>9}  {'min':>9}  {'budget':>9}")
+    for name, args, budget in SCENARIOS:
+        startup(args, baseline)
+        times = [startup(args, baseline) for _ in range(runs)]
+        median = statistics.median(times)
+        over += median > budget
+        print(f"{name:>16}  {median:>7.1f}ms  {min(times):>7.1f}ms  "
+              f"{budget:>7}ms{'  OVER' if median > budget else ''}")
+    return int(over > 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main(*map(int, sys.argv[1:])))
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the lookup table based ``WordNumeral.to_numeral`` against the
+original recursive ``_parse_large`` converter, ``_split_groups`` against a
+plain ``divmod`` loop for numbers of growing length, and the batch
+``WordNumeral.to_numerals`` against a loop of ``to_numeral`` calls, and
+compiled ``NumeralStyle`` objects against the default style and against
+post-processing default numerals with regular expressions.
+
+Run from the root of the repository:
+
+    python benchmarks/bench_numeral.py
+"""
+import re
+import timeit
+from array import array
+from random import randint, seed
+
+from num2words import WordNumeral, NumeralStyle
+from num2words.numeral import _import_numpy, _split_groups
+
+
+def recursive(num):
+    return " ".join(WordNumeral._parse_large(num, 0))
+
+
+def bench_recursive(number=20000):
+    print(f"{'digits':>6}  {'recursive':>12}  {'table':>12}  {'speedup':>7}")
+    for digits in (3, 6, 9, 12, 18, 30, 60, 150):
+        nums = [randint(10 ** (digits - 1), 10 ** digits - 1)
+                for _ in range(100)]
+        old = timeit.timeit(lambda: [recursive(n) for n in nums],
+                            number=number // 100)
+        new = timeit.timeit(lambda: [WordNumeral.to_numeral(n) for n in nums],
+                            number=number // 100)
+        print(f"{digits:>6}  {old / number * 1e6:>10.2f}us  "
+              f"{new / number * 1e6:>10.2f}us  {old / new:>6.1f}x")
+
+
+def divmod_groups(num):
+    groups = []
+    while num:
+        num, rem = divmod(num, 1000)
+        groups.append(rem)
+    groups.reverse()
+    return groups
+
+
+def bench_split(number=200):
+    print(f"\n{'digits':>6}  {'divmod':>12}  {'split':>12}  {'speedup':>7}")
+    for digits in (30, 150, 300, 600, 1200, 2400, 4200):
+        num = randint(10 ** (digits - 1), 10 ** digits - 1)
+        old = timeit.timeit(lambda: divmod_groups(num), number=number)
+        new = timeit.timeit(lambda: _split_groups(num), number=number)
+        print(f"{digits:>6}  {old / number * 1e6:>10.2f}us  "
+              f"{new / number * 1e6:>10.2f}us  {old / new:>6.1f}x")
+
+
+def bench_batch(size=100000, number=5):
+    np = _import_numpy()
+    nums = [randint(0, 2**63 - 1) // 10**randint(0, 18) for _ in range(size)]
+    inputs = [("list", nums), ("array('q')", array('q', nums))]
+    if np is not None:
+        inputs += [("numpy int64", np.array(nums, dtype=np.int64))]
+
+    loop = timeit.timeit(lambda: [WordNumeral.to_numeral(n) for n in nums],
+                         number=number)
+    print(f"\n{'input':>12}  {'loop':>10}  {'batch':>10}  {'speedup':>7}")
+    for name, batch in inputs:
+        new = timeit.timeit(lambda: WordNumeral.to_numerals(batch),
+                            number=number)
+        print(f"{name:>12}  {loop / number / size * 1e9:>8.0f}ns  "
+              f"{new / number / size * 1e9:>8.0f}ns  {loop / new:>6.1f}x")
+
+
+_US_AND = re.compile(r" and (?=\w)")
+_TENS = re.compile(r"\b(twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety)"
+                   r" (one|two|three|four|five|six|seven|eight|nine)\b")
+
+
+def regex_us_hyphenated(num):
+    numeral = WordNumeral.to_numeral(num)
+    return _TENS.sub(r"\1-\2", _US_AND.sub(" ", numeral))
+
+
+def bench_styles(number=20000):
+    nums = [randint(0, 10**12) for _ in range(100)]
+    default = NumeralStyle()
+    us = NumeralStyle(conjunction=False, hyphenate=True)
+    assert [us.to_numeral(n) for n in nums] == \
+        [regex_us_hyphenated(n) for n in nums]
+
+    print(f"\n{'style':>28}  {'per numeral':>12}")
+    for name, func in (("WordNumeral.to_numeral", WordNumeral.to_numeral),
+                       ("NumeralStyle()", default.to_numeral),
+                       ("US hyphenated, compiled", us.to_numeral),
+                       ("US hyphenated, regex", regex_us_hyphenated)):
+        elapsed = timeit.timeit(lambda: [func(n) for n in nums],
+                                number=number // 100)
+        print(f"{name:>28}  {elapsed / number * 1e9:>10.0f}ns")
+
+
+def main():
+    seed(0)
+    bench_recursive()
+    bench_split()
+    bench_batch()
+    bench_styles()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the memory and throughput of the slotted, lazily rendered
+WordNumeral against an eager object carrying a __dict__, as WordNumeral was
+before.
+
+Run from the root of the repository:
+
+    python benchmarks/bench_objects.py [number of objects]
+"""
+import sys
+import timeit
+import tracemalloc
+from random import randint, seed
+
+from num2words import WordNumeral
+
+
+class EagerWordNumeral(WordNumeral):
+    """WordNumeral with a __dict__ which renders its numeral on creation"""
+
+    def __init__(self, num=0):
+        super().__init__(num)
+        self._numeral = self.to_numeral(num)
+
+    def __add__(self, other):
+        return EagerWordNumeral(self.num + other.num)
+
+
+def peak_memory(cls, nums):
+    tracemalloc.start()
+    objects = [cls(n) for n in nums]
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del objects
+    return peak
+
+
+def main(count=200000):
+    seed(0)
+    nums = [randint(0, 10**12) for _ in range(count)]
+    one = [(cls(1), cls(2)) for cls in (EagerWordNumeral, WordNumeral)]
+
+    print(f"{'':>22}  {'eager':>12}  {'lazy':>12}")
+    eager, lazy = (peak_memory(cls, nums) / count
+                   for cls in (EagerWordNumeral, WordNumeral))
+    print(f"{'bytes per object':>22}  {eager:>12.0f}  {lazy:>12.0f}")
+
+    eager, lazy = (timeit.timeit(lambda: [cls(n) for n in nums], number=1)
+                   / count * 1e9 for cls in (EagerWordNumeral, WordNumeral))
+    print(f"{'ns per construction':>22}  {eager:>12.0f}  {lazy:>12.0f}")
+
+    eager, lazy = (timeit.timeit(lambda: a + b, number=count) / count * 1e9
+                   for a, b in one)
+    print(f"{'ns per addition':>22}  {eager:>12.0f}  {lazy:>12.0f}")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Compares ``WordNumeral.range``, which reuses the numeral of the higher
+groups between consecutive numbers, against a loop of ``to_numeral`` calls
+over the same counters, starting from numbers of growing length.
+
+Run from the root of the repository:
+
+    python benchmarks/bench_range.py [numbers per range]
+"""
+import sys
+import timeit
+
+from num2words import WordNumeral
+
+
+def main(count=100000):
+    print(f"{'digits':>6}  {'step':>5}  {'to_numeral':>12}  {'range':>12}  "
+          f"{'speedup':>7}")
+    for digits in (3, 6, 12, 30, 60, 150):
+        for step in (1, 7, 1001):
+            start = 10 ** (digits - 1) if digits > 3 else 0
+            stop = start + count * step
+            if stop >= 10 ** 153:
+                start, stop = 10 ** 153 - count * step, 10 ** 153
+            nums = range(start, stop, step)
+            loop = timeit.timeit(
+                lambda: [WordNumeral.to_numeral(n) for n in nums], number=1)
+            reuse = timeit.timeit(
+                lambda: list(WordNumeral.range(start, stop, step)), number=1)
+            print(f"{digits:>6}  {step:>5}  {loop / count * 1e9:>10.0f}ns  "
+                  f"{reuse / count * 1e9:>10.0f}ns  {loop / reuse:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Measures how Num2Words.convert scales with the number of threads sharing a
+single client, with and without a shared NumeralCache, against a new client
+per file called the modifying way.
+
+Under the GIL threads only overlap while reading files, so the speedup is
+modest; on a free-threaded build (3.13+, ``python3.13t``) conversions run in
+parallel. The build in use is printed first.
+
+Run from the root of the repository:
+
+    python benchmarks/bench_threads.py [number of files]
+"""
+import os
+import sys
+import sysconfig
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+
+from num2words import Num2Words, NumeralCache
+
+
+def make_files(directory, count):
+    rand = Random(0)
+    paths = []
+    for i in range(count):
+        paths.append(os.path.join(directory, f"input{i}.txt"))
+        with open(paths[-1], "w", encoding="utf-8") as f:
+            f.write(f"We processed {rand.randint(0, 10**60)} records.\n")
+    return paths
+
+
+def per_file_client(path):
+    return Num2Words()(path)
+
+
+def run(func, paths, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for _ in pool.map(func, paths, chunksize=64):
+            pass
+    return time.perf_counter() - start
+
+
+def main(count=20000):
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    print(f"Python {sys.version.split()[0]}, free-threaded build: "
+          f"{free_threaded}, GIL enabled: {gil}, CPUs: {os.cpu_count()}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_files(directory, count)
+        scenarios = {
+            "shared client": Num2Words().convert,
+            "shared cached client":
+                Num2Words(cache=NumeralCache(maxsize=count)).convert,
+            "client per file": per_file_client,
+        }
+
+        print(f"{'scenario':>22}  {'threads':>7}  {'files/s':>9}  "
+              f"{'speedup':>7}")
+        for name, func in scenarios.items():
+            single = None
+            for threads in (1, 2, 4, 8):
+                elapsed = run(func, paths, threads)
+                single = single or elapsed
+                print(f"{name:>22}  {threads:>7}  {count / elapsed:>9,.0f}  "
+                      f"{single / elapsed:>6.2f}x")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
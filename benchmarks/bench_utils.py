@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the single pass ``input_handler`` scanner against the original
+split based implementation on large inputs.
+
+Run from the root of the repository:
+
+    python benchmarks/bench_utils.py
+"""
+import timeit
+
+from num2words import input_handler, InvalidNumber
+
+
+def split_handler(input_string):
+    words = input_string.split()
+    with_digits = [w for w in words if any(map(str.isdigit, list(w)))]
+    numeric = [w for w in with_digits if w.isnumeric()]
+    if len(numeric) != 1 or len(with_digits) != 1:
+        raise InvalidNumber("none or multiple numeric words founds")
+    return int(numeric.pop())
+
+
+def make_texts(size):
+    filler = "The quick brown fox, jumps over the lazy dog. "
+    text = filler * (size // len(filler))
+    accented = "Le cœur déçu mais l'âme plutôt naïve, Louÿs rêva. "
+    return {
+        "one number at the end": text + "536",
+        "two numbers at the start": "536 and 537 " + text,
+        "no numbers": text,
+        "non-ASCII, one number": accented * (size // len(accented)) + "536",
+    }
+
+
+def run(handler, text):
+    try:
+        handler(text)
+    except InvalidNumber:
+        pass
+
+
+def main(number=3):
+    print(f"{'size':>6}  {'input':>26}  {'split':>10}  {'scanner':>10}  "
+          f"{'speedup':>7}")
+    for size in (10**5, 10**6, 8 * 10**6):
+        for name, text in make_texts(size).items():
+            old = timeit.timeit(lambda: run(split_handler, text),
+                                number=number) / number
+            new = timeit.timeit(lambda: run(input_handler, text),
+                                number=number) / number
+            print(f"{size // 1000:>5}K  {name:>26}  "
+                  f"{len(text) / old / 1e6:>6.1f}MB/s  "
+                  f"{len(text) / new / 1e6:>6.1f}MB/s  "
+                  f"{old / new:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Load test of the HTTP service in num2words.server. Every client thread sends
+its requests over one kept alive connection, or opens a new connection per
+request with --no-keep-alive, and the throughput and latency percentiles
+are reported per endpoint.
+
+A server is started in this process unless the URL of a running one is
+given. Run from the root of the repository:
+
+    python benchmarks/load_server.py [--url http://127.0.0.1:8080]
+        [--clients 8] [--requests 2000] [--no-keep-alive]
+"""
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.client import HTTPConnection
+from random import Random
+from urllib.parse import urlsplit
+
+from num2words.server import NumeralServer
+
+
+def client(host, port, requests, keep_alive, seed, latencies):
+    rand = Random(seed)
+    conn = HTTPConnection(host, port)
+    for method, url, body in requests(rand):
+        start = time.perf_counter()
+        conn.request(method, url, body)
+        response = conn.getresponse()
+        response.read()
+        assert response.status == 200, response.status
+        latencies.append(time.perf_counter() - start)
+        if not keep_alive:
+            conn.close()
+            conn = HTTPConnection(host, port)
+    conn.close()
+
+
+def run(name, host, port, requests, clients, keep_alive):
+    latencies = []
+    threads = [threading.Thread(target=client, args=(host, port, requests,
+                                                     keep_alive, i, latencies))
+               for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"{name:>10}  {len(latencies) / elapsed:>8.0f}/s  "
+          f"{statistics.median(latencies) * 1e3:>7.2f}ms  "
+          f"{p99 * 1e3:>7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument('--url', type=str, default=None)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=2000,
+                        help="requests per client and endpoint")
+    parser.add_argument('--no-keep-alive', action="store_true",
+                        dest="no_keep_alive")
+    args = parser.parse_args()
+
+    server = None
+    if args.url is None:
+        server = NumeralServer(("127.0.0.1", 0))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        args.url = server.url
+    url = urlsplit(args.url)
+
+    count = args.requests
+    endpoints = {
+        "numeral": lambda rand: (
+            ("GET", f"/numeral?n={rand.randint(0, 10**6)}", None)
+            for _ in range(count)),
+        "numerals": lambda rand: (
+            ("POST", "/numerals",
+             json.dumps([rand.randint(0, 10**12) for _ in range(100)]))
+            for _ in range(count // 10)),
+        "text": lambda rand: (
+            ("POST", "/text", f"There are {rand.randint(0, 10**9)} of them")
+            for _ in range(count)),
+    }
+
+    print(f"{'endpoint':>10}  {'requests':>10}  {'median':>9}  {'p99':>9}")
+    for name, requests in endpoints.items():
+        run(name, url.hostname, url.port, requests, args.clients,
+            not args.no_keep_alive)
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite of the hot paths of the package, with machine-readable
+results and regression checks against a stored baseline:
+
+    - ``numeral/<n>-digits`` ``WordNumeral.to_numeral`` for 1 to 153 digits
+    - ``input_handler/<size>`` ``input_handler`` on text of 100 B to 100 MB
+    - ``client/<n>-files`` ``Num2Words.__call__`` over thousands of files
+    - ``currency/<api>`` ``to_currency`` and ``to_currencies`` on amounts,
+      the batch only with NumPy installed
+    - ``bulk/csv`` ``num2words.bulk.convert_csv`` per row of a CSV file
+    - ``operators/<op>`` the comparison and arithmetic operators
+
+Every benchmark is calibrated to run its function enough times (loops) to
+last at least ``--min-time`` seconds, then timed ``--repeat`` times. The
+time per call of each run is kept and the median is compared, so one-off
+hiccups do not count as regressions.
+
+Run from the root of the repository:
+
+    python benchmarks/suite.py                          # print results
+    python benchmarks/suite.py -o results.json          # save them too
+    python benchmarks/suite.py --save-baseline          # new baseline
+    python benchmarks/suite.py --compare                # check regressions
+    python benchmarks/suite.py -k numeral --quick       # a subset, quickly
+
+With ``--compare`` the exit status is 1 if any benchmark is more than
+``--threshold`` (10% by default) slower than in the baseline. Baselines are
+only meaningful on the machine that recorded them.
+"""
+import argparse
+import json
+import operator
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from random import Random
+
+from num2words import WordNumeral, Num2Words, input_handler, InvalidNumber
+from num2words.numeral import _import_numpy
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "baseline.json")
+"""str: path of the stored baseline"""
+
+BENCHMARKS = {}
+"""dict: setup function of every benchmark by name"""
+
+
+def benchmark(name):
+    """Registers a setup function returning the function to time"""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+# region Benchmarks
+
+def _numeral_setup(digits):
+    def setup(stack):
+        rand = Random(digits)
+        nums = [rand.randint(10 ** (digits - 1) if digits > 1 else 0,
+                             10 ** digits - 1) for _ in range(100)]
+        to_numeral = WordNumeral._render
+        return lambda: [to_numeral(n) for n in nums], len(nums)
+    return setup
+
+
+for _digits in (1, 3, 6, 9, 12, 18, 30, 60, 100, 153):
+    benchmark(f"numeral/{_digits}-digits")(_numeral_setup(_digits))
+
+
+def _handler_setup(size):
+    def setup(stack):
+        filler = "The quick brown fox, jumps over the lazy dog. "
+        text = (filler * (size // len(filler) + 1))[:max(size - 4, 0)]
+        text += " 536"
+
+        def run():
+            try:
+                input_handler(text)
+            except InvalidNumber:
+                pass
+        return run, 1
+    return setup
+
+
+for _name, _size in (("100B", 100), ("10KB", 10**4), ("1MB", 10**6),
+                     ("100MB", 10**8)):
+    benchmark(f"input_handler/{_name}")(_handler_setup(_size))
+
+
+@benchmark("client/2000-files")
+def _client_setup(stack):
+    directory = tempfile.TemporaryDirectory()
+    stack.append(directory.cleanup)
+    rand = Random(0)
+    paths = []
+    for i in range(2000):
+        paths.append(os.path.join(directory.name, f"input{i}.txt"))
+        with open(paths[-1], "w", encoding="utf-8") as f:
+            f.write(f"We processed {rand.randint(0, 10**12)} records.\n")
+    client = Num2Words()
+
+    def run():
+        for path in paths:
+            client(path)
+    return run, len(paths)
+
+
+@benchmark("currency/scalar")
+def _currency_setup(stack):
+    rand = Random(0)
+    amounts = [round(rand.uniform(-10**6, 10**6), 2) for _ in range(1000)]
+    to_currency = WordNumeral.to_currency
+    return lambda: [to_currency(a) for a in amounts], len(amounts)
+
+
+def _currency_batch_setup(stack):
+    np = _import_numpy()
+    rand = Random(0)
+    amounts = np.array([round(rand.uniform(-10**6, 10**6), 2)
+                        for _ in range(1000)])
+    return lambda: WordNumeral.to_currencies(amounts), len(amounts)
+
+
+if _import_numpy() is not None:
+    benchmark("currency/batch")(_currency_batch_setup)
+
+
+@benchmark("bulk/csv")
+def _bulk_setup(stack):
+    import io
+    from num2words.bulk import convert_csv
+    rand = Random(0)
+    text = "id,amount\n" + "".join(f"{i},{rand.randint(-10**9, 10**12)}\n"
+                                   for i in range(10000))
+
+    def run():
+        convert_csv(io.StringIO(text), io.StringIO(), "amount")
+    return run, 10000
+
+
+_OPERATORS = {
+    "eq": operator.eq, "lt": operator.lt, "add": operator.add,
+    "sub": operator.sub, "mul": operator.mul, "floordiv": operator.floordiv,
+    "mod": operator.mod, "pow": operator.pow, "lshift": operator.lshift,
+    "rshift": operator.rshift, "and": operator.and_, "or": operator.or_,
+    "xor": operator.xor,
+}
+
+
+def _operator_setup(func):
+    def setup(stack):
+        rand = Random(0)
+        small = func in (operator.pow, operator.lshift)
+        pairs = [(WordNumeral(rand.randint(10**6, 10**9)),
+                  WordNumeral(rand.randint(1, 3 if small else 10**6)))
+                 for _ in range(100)]
+        return lambda: [func(a, b) for a, b in pairs], len(pairs)
+    return setup
+
+
+for _name, _func in _OPERATORS.items():
+    benchmark(f"operators/{_name}")(_operator_setup(_func))
+
+# endregion
+
+
+def measure(setup, repeat, min_time):
+    """Calibrates and times a benchmark
+
+    :return: loops per run and the seconds per call of every run
+    :rtype: tuple[int, list[float]]
+    """
+    cleanup = []
+    try:
+        func, calls = setup(cleanup)
+        func()  # warm up
+
+        loops = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+            loops *= 2 if elapsed == 0 else \
+                max(2, min(10, int(min_time / elapsed) + 1))
+
+        runs = [elapsed / loops / calls]
+        for _ in range(repeat - 1):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            runs.append((time.perf_counter() - start) / loops / calls)
+        return loops, runs
+    finally:
+        for func in cleanup:
+            func()
+
+
+def run_suite(names, repeat, min_time):
+    """Runs the benchmarks and returns the machine-readable results"""
+    results = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "benchmarks": {},
+    }
+    for name in names:
+        loops, runs = measure(BENCHMARKS[name], repeat, min_time)
+        results["benchmarks"][name] = {
+            "median": statistics.median(runs),
+            "min": min(runs),
+            "stdev": statistics.stdev(runs) if len(runs) > 1 else 0.0,
+            "loops": loops,
+            "runs": runs,
+        }
+        print(f"{name:>28}  {_format(statistics.median(runs)):>10}  "
+              f"+- {_format(results['benchmarks'][name]['stdev']):>10}",
+              flush=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Prints the change of every benchmark against the baseline
+
+    Benchmarks missing from the baseline are reported as such, so a new
+    benchmark is not silently left unchecked; save a new baseline to check
+    them.
+
+    :return: names of the benchmarks slower than threshold allows
+    :rtype: list[str]
+    """
+    regressions = []
+    print(f"\n{'benchmark':>28}  {'baseline':>10}  {'now':>10}  {'change':>7}")
+    for name, result in results["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            print(f"{name:>28}  {'-':>10}  {_format(result['median']):>10}  "
+                  f"{'-':>7}  NO BASELINE")
+            continue
+        old = baseline["benchmarks"][name]["median"]
+        new = result["median"]
+        slower = new > old * (1 + threshold)
+        regressions += [name] if slower else []
+        print(f"{name:>28}  {_format(old):>10}  {_format(new):>10}  "
+              f"{new / old - 1:>+6.1%}{'  REGRESSION' if slower else ''}")
+    return regressions
+
+
+def _format(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.1f}ns"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="num2words benchmark suite")
+    parser.add_argument('-k', type=str, default="", dest="filter",
+                        help="only run benchmarks whose name contains this")
+    parser.add_argument('-o', type=str, default=None, dest="output",
+                        help="write the results to this JSON file")
+    parser.add_argument('--baseline', type=str, default=BASELINE,
+                        help="baseline JSON file")
+    parser.add_argument('--save-baseline', action="store_true",
+                        dest="save_baseline",
+                        help="write the results to the baseline file")
+    parser.add_argument('--compare', action="store_true",
+                        help="compare against the baseline, exit status 1 "
+                             "on regressions")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="slowdown tolerated by --compare")
+    parser.add_argument('--repeat', type=int, default=7,
+                        help="timed runs per benchmark")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        dest="min_time", help="minimum seconds per run")
+    parser.add_argument('--quick', action="store_true",
+                        help="3 runs of at least 0.05s, for a rough look")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.repeat, args.min_time = 3, 0.05
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    results = run_suite(names, args.repeat, args.min_time)
+
+    for path in ([args.output] if args.output else []) + \
+            ([args.baseline] if args.save_baseline else []):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        return int(bool(compare(results, baseline, args.threshold)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
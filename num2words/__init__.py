@@ -2,6 +2,53 @@
 
 # Clearly define which parts of the API will be exposed to the user
 # e.g. expose the Numeral class, and maybe the Client?
-from num2words.utils import *
-from num2words.numeral import WordNumeral
-from num2words.client import Num2Words
+#
+# Submodules are only imported the first time one of their names is looked
+# up, see __getattr__, so importing the package (or running the CLI) does not
+# pay for the clients' imports of multiprocessing, hashlib or asyncio.
+
+_LAZY = {
+    "Error": "num2words.utils",
+    "NumberTooLarge": "num2words.utils",
+    "InvalidNumber": "num2words.utils",
+    "InvalidNumeral": "num2words.utils",
+    "input_handler": "num2words.utils",
+    "chunked_input_handler": "num2words.utils",
+    "WordNumeral": "num2words.numeral",
+    "NumeralCache": "num2words.numeral",
+    "CacheInfo": "num2words.numeral",
+    "NumeralStyle": "num2words.numeral",
+    "Manifest": "num2words.manifest",
+    "Stats": "num2words.stats",
+    "Num2Words": "num2words.client",
+    "FileResult": "num2words.client",
+    "iter_paths": "num2words.client",
+    "AsyncNum2Words": "num2words.async_client",
+    "convert_csv": "num2words.bulk",
+    "convert_parquet": "num2words.bulk",
+}
+"""dict: module defining each public name, imported on first use"""
+
+_SUBMODULES = ("utils", "numeral", "client", "async_client", "manifest",
+               "stats", "server", "bulk")
+"""tuple: submodules reachable as attributes, imported on first use"""
+
+_LAZY.update((name, f"{__name__}.{name}") for name in _SUBMODULES)
+
+__all__ = [name for name in _LAZY if name not in _SUBMODULES]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in _SUBMODULES:
+        from importlib import import_module
+        return import_module(_LAZY[name])
+    # __import__ rather than importlib so -X importtime reports the module
+    value = getattr(__import__(_LAZY[name], fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,29 +1,198 @@
 # -*- coding: utf-8 -*-
 """Entry point for the package"""
+
 import argparse
-from num2words import WordNumeral, Num2Words
+import io
+import sys
+import time
+
+_READ_SIZE = 1 << 16
+"""int: maximum number of bytes read from stdin at a time with --serve"""
+
+
+def _parser():
+    """Builds the command line parser
+
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="Process a file for numerals",
+        epilog="'num2words bulk -h' describes converting a column of a CSV "
+               "or Parquet file")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('-f', type=str, help="path for the input file",
+                       dest="file_path", nargs="?")
+    group.add_argument('-n', type=int, help="number to be parsed to numeral",
+                       dest="number", nargs="?")
+    group.add_argument('-p', type=str, help="files, directories or glob "
+                                            "patterns to process; '-' reads "
+                                            "paths from stdin, one per line",
+                       dest="paths", nargs="+")
+    group.add_argument('--serve', action="store_true",
+                       help="read numbers or lines of text from stdin and "
+                            "write one numeral per line to stdout until "
+                            "stdin is closed")
+    parser.add_argument('--jsonl', action="store_true",
+                        help="with -p or --serve, print JSON lines instead of "
+                             "path<TAB>numeral or numeral")
+    parser.add_argument('-j', type=int, default=1, dest="workers",
+                        help="with -p, number of worker processes (0 for one "
+                             "per CPU)")
+    parser.add_argument('--unordered', action="store_true",
+                        help="with -p and -j, print results as soon as they "
+                             "are ready rather than in input order")
+    parser.add_argument('--manifest', type=str, dest="manifest",
+                        help="with -p, manifest file of a previous run; "
+                             "files that did not change since are not "
+                             "converted again and an interrupted run resumes "
+                             "where it stopped")
+    parser.add_argument('--flush-interval', type=float, default=1.0,
+                        dest="flush_interval",
+                        help="with --serve, maximum number of seconds "
+                             "results are buffered while input keeps coming")
+    return parser
 
-parser = argparse.ArgumentParser(description="Process a file for numerals")
-group = parser.add_mutually_exclusive_group()
-group.add_argument('-f', type=str, help="path for the input file",
-                   dest="file_path", nargs="?")
-group.add_argument('-n', type=int, help="number to be parsed to numeral",
-                   dest="number", nargs="?")
-args = parser.parse_args()
 
+def main(argv=None):
+    """Runs the command line interface
 
-def main():
-    if args.number is None and args.file_path is None:
+    Only the modules needed by the options given are imported. A first
+    argument 'bulk' runs the subcommand of ``num2words.bulk`` instead.
+
+    :param argv: arguments, defaults to ``sys.argv[1:]``
+    :type argv: list[str]
+    :return: exit status
+    :rtype: int
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["bulk"]:
+        from num2words.bulk import main as bulk_main
+        return bulk_main(argv[1:])
+
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        stdout = sys.stdout.buffer
+        if not isinstance(stdout, io.BufferedIOBase):  # python -u
+            stdout = io.BufferedWriter(stdout, _READ_SIZE)
+        return serve(sys.stdin.buffer, stdout,
+                     flush_interval=args.flush_interval, jsonl=args.jsonl)
+    elif args.number is None and args.file_path is None and \
+            args.paths is None:
         parser.print_help()
         return 0
     elif args.number is not None:
+        from num2words.numeral import WordNumeral
         print(WordNumeral.to_numeral(args.number))
     elif args.file_path is not None:
+        from num2words.client import Num2Words
         client = Num2Words()
         print(client(args.file_path))
+    elif args.paths is not None:
+        import json
+        from num2words.client import Num2Words, iter_paths
+        status = 0
+        results = Num2Words().process_many(iter_paths(args.paths),
+                                           workers=args.workers or None,
+                                           ordered=not args.unordered,
+                                           manifest=args.manifest)
+        for result in results:
+            failed = result.numeral is None
+            if args.jsonl:
+                record = {"path": result.path, "numeral": result.numeral}
+                if failed:
+                    record["error"] = result.error
+                line = json.dumps(record)
+            else:
+                line = (f"{result.path}\terror: {result.error}" if failed else
+                        f"{result.path}\t{result.numeral}")
+            status = status or int(failed)
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+        return status
     else:
         return 1
 
 
+def serve(infile, outfile, flush_interval=1.0, jsonl=False):
+    """Converts every line of infile and writes a numeral per line to outfile
+
+    A line holding only digits is converted straight away, anything else
+    goes through ``input_handler`` like the contents of a file. A line that
+    cannot be converted, e.g. with no number, several numbers or bad UTF-8,
+    gives an ``error: `` line (or a JSON record with an error) in its place
+    so the output always has one line per input line.
+
+    Input is read as it becomes available and the results of everything
+    read are written in one go. They are flushed as soon as no more input is
+    waiting, so a line at a time conversation gets its answer straight
+    away, and otherwise at least every ``flush_interval`` seconds.
+
+    :param infile: binary stream to read lines from, e.g. stdin.buffer
+    :type infile: io.BufferedReader
+    :param outfile: binary stream to write numerals to, e.g. stdout.buffer
+    :type outfile: io.BufferedWriter
+    :param flush_interval: maximum number of seconds output is buffered
+    :type flush_interval: float
+    :param jsonl: whether to write JSON lines instead of plain numerals
+    :type jsonl: bool
+    :return: exit status, 1 if any line could not be converted
+    :rtype: int
+    """
+    import json
+    from num2words.numeral import WordNumeral
+    from num2words.utils import input_handler, Error
+
+    to_numeral = WordNumeral.to_numeral
+    failed = count = 0
+    carry = []  # pieces of the line being read, joined once it is complete
+    flushed = time.monotonic()
+    while True:
+        data = infile.read1(_READ_SIZE)
+        end = data.rfind(b"\n")
+        if end >= 0:
+            carry.append(data[:end])
+            lines = b"".join(carry).split(b"\n")
+            carry = [data[end + 1:]]
+        elif data:
+            carry.append(data)
+            lines = []
+        else:
+            last = b"".join(carry)
+            lines = [last] if last else []
+
+        out = []
+        for line in lines:
+            count += 1
+            try:
+                text = line.decode("utf-8")
+                if text.isdigit() and text.isascii():
+                    numeral = to_numeral(int(text))
+                else:
+                    numeral = to_numeral(input_handler(text))
+                error = None
+            except (Error, ValueError) as e:
+                numeral, error = None, str(e)
+                failed = 1
+
+            if jsonl:
+                record = {"line": count, "numeral": numeral}
+                if error is not None:
+                    record["error"] = error
+                out.append(json.dumps(record))
+            else:
+                out.append(numeral if error is None else f"error: {error}")
+        if out:
+            outfile.write(("\n".join(out) + "\n").encode("utf-8"))
+
+        now = time.monotonic()
+        if len(data) < _READ_SIZE or now - flushed >= flush_interval:
+            outfile.flush()
+            flushed = now
+        if not data:
+            return failed
+
+
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
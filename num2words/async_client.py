@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+The module contains an asyncio flavour of the Num2Words client. Files are
+read and converted on a thread pool so the event loop is never blocked, with
+the number of executor jobs in flight bounded by a semaphore.
+"""
+import asyncio
+from functools import partial
+from itertools import islice
+from weakref import WeakKeyDictionary
+from num2words import WordNumeral, input_handler, InvalidNumber
+from num2words.client import _convert_file
+
+_INLINE_TEXT = 1 << 12
+"""int: length of the longest text converted on the event loop itself"""
+
+
+class AsyncNum2Words:
+    """
+    Client class for asyncio applications. It extracts positive integer
+    values from files and text with the same handler logic as Num2Words and
+    returns their English numerals, without modifying the object.
+
+    File conversions return a ``FileResult`` and never raise for a bad file;
+    see ``Num2Words.process_many`` for the possible statuses.
+    """
+    # region Constructor
+    def __init__(self, handler=input_handler, cache=None, max_concurrency=64,
+                 executor=None):
+        """
+        Constructor for the AsyncNum2Words class.
+
+        :param handler: input handler function, see Num2Words
+        :type handler: function
+        :param cache: cache to convert numbers through, see Num2Words
+        :type cache: NumeralCache
+        :param max_concurrency: maximum number of executor jobs at a time
+        :type max_concurrency: int
+        :param executor: executor running file conversions, defaults to the
+            event loop's default thread pool
+        :type executor: concurrent.futures.Executor
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, not "
+                             f"{max_concurrency}")
+
+        self._handler = handler
+        self._to_numeral = (WordNumeral.to_numeral if cache is None else
+                            cache.to_numeral)
+        self._max_concurrency = max_concurrency
+        self._executor = executor
+        self._semaphores = WeakKeyDictionary()
+    # endregion
+
+    # region Properties
+    @property
+    def max_concurrency(self):
+        return self._max_concurrency
+    # endregion
+
+    # region Methods
+    async def convert(self, path):
+        """Reads a file off the event loop and converts the number in it
+
+        :param path: path to input_file
+        :type path: str
+        :return: outcome of the conversion
+        :rtype: FileResult
+        """
+        return await self._run(partial(_convert_file, self._handler,
+                                       self._to_numeral, path))
+
+    async def text_to_numeral(self, text):
+        """Extracts the number from text and returns its English numeral
+
+        Texts longer than ``_INLINE_TEXT`` characters are handled on the
+        executor, like files, so a large text never blocks the event loop;
+        shorter ones are not worth the trip.
+
+        :param text: text to search for a numeric value
+        :type text: str
+        :return: English numeral or 'number invalid'
+        :rtype: str
+        """
+        if len(text) > _INLINE_TEXT:
+            return await self._run(partial(_text_to_numeral, self._handler,
+                                           self._to_numeral, text))
+        return _text_to_numeral(self._handler, self._to_numeral, text)
+
+    async def convert_many(self, paths):
+        """Reads and converts a batch of files in a single executor job
+
+        :param paths: paths of the files to convert
+        :type paths: Iterable[str]
+        :return: one result per path, in input order
+        :rtype: list[FileResult]
+        """
+        return await self._run(partial(_convert_files, self._handler,
+                                       self._to_numeral, list(paths)))
+
+    async def as_completed(self, paths, chunksize=16):
+        """Converts many files, yielding results as soon as they are ready
+
+        Paths are converted ``chunksize`` at a time, see ``convert_many``, to
+        amortise the cost of handing work to the executor. At most
+        ``max_concurrency`` chunks are scheduled at a time, so ``paths`` may
+        be an arbitrarily long (lazy) iterable.
+
+        :param paths: paths of the files to convert
+        :type paths: Iterable[str]
+        :param chunksize: number of files converted per executor job
+        :type chunksize: int
+        :return: one result per path, in completion order of the chunks
+        :rtype: AsyncIterator[FileResult]
+        """
+        paths = iter(paths)
+        pending = set()
+        try:
+            while True:
+                while len(pending) < self._max_concurrency:
+                    chunk = list(islice(paths, chunksize))
+                    if not chunk:
+                        break
+                    pending.add(asyncio.ensure_future(
+                        self.convert_many(chunk)))
+
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for result in task.result():
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _run(self, func):
+        """Runs func on the executor once the semaphore lets it through
+
+        Every event loop gets its own semaphore, created inside it, since a
+        semaphore is bound to the loop it is first used in and the client
+        may be used from several ``asyncio.run`` calls.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores.setdefault(
+                loop, asyncio.Semaphore(self._max_concurrency))
+
+        async with semaphore:
+            return await loop.run_in_executor(self._executor, func)
+    # endregion
+
+    # region Display Overrides
+    def __repr__(self):
+        return (f"AsyncNum2Words({self._handler}, "
+                f"max_concurrency={self._max_concurrency})")
+    # endregion
+
+
+def _text_to_numeral(handler, to_numeral, text):
+    """Converts the number in text, 'number invalid' if there is none"""
+    try:
+        num = handler(text)
+    except InvalidNumber:
+        return "number invalid"
+    return to_numeral(num)
+
+
+def _convert_files(handler, to_numeral, paths):
+    """Converts a batch of files without raising, see _convert_file"""
+    return [_convert_file(handler, to_numeral, path) for path in paths]
@@ -0,0 +1,431 @@
+# -*- coding: utf-8 -*-
+"""
+The module converts a column of integers in a table to a column of English
+numerals, a batch of rows at a time, e.g. to add an amount in words to every
+row of a CSV file too large to hold in memory. Parquet files are supported
+as well with the optional pyarrow.
+
+Each batch of the column goes through ``WordNumeral.to_numerals``, so with
+NumPy installed no numeral takes a Python call of its own, and is written
+out before the next batch is read. Batches can be converted over a pool of
+worker processes, a bounded number of them at a time.
+"""
+import argparse
+import csv
+import io
+import os
+import sys
+from collections import deque
+from itertools import islice
+from num2words import WordNumeral, NumeralStyle, InvalidNumber, \
+    NumberTooLarge
+from num2words.numeral import _import_numpy
+
+_BATCH_SIZE = 1 << 16
+"""int: default number of rows converted at a time"""
+
+_ERRORS = ("strict", "blank")
+"""tuple: ways of handling values that cannot be converted
+
+    - ``strict`` raise InvalidNumber or NumberTooLarge with the row number
+    - ``blank`` leave the numeral of the row empty (null in Parquet)
+"""
+
+
+def convert_csv(infile, outfile, column, output_column=None,
+                batch_size=_BATCH_SIZE, workers=1, style=None,
+                errors="strict", **fmtparams):
+    """Adds the English numerals of an integer column to a CSV file
+
+    The first row of ``infile`` is its header. Rows are read
+    ``batch_size`` at a time and written to ``outfile`` with their numeral
+    in ``output_column``, appended to every row unless it is the name of an
+    existing column, e.g. ``column`` itself, which is then replaced. At
+    most ``2 * workers + 1`` batches are held in memory at any time.
+
+    Values are parsed like ``int``, so surrounding spaces, a sign and
+    underscores between digits are accepted. With ``workers`` other than 1
+    the batches are converted in a pool of processes; the style must then
+    be picklable, which every NumeralStyle is.
+
+    :param infile: path or text file opened with ``newline=''`` to read
+    :type infile: str | os.PathLike | io.TextIOBase
+    :param outfile: path or text file opened with ``newline=''`` to write
+    :type outfile: str | os.PathLike | io.TextIOBase
+    :param column: name of the integer column in the header
+    :type column: str
+    :param output_column: name of the numeral column, by default the name of
+        ``column`` followed by '_words'
+    :type output_column: str
+    :param batch_size: number of rows converted at a time
+    :type batch_size: int
+    :param workers: number of processes, None for the CPU count
+    :type workers: int
+    :param style: numeral style, British by default, see NumeralStyle
+    :type style: NumeralStyle
+    :param errors: 'strict' or 'blank', see ``_ERRORS``
+    :type errors: str
+    :param fmtparams: formatting parameters of ``csv.reader`` and
+        ``csv.writer``; lines are terminated with '\\n' by default
+    :return: number of rows converted
+    :rtype: int
+    :raises: ValueError, InvalidNumber, NumberTooLarge
+
+    :example:
+
+    >>> convert_csv("orders.csv", "words.csv", "amount")
+    50000000
+    """
+    _check_options(batch_size, errors)
+    fmtparams.setdefault("lineterminator", "\n")
+
+    with _open(infile, "r") as src, _open(outfile, "w") as dst:
+        reader = csv.reader(src, **fmtparams)
+        writer = csv.writer(dst, **fmtparams)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("the CSV file is empty")
+        if column not in header:
+            raise ValueError(f"no column {column!r} in {header}")
+
+        index = header.index(column)
+        output_column = output_column or f"{column}_words"
+        if output_column in header:
+            out = header.index(output_column)
+        else:
+            out = len(header)
+            header.append(output_column)
+        writer.writerow(header)
+
+        batches = iter(lambda: list(islice(reader, batch_size)), [])
+        items = ((len(rows), (rows, index, out, style, errors, start,
+                              fmtparams))
+                 for start, rows in _numbered(batches))
+
+        count = 0
+        for size, text in _map_batches(_convert_rows, items, workers):
+            dst.write(text)
+            count += size
+        return count
+
+
+def convert_parquet(source, dest, column, output_column=None,
+                    batch_size=_BATCH_SIZE, workers=1, style=None,
+                    errors="strict"):
+    """Adds the English numerals of an integer column to a Parquet file
+
+    Works as ``convert_csv``, reading record batches of ``source`` and
+    writing them to ``dest`` with a string column of numerals. Null values
+    give null numerals. Requires the optional pyarrow.
+
+    :param source: path or file of the Parquet file to read
+    :type source: str | os.PathLike | io.IOBase
+    :param dest: path or file of the Parquet file to write
+    :type dest: str | os.PathLike | io.IOBase
+    :param column: name of the integer column
+    :type column: str
+    :param output_column: name of the numeral column, by default the name of
+        ``column`` followed by '_words'
+    :type output_column: str
+    :param batch_size: number of rows converted at a time
+    :type batch_size: int
+    :param workers: number of processes, None for the CPU count
+    :type workers: int
+    :param style: numeral style, British by default, see NumeralStyle
+    :type style: NumeralStyle
+    :param errors: 'strict' or 'blank', see ``_ERRORS``
+    :type errors: str
+    :return: number of rows converted
+    :rtype: int
+    :raises: ImportError, ValueError, InvalidNumber, NumberTooLarge
+    """
+    _check_options(batch_size, errors)
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet files need pyarrow, install it with "
+                          "'pip install pyarrow'") from None
+
+    reader = pq.ParquetFile(source)
+    names = reader.schema_arrow.names
+    if column not in names:
+        raise ValueError(f"no column {column!r} in {names}")
+    kind = reader.schema_arrow.field(column).type
+    if not (pa.types.is_integer(kind) or pa.types.is_string(kind) or
+            pa.types.is_large_string(kind)):
+        raise ValueError(f"column {column!r} holds {kind}, not integers")
+    output_column = output_column or f"{column}_words"
+
+    def values(batch):
+        array = batch.column(names.index(column))
+        if array.null_count or not pa.types.is_integer(array.type):
+            return array.to_pylist()
+        return array.to_numpy()
+
+    items = ((batch, (values(batch), style, errors, start))
+             for start, batch in _numbered(reader.iter_batches(batch_size)))
+
+    count = 0
+    writer = None
+    try:
+        for batch, numerals in _map_batches(_convert_batch, items, workers):
+            table = pa.Table.from_batches([batch])
+            numerals = pa.array(numerals, pa.string())
+            if output_column in names:
+                table = table.set_column(names.index(output_column),
+                                         output_column, numerals)
+            else:
+                table = table.append_column(output_column, numerals)
+            if writer is None:
+                writer = pq.ParquetWriter(dest, table.schema)
+            writer.write_table(table)
+            count += len(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:  # no rows, the schema is written all the same
+        schema, field = reader.schema_arrow, pa.field(output_column,
+                                                      pa.string())
+        schema = schema.set(names.index(output_column), field) if \
+            output_column in names else schema.append(field)
+        pq.write_table(schema.empty_table(), dest)
+    return count
+
+
+# region Helper Functions
+
+def _check_options(batch_size, errors):
+    """Raises ValueError for a batch size < 1 or an unknown errors option"""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, not {batch_size}")
+    if errors not in _ERRORS:
+        raise ValueError(f"errors must be one of {_ERRORS}, not {errors!r}")
+
+
+def _open(file, mode):
+    """Opens a path for csv, or wraps an open file so closing leaves it open
+
+    :rtype: typing.ContextManager[io.TextIOBase]
+    """
+    if isinstance(file, (str, bytes, os.PathLike)):
+        return open(file, mode, encoding="utf-8", newline="")
+    from contextlib import nullcontext
+    return nullcontext(file)
+
+
+def _numbered(batches):
+    """Yields every batch with the number of its first row, from 1
+
+    :rtype: Iterator[tuple[int, list | pyarrow.RecordBatch]]
+    """
+    start = 1
+    for batch in batches:
+        yield start, batch
+        start += len(batch)
+
+
+def _map_batches(func, items, workers):
+    """Yields every item with the result of func on its arguments, in order
+
+    With ``workers`` other than 1 the calls run in a pool of processes and
+    at most ``2 * workers`` of them are pending at a time, so items are only
+    taken from the iterator as the results are consumed.
+
+    :param func: module level function to call
+    :type func: Callable
+    :param items: pairs of an item and a tuple of arguments of func
+    :type items: Iterable[tuple[object, tuple]]
+    :param workers: number of processes, None for the CPU count
+    :type workers: int
+    :rtype: Iterator[tuple[object, object]]
+    """
+    if workers == 1:
+        for item, args in items:
+            yield item, func(*args)
+        return
+
+    from multiprocessing import Pool
+
+    workers = workers or os.cpu_count() or 1
+    pending = deque()
+    with Pool(workers) as pool:
+        for item, args in items:
+            if len(pending) >= 2 * workers:
+                done, result = pending.popleft()
+                yield done, result.get()
+            pending.append((item, pool.apply_async(func, args)))
+        while pending:
+            done, result = pending.popleft()
+            yield done, result.get()
+
+
+def _convert_rows(rows, index, out, style, errors, start, fmtparams):
+    """Converts a batch of CSV rows and returns them as CSV text
+
+    Writing the rows is the costliest step of converting a CSV file, so it
+    is done here too, in the worker process when there are several.
+
+    :param rows: rows read by ``csv.reader``
+    :type rows: list[list[str]]
+    :param index: index of the integer column
+    :type index: int
+    :param out: index of the numeral column
+    :type out: int
+    :param style: numeral style, British by default
+    :type style: NumeralStyle
+    :param errors: 'strict' or 'blank', see ``_ERRORS``
+    :type errors: str
+    :param start: row number of the first row, for error messages
+    :type start: int
+    :param fmtparams: formatting parameters of ``csv.writer``
+    :type fmtparams: dict
+    :rtype: str
+    :raises: InvalidNumber, NumberTooLarge
+    """
+    values = [row[index] if index < len(row) else "" for row in rows]
+    for row, numeral in zip(rows, _convert_batch(values, style, errors,
+                                                 start)):
+        if out < len(row):
+            row[out] = numeral
+        else:
+            row += [""] * (out - len(row)) + [numeral]
+
+    text = io.StringIO()
+    csv.writer(text, **fmtparams).writerows(rows)
+    return text.getvalue()
+
+
+def _convert_batch(values, style, errors, start):
+    """Converts a batch of integers, or strings or None holding them
+
+    The whole batch is parsed into a NumPy integer array and converted with
+    ``WordNumeral.to_numerals`` when it can be; otherwise, e.g. for an empty
+    or non-integer value or one beyond 64 bits, value by value.
+
+    :param values: values of the column
+    :type values: list[str | int | None] | numpy.ndarray
+    :param style: numeral style, British by default
+    :type style: NumeralStyle
+    :param errors: 'strict' or 'blank', see ``_ERRORS``
+    :type errors: str
+    :param start: row number of the first value, for error messages
+    :type start: int
+    :return: numerals, None for None and for failed values with 'blank'
+    :rtype: list[str | None]
+    :raises: InvalidNumber, NumberTooLarge
+    """
+    np = _import_numpy()
+    if np is not None:
+        try:
+            arr = values if getattr(values, "dtype", None) is not None and \
+                values.dtype.kind in "iu" else \
+                np.asarray(values, dtype=np.int64)
+        except (TypeError, ValueError, OverflowError):
+            pass
+        else:
+            try:
+                return WordNumeral.to_numerals(arr, style)
+            except NumberTooLarge:
+                pass
+
+    to_numeral = WordNumeral.to_numeral if style is None else \
+        style.to_numeral
+    numerals = []
+    for row, value in enumerate(values, start):
+        if value is None:
+            numerals.append(None)
+            continue
+        try:
+            numerals.append(to_numeral(int(value)))
+        except (TypeError, ValueError):
+            if errors == "strict":
+                raise InvalidNumber(f"row {row}: {value!r} is not an "
+                                    f"integer") from None
+            numerals.append(None)
+        except NumberTooLarge as e:
+            if errors == "strict":
+                raise NumberTooLarge(f"row {row}: {e}") from None
+            numerals.append(None)
+    return numerals
+
+# endregion
+
+
+def _parser():
+    """Builds the command line parser of the bulk subcommand
+
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="num2words bulk",
+        description="Add the English numerals of an integer column to a CSV "
+                    "or Parquet file, a batch of rows at a time")
+    parser.add_argument('input', type=str,
+                        help="CSV or Parquet (.parquet, .pq) file to read; "
+                             "'-' reads CSV from stdin")
+    parser.add_argument('-c', type=str, required=True, dest="column",
+                        help="name of the integer column")
+    parser.add_argument('-o', type=str, default="-", dest="output",
+                        help="file to write, stdout by default (CSV only)")
+    parser.add_argument('--output-column', type=str, default=None,
+                        dest="output_column",
+                        help="name of the numeral column, <column>_words by "
+                             "default; an existing column is replaced")
+    parser.add_argument('--batch-size', type=int, default=_BATCH_SIZE,
+                        dest="batch_size", help="rows converted at a time")
+    parser.add_argument('-j', type=int, default=1, dest="workers",
+                        help="number of worker processes (0 for one per CPU)")
+    parser.add_argument('--errors', choices=_ERRORS, default="strict",
+                        help="stop at a value that is not a valid integer, "
+                             "or leave its numeral blank")
+    parser.add_argument('--delimiter', type=str, default=",",
+                        help="CSV field delimiter")
+    parser.add_argument('--us', action="store_true",
+                        help="US numerals, without 'and'")
+    return parser
+
+
+def main(argv=None):
+    """Runs the bulk subcommand of the command line interface
+
+    :param argv: arguments after 'bulk', defaults to ``sys.argv[2:]``
+    :type argv: list[str]
+    :return: exit status
+    :rtype: int
+    """
+    args = _parser().parse_args(sys.argv[2:] if argv is None else argv)
+    options = dict(output_column=args.output_column,
+                   batch_size=args.batch_size, workers=args.workers or None,
+                   style=NumeralStyle(conjunction=False) if args.us else None,
+                   errors=args.errors)
+
+    try:
+        if args.input.endswith((".parquet", ".pq")):
+            if args.output == "-":
+                sys.stderr.write("error: Parquet output needs a file, "
+                                 "give one with -o\n")
+                return 2
+            convert_parquet(args.input, args.output, args.column, **options)
+            return 0
+
+        infile, outfile = args.input, args.output
+        if infile == "-":
+            infile = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8",
+                                      newline="")
+        if outfile == "-":
+            outfile = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8",
+                                       newline="", write_through=False)
+        try:
+            convert_csv(infile, outfile, args.column,
+                        delimiter=args.delimiter, **options)
+        finally:
+            if args.output == "-":
+                outfile.flush()
+                outfile.detach()
+    except (ImportError, ValueError, OSError, InvalidNumber,
+            NumberTooLarge) as e:
+        sys.stderr.write(f"error: {e}\n")
+        return 1
+    return 0
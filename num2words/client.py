@@ -8,8 +8,33 @@ The input files can contain no more than 1 positive integer value. Multiple
 integers, negative integers, and non-integer numeric values will result in
 the client detecting an invalid number.
 """
-from pathlib import Path
-from num2words import WordNumeral, input_handler, InvalidNumber
+import os
+import sys
+import time
+from collections import namedtuple, deque
+from functools import partial
+from glob import iglob
+from itertools import islice
+from num2words import WordNumeral, NumeralStyle, input_handler, \
+    InvalidNumber, NumberTooLarge, chunked_input_handler
+from num2words.utils import _digit_words, _word_aligned
+
+_CHUNK_SIZE = 1 << 20
+"""int: number of characters read from a file at a time"""
+
+FileResult = namedtuple("FileResult", "path number numeral status error")
+"""namedtuple: outcome of converting a single file
+
+    - ``path`` the path as passed in
+    - ``number`` the integer extracted or None
+    - ``numeral`` its English numeral, 'number invalid' or None on errors
+    - ``status`` one of 'ok', 'invalid', 'missing', 'too large' or 'error'
+    - ``error`` the error message or None
+"""
+
+_STATUS_COUNTERS = {"ok": "numbers", "invalid": "invalid", "missing": "errors",
+                    "too large": "errors", "error": "errors"}
+"""dict: Stats counter of every FileResult status"""
 
 
 class Num2Words:
@@ -20,10 +45,13 @@ class Num2Words:
 
     Once instantiated the object is callable with a file path as input which
     it in turn processes and returns the English numeral value of the int
-    contained within the file.
+    contained within the file. Calls store their inputs and outcome on the
+    object, so a client shared between threads should be used through the
+    non-modifying ``convert`` and ``text_to_numeral`` instead.
     """
     # region Constructor
-    def __init__(self, handler=input_handler):
+    def __init__(self, handler=input_handler, cache=None, keep_contents=False,
+                 chunk_size=_CHUNK_SIZE, stats=None, style=None):
         """
         Constructor for the Num2Words class. It requires a handler function
         which takes 1 str argument and returns 1 int. In case the input string
@@ -32,10 +60,58 @@ class Num2Words:
         exception. If a different exception is raised it will be re-thrown by
         the Num2Words.__call__ function.
 
+        Numerals are rendered through the global ``WordNumeral`` cache if one
+        is enabled, unless a cache is given for this client only. With a
+        ``style`` numerals are rendered in it instead of the default British
+        style; a cache given as well must hold numerals of the same style.
+
+        With the default handler files are streamed ``chunk_size``
+        characters at a time and reading stops as soon as a second number
+        makes the input invalid. A custom handler needs the whole text, so
+        files are read at once. The contents of the last file with a valid
+        number are only kept, in ``file_contents``, if ``keep_contents`` is
+        set, which also means reading files at once.
+
+        Given a ``Stats`` object the client records in it how long reading,
+        extracting and rendering take, and counts files, texts, outcomes and
+        bytes read, for every conversion made in this process. Without one
+        nothing is timed.
+
         :param handler: input handler function
         :type handler: function
+        :param cache: cache to convert numbers through, e.g.
+            ``NumeralCache(maxsize=10000, policy="lfu")``
+        :type cache: NumeralCache
+        :param keep_contents: whether to keep the contents of files read
+        :type keep_contents: bool
+        :param chunk_size: number of characters read from a file at a time
+        :type chunk_size: int
+        :param stats: statistics to record conversions in
+        :type stats: Stats
+        :param style: numeral style, defaults to the style of the cache
+        :type style: NumeralStyle
+        :raises: ValueError
         """
+        if cache is not None and style is not None and \
+                (cache.style or NumeralStyle()) != style:
+            raise ValueError(f"cache holds numerals in {cache.style}, not "
+                             f"{style}")
+        if style is None and cache is not None:
+            style = cache.style
+
         self._handler = handler
+        self._cache = cache
+        self._keep_contents = keep_contents
+        self._chunk_size = chunk_size
+        self._stats = stats
+        self._style = style
+        self._file_path = None
+        self._file_contents = None
+        # workers render without the cache, which stays in this process
+        self._render = (WordNumeral.to_numeral if style is None else
+                        style.to_numeral)
+        self._to_numeral = (self._render if cache is None else
+                            cache.to_numeral)
         self._word_numeral = WordNumeral()
     # endregion
 
@@ -52,22 +128,54 @@ class Num2Words:
         :return: English numeral representation of valid input number
         :rtype: str
         """
-        f = Path(file)
-        assert f.exists(), f"{file} does not exist"
-        assert f.is_file(), f"{file} is not a file"
+        assert os.path.exists(file), f"{file} does not exist"
+        assert os.path.isfile(file), f"{file} is not a file"
 
         self._file_path = file
-        file_contents = f.read_text(encoding="utf-8")
+        if self._stats is not None:
+            return self._call_timed(file)
+
+        try:
+            if self._keep_contents:
+                file_contents = _read_text(file)
+                num = self._handler(file_contents)
+                self._file_contents = file_contents
+            else:
+                num = _read_number(self._handler, file, self._chunk_size)
+        except InvalidNumber:
+            return "number invalid"
+        except Exception:
+            raise
+
+        self._word_numeral = WordNumeral._with_numeral(
+            num, self._to_numeral(num), self._style)
+        return self._word_numeral.numeral
 
+    def _call_timed(self, file):
+        """__call__ recording every stage and outcome in stats"""
+        stats = self._stats
+        stats.add("files")
         try:
-            num = self._handler(file_contents)
-            self._file_contents = file_contents
+            if self._keep_contents:
+                file_contents = _timed(stats, "read", _read_text, file)
+                stats.add("read_bytes", os.path.getsize(file))
+                num = _timed(stats, "extract", self._handler, file_contents)
+                self._file_contents = file_contents
+            else:
+                num = _read_number(self._handler, file, self._chunk_size,
+                                   stats)
+            numeral = _timed(stats, "render", self._to_numeral, num)
         except InvalidNumber:
+            stats.add("invalid")
             return "number invalid"
         except Exception:
+            stats.add("errors")
             raise
 
-        return self._word_numeral(num)
+        stats.add("numbers")
+        self._word_numeral = WordNumeral._with_numeral(num, numeral,
+                                                       self._style)
+        return numeral
     # endregion
 
     # region Properties
@@ -86,17 +194,241 @@ class Num2Words:
     @property
     def word_numeral(self):
         return self._word_numeral.numeral
+
+    @property
+    def stats(self):
+        return self._stats
+
+    @property
+    def style(self):
+        return self._style
     # endregion
 
     # region Methods
+    def convert(self, path):
+        """Converts a single file without modifying the client.
+
+        Unlike calling the client, nothing is stored on the instance: the
+        outcome is returned as an immutable ``FileResult``, with failures as
+        values as in ``process_many``. A client can therefore be shared by
+        any number of threads calling ``convert`` at once, e.g. from a
+        ``ThreadPoolExecutor``; its cache and stats, if any, are thread-safe.
+        ``keep_contents`` does not apply, the contents are never kept.
+
+        :param path: path to input_file
+        :type path: str | os.PathLike
+        :return: the outcome of converting the file
+        :rtype: FileResult
+
+        :example:
+
+        >>> Num2Words().convert("tests/test_inputs/test1.txt")
+        FileResult(path='tests/test_inputs/test1.txt', number=536, ...)
+        """
+        result = _convert_file(self._handler, self._to_numeral, path,
+                               self._chunk_size, self._stats)
+        if self._stats is not None:
+            self._stats.add("files")
+            self._stats.add(_STATUS_COUNTERS[result.status])
+        return result
+
     def text_to_numeral(self, text):
+        if self._stats is not None:
+            return self._text_to_numeral_timed(text)
+
         try:
             num = self._handler(text)
         except InvalidNumber:
             return "number invalid"
         except Exception:
             raise
-        return self._word_numeral.to_numeral(num)
+        return self._to_numeral(num)
+
+    def _text_to_numeral_timed(self, text):
+        """text_to_numeral recording every stage and outcome in stats"""
+        stats = self._stats
+        stats.add("texts")
+        try:
+            num = _timed(stats, "extract", self._handler, text)
+            numeral = _timed(stats, "render", self._to_numeral, num)
+        except InvalidNumber:
+            stats.add("invalid")
+            return "number invalid"
+        except Exception:
+            stats.add("errors")
+            raise
+        stats.add("numbers")
+        return numeral
+
+    def iter_numbers(self, text_or_file):
+        """Finds every valid integer in a document, in a single pass.
+
+        Unlike the handler, which rejects a text holding more than one
+        number, every whitespace separated word made of numeric characters
+        only is converted. Words such as '36%' or '0.25' are skipped, as are
+        numbers too large to convert. Files and streams are read in chunks
+        of ``chunk_size`` characters, so they can be arbitrarily large.
+
+        :param text_or_file: the text itself (str), a path to a file
+            (os.PathLike, e.g. pathlib.Path) or a text file object
+        :type text_or_file: str | os.PathLike | io.TextIOBase
+        :return: character offset, number and numeral of each integer
+        :rtype: Iterator[tuple[int, int, str]]
+
+        :example:
+
+        >>> list(Num2Words().iter_numbers("Take 2 of the 15 boxes."))
+        [(5, 2, 'two'), (14, 15, 'fifteen')]
+        """
+        to_numeral = self._to_numeral
+        for offset, text in _word_aligned(_iter_chunks(text_or_file,
+                                                       self._chunk_size)):
+            for start, word in _digit_words(text):
+                converted = _convert_word(word, to_numeral)
+                if converted is not None:
+                    yield (offset + start,) + converted
+
+    def rewrite(self, text_or_file, out=None):
+        """Replaces every valid integer in a document by its numeral.
+
+        The integers are found as in ``iter_numbers``; the rest of the
+        document is copied unchanged. With ``out`` the document is written
+        piece by piece as it is read, so it can be arbitrarily large.
+
+        :param text_or_file: the text itself (str), a path to a file
+            (os.PathLike, e.g. pathlib.Path) or a text file object
+        :type text_or_file: str | os.PathLike | io.TextIOBase
+        :param out: text file object to write the document to
+        :type out: io.TextIOBase
+        :return: the rewritten document, or None if written to out
+        :rtype: str
+
+        :example:
+
+        >>> Num2Words().rewrite("Take 2 of the 15 boxes.")
+        'Take two of the fifteen boxes.'
+        """
+        pieces = self._rewrite(text_or_file)
+        if out is None:
+            return "".join(pieces)
+
+        for piece in pieces:
+            out.write(piece)
+
+    def _rewrite(self, text_or_file):
+        to_numeral = self._to_numeral
+        for _, text in _word_aligned(_iter_chunks(text_or_file,
+                                                  self._chunk_size)):
+            piece = []
+            end = 0
+            for start, word in _digit_words(text):
+                converted = _convert_word(word, to_numeral)
+                if converted is not None:
+                    piece += [text[end:start], converted[1]]
+                    end = start + len(word)
+            piece.append(text[end:])
+            yield "".join(piece)
+
+    def process_many(self, paths, workers=None, chunksize=64, ordered=True,
+                     manifest=None):
+        """Converts many files over a pool of worker processes.
+
+        Paths are sent to the workers ``chunksize`` at a time and a
+        ``FileResult`` is yielded per file, in input order or as soon as it is
+        ready if ``ordered`` is False. At most ``2 * workers`` chunks are in
+        flight, so paths are only taken as results are consumed and memory
+        stays bounded. Failures are returned as values with their status:
+        'invalid' if the handler raised ``InvalidNumber``, 'missing' if the
+        path is not a file, 'too large' if the number could not be converted
+        and 'error' for anything else, so a bad file never takes a worker
+        down. The instance is not modified.
+
+        The handler must be picklable, i.e. defined at module level, and the
+        workers render in the client's style, through the global
+        ``WordNumeral`` cache of their own process for the default style.
+        With ``workers=1`` the files are converted in this process,
+        through this client's cache and recorded in its stats if any.
+
+        With a ``manifest`` the run is incremental: a file whose size and
+        modification time, or else whose SHA-256 content hash, match its
+        manifest entry is not converted again and its recorded result is
+        returned. Any other file is converted and recorded in the manifest
+        as soon as it is done, so an interrupted run resumes where it
+        stopped when started again with the same manifest.
+
+        :param paths: paths of the files to convert
+        :type paths: Iterable[str]
+        :param workers: number of processes, defaults to the CPU count
+        :type workers: int
+        :param chunksize: number of paths sent to a worker at a time
+        :type chunksize: int
+        :param ordered: whether results keep the order of paths
+        :type ordered: bool
+        :param manifest: manifest, or path to one, of a previous run
+        :type manifest: Manifest | str | os.PathLike
+        :return: one result per path
+        :rtype: Iterator[FileResult]
+        """
+        if manifest is not None:
+            yield from self._process_tracked(paths, workers, chunksize,
+                                             ordered, manifest)
+            return
+
+        if workers == 1:
+            yield from map(self.convert, paths)
+            return
+
+        from multiprocessing import Pool
+
+        workers = workers or os.cpu_count() or 1
+        convert = partial(_convert_file, self._handler, self._render,
+                          chunk_size=self._chunk_size)
+        with Pool(workers) as pool:
+            yield from _imap_bounded(pool, convert, paths, workers,
+                                     chunksize, ordered)
+
+    def _process_tracked(self, paths, workers, chunksize, ordered, manifest):
+        """Incremental process_many, recording changes in the manifest"""
+        from num2words.manifest import Manifest
+
+        if not isinstance(manifest, Manifest):
+            manifest = Manifest(manifest)
+
+        items = ((path, manifest.get(os.fspath(path))) for path in paths)
+        with manifest:
+            if workers == 1:
+                results = (_convert_tracked(self._handler, self._to_numeral,
+                                            item, self._chunk_size)
+                           for item in items)
+                for result, entry in results:
+                    if entry is not None:
+                        manifest.record(os.fspath(result.path), entry)
+                    yield result
+                return
+
+            from multiprocessing import Pool
+
+            workers = workers or os.cpu_count() or 1
+            convert = partial(_convert_tracked, self._handler,
+                              self._render,
+                              chunk_size=self._chunk_size)
+            with Pool(workers) as pool:
+                for result, entry in _imap_bounded(pool, convert, items,
+                                                   workers, chunksize,
+                                                   ordered):
+                    if entry is not None:
+                        manifest.record(os.fspath(result.path), entry)
+                    yield result
+
+    def cache_info(self):
+        """Reports the statistics of the cache numerals are rendered through
+
+        :return: cache statistics or None if no cache is in use
+        :rtype: CacheInfo
+        """
+        if self._cache is None:
+            return WordNumeral.cache_info()
+        return self._cache.cache_info()
     # endregion
 
     # region Display Overrides
@@ -108,8 +440,315 @@ class Num2Words:
         align = len("file_contents") + 2
         txt = [f.format("file path", self.file_path, width=align)]
         txt += [f.format("file_contents",
-                         self.file_contents.replace("\n", " "), width=align)]
+                         (self.file_contents or "").replace("\n", " "),
+                         width=align)]
         txt += [f.format("num", self.num, width=align)]
         txt += [f.format("word_numeral", self.word_numeral, width=align)]
         return "\n".join(txt)
     # endregion
+
+
+def _read_number(handler, path, chunk_size=_CHUNK_SIZE, stats=None):
+    """Extracts the number from a file with handler.
+
+    The default ``input_handler`` is swapped for ``chunked_input_handler``
+    and fed the file ``chunk_size`` characters at a time. Given stats, the
+    time spent opening and reading the file is recorded as the read stage,
+    the rest as the extract stage, along with the bytes read.
+
+    :param handler: input handler function
+    :type handler: function
+    :param path: path to input_file
+    :type path: str | os.PathLike
+    :param chunk_size: number of characters read at a time
+    :type chunk_size: int
+    :param stats: statistics to record the stages in
+    :type stats: Stats
+    :return: the number detected in the file
+    :raise: InvalidNumber
+    """
+    if stats is not None:
+        return _read_number_timed(handler, path, chunk_size, stats)
+
+    if handler is input_handler:
+        with open(path, encoding="utf-8") as f:
+            return chunked_input_handler(iter(partial(f.read, chunk_size), ""))
+    return handler(_read_text(path))
+
+
+def _read_number_timed(handler, path, chunk_size, stats):
+    """_read_number recording its stages in stats"""
+    clock = time.perf_counter
+    start = clock()
+    read_time = 0.0
+
+    def read(size=chunk_size):
+        nonlocal read_time
+        begin = clock()
+        chunk = f.read(size)
+        read_time += clock() - begin
+        return chunk
+
+    with open(path, encoding="utf-8") as f:
+        read_time = clock() - start
+        try:
+            if handler is input_handler:
+                return chunked_input_handler(iter(read, ""))
+            return handler(read(-1))
+        finally:
+            stats.add("read_bytes", f.buffer.tell())
+            stats.observe("read", read_time)
+            stats.observe("extract", clock() - start - read_time)
+
+
+def _timed(stats, stage, func, arg):
+    """Returns func(arg), recording how long it took as stage in stats"""
+    start = time.perf_counter()
+    try:
+        return func(arg)
+    finally:
+        stats.observe(stage, time.perf_counter() - start)
+
+
+def _read_text(path):
+    """Returns the whole contents of a UTF-8 text file
+
+    :param path: path to input_file
+    :type path: str | os.PathLike
+    :rtype: str
+    """
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _iter_chunks(text_or_file, chunk_size=_CHUNK_SIZE):
+    """Yields a document as text chunks, see Num2Words.iter_numbers
+
+    :param text_or_file: text, path to a file or text file object
+    :type text_or_file: str | os.PathLike | io.TextIOBase
+    :param chunk_size: number of characters read at a time
+    :type chunk_size: int
+    :rtype: Iterator[str]
+    """
+    if isinstance(text_or_file, str):
+        yield text_or_file
+    elif isinstance(text_or_file, os.PathLike):
+        with open(text_or_file, encoding="utf-8") as f:
+            yield from iter(partial(f.read, chunk_size), "")
+    else:
+        yield from iter(partial(text_or_file.read, chunk_size), "")
+
+
+def _convert_word(word, to_numeral):
+    """Converts a word made of numeric characters only
+
+    :param word: word containing a digit
+    :type word: str
+    :param to_numeral: function rendering an int to its English numeral
+    :type to_numeral: function
+    :return: number and numeral or None if the word is not a valid integer
+    :rtype: tuple[int, str]
+    """
+    if not word.isnumeric():
+        return None
+
+    try:
+        num = int(word)
+        return num, to_numeral(num)
+    except (ValueError, NumberTooLarge):
+        return None
+
+
+def _convert_file(handler, to_numeral, path, chunk_size=_CHUNK_SIZE,
+                  stats=None):
+    """Converts a single file without raising, see Num2Words.process_many
+
+    :param handler: input handler function
+    :type handler: function
+    :param to_numeral: function rendering an int to its English numeral
+    :type to_numeral: function
+    :param path: path to input_file
+    :type path: str
+    :param chunk_size: number of characters read at a time
+    :type chunk_size: int
+    :param stats: statistics to record the stages in
+    :type stats: Stats
+    :rtype: FileResult
+    """
+    num = None
+    try:
+        if not os.path.isfile(path):
+            return FileResult(path, None, None, "missing",
+                              f"{path} is not a file")
+        num = _read_number(handler, path, chunk_size, stats)
+        numeral = (to_numeral(num) if stats is None else
+                   _timed(stats, "render", to_numeral, num))
+        return FileResult(path, num, numeral, "ok", None)
+    except InvalidNumber as e:
+        return FileResult(path, None, "number invalid", "invalid", str(e))
+    except NumberTooLarge as e:
+        return FileResult(path, num, None, "too large", str(e))
+    except Exception as e:
+        return FileResult(path, num, None, "error",
+                          f"{type(e).__name__}: {e}")
+
+
+def _convert_tracked(handler, to_numeral, item, chunk_size=_CHUNK_SIZE):
+    """Converts a file unless it matches its manifest entry
+
+    The file is stat'ed before it is read so a change made while it is
+    being converted shows up in the next run.
+
+    :param handler: input handler function
+    :type handler: function
+    :param to_numeral: function rendering an int to its English numeral
+    :type to_numeral: function
+    :param item: path to input_file and its manifest entry or None
+    :type item: tuple[str, ManifestEntry]
+    :param chunk_size: number of characters read at a time
+    :type chunk_size: int
+    :return: the result and the entry to record, None if unchanged
+    :rtype: tuple[FileResult, ManifestEntry]
+    """
+    from num2words.manifest import ManifestEntry, file_digest
+
+    path, entry = item
+    try:
+        stat = os.stat(path)
+        if entry is not None and (entry.size, entry.mtime_ns) == \
+                (stat.st_size, stat.st_mtime_ns):
+            return _recorded_result(path, entry, to_numeral), None
+        digest = file_digest(path)
+    except OSError:
+        return _convert_file(handler, to_numeral, path, chunk_size), None
+
+    if entry is not None and entry.sha256 == digest:
+        result = _recorded_result(path, entry, to_numeral)
+    else:
+        result = _convert_file(handler, to_numeral, path, chunk_size)
+    return result, ManifestEntry(stat.st_size, stat.st_mtime_ns, digest,
+                                 result.number, result.status, result.error)
+
+
+def _recorded_result(path, entry, to_numeral):
+    """Rebuilds the FileResult of a manifest entry
+
+    :param path: path to input_file
+    :type path: str
+    :param entry: manifest entry of the file
+    :type entry: ManifestEntry
+    :param to_numeral: function rendering an int to its English numeral
+    :type to_numeral: function
+    :rtype: FileResult
+    """
+    if entry.status == "ok":
+        numeral = to_numeral(entry.number)
+    elif entry.status == "invalid":
+        numeral = "number invalid"
+    else:
+        numeral = None
+    return FileResult(path, entry.number, numeral, entry.status, entry.error)
+
+
+def _imap_bounded(pool, func, iterable, workers, chunksize, ordered):
+    """Works as Pool.imap, or imap_unordered, in bounded memory
+
+    The task feeder of ``Pool.imap`` takes every item of the iterable as
+    fast as it can and finished results pile up until they are consumed.
+    Here items are sent ``chunksize`` at a time with ``apply_async`` and at
+    most ``2 * workers`` chunks are pending, so items are only taken from
+    the iterable as results are consumed.
+
+    :param pool: pool of worker processes
+    :type pool: multiprocessing.pool.Pool
+    :param func: picklable function to call on every item
+    :type func: Callable
+    :param iterable: items to call func on
+    :type iterable: Iterable
+    :param workers: number of processes of the pool
+    :type workers: int
+    :param chunksize: number of items sent to a worker at a time
+    :type chunksize: int
+    :param ordered: whether results keep the order of the items
+    :type ordered: bool
+    :return: result of func on every item
+    :rtype: Iterator
+    """
+    iterable = iter(iterable)
+    chunks = iter(lambda: list(islice(iterable, chunksize)), [])
+    convert = partial(_map_chunk, func)
+
+    if ordered:
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().get()
+            pending.append(pool.apply_async(convert, (chunk,)))
+        while pending:
+            yield from pending.popleft().get()
+        return
+
+    from queue import SimpleQueue
+
+    done = SimpleQueue()
+    pending = 0
+    for chunk in chunks:
+        if pending >= 2 * workers:
+            yield from _ready_chunk(done)
+            pending -= 1
+        pool.apply_async(convert, (chunk,), callback=done.put,
+                         error_callback=done.put)
+        pending += 1
+    for _ in range(pending):
+        yield from _ready_chunk(done)
+
+
+def _map_chunk(func, chunk):
+    """Returns the results of func on every item of a chunk
+
+    :rtype: list
+    """
+    return [func(item) for item in chunk]
+
+
+def _ready_chunk(done):
+    """Waits for the results of the next chunk done, raising its error
+
+    :param done: queue of result lists and exceptions
+    :type done: queue.SimpleQueue
+    :rtype: list
+    """
+    results = done.get()
+    if isinstance(results, BaseException):
+        raise results
+    return results
+
+
+def iter_paths(sources):
+    """Lazily expands a mix of file paths, directories and glob patterns.
+
+    Directories are walked recursively, yielding their files in sorted order
+    one directory at a time. Sources containing any of ``*?[`` are expanded
+    as (recursive) glob patterns. A source of ``-`` yields every non-empty
+    line read from stdin, each expanded in turn. Anything else is yielded as
+    is, so a missing file is left for the caller to report.
+
+    :param sources: file paths, directories, glob patterns or '-'
+    :type sources: Iterable[str]
+    :return: file paths
+    :rtype: Iterator[str]
+    """
+    for source in sources:
+        if source == "-":
+            yield from iter_paths(line.rstrip("\r\n") for line in sys.stdin
+                                  if line.strip())
+        elif os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    yield os.path.join(root, name)
+        elif any(c in source for c in "*?["):
+            yield from (p for p in iglob(source, recursive=True)
+                        if os.path.isfile(p))
+        else:
+            yield source
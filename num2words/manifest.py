@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+The module contains a Manifest class recording, on disk, the outcome of
+converting files together with their size, modification time and content
+hash. It lets a client skip the files that did not change since the last run
+and resume a run that was interrupted.
+"""
+import hashlib
+import json
+import os
+from collections import namedtuple
+
+ManifestEntry = namedtuple("ManifestEntry",
+                           "size mtime_ns sha256 number status error")
+"""namedtuple: what the manifest knows about a file
+
+    - ``size`` and ``mtime_ns`` as returned by ``os.stat``
+    - ``sha256`` digest of the contents of the file (bytes)
+    - ``number``, ``status`` and ``error`` of its ``FileResult``
+"""
+
+
+class Manifest:
+    """
+    This is a manifest of converted files kept in a JSON lines file.
+
+    Every file converted is appended as one line, and flushed, as soon as
+    it is done, so a run stopped half way leaves a valid manifest behind and
+    the next run carries on from where it stopped. When a file is recorded
+    more than once the last line wins; ``compact`` rewrites the file with a
+    single line per path.
+
+    Numerals are not stored; they are rendered again from the number.
+    """
+    # region Constructor
+    def __init__(self, path):
+        """Initialise a Manifest object, loading the entries of path if any
+
+        Lines that cannot be parsed, e.g. the last one of an interrupted
+        run, are ignored.
+
+        :param path: path of the JSON lines file
+        :type path: str | os.PathLike
+        """
+        self._path = path
+        self._entries = {}
+        self._file = None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        self._entries[record["path"]] = ManifestEntry(
+                            record["size"], record["mtime_ns"],
+                            bytes.fromhex(record["sha256"]),
+                            record["number"], record["status"],
+                            record["error"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+    # endregion
+
+    # region Properties
+    @property
+    def path(self):
+        return self._path
+    # endregion
+
+    # region Methods
+    def get(self, path):
+        """Returns the entry for path or None
+
+        :param path: path of a converted file, as it was recorded
+        :type path: str
+        :rtype: ManifestEntry
+        """
+        return self._entries.get(path)
+
+    def record(self, path, entry):
+        """Stores the entry for path and appends it to the manifest file
+
+        :param path: path of a converted file
+        :type path: str
+        :param entry: what is known about the file
+        :type entry: ManifestEntry
+        """
+        if self._file is None:
+            self._file = open(self._path, "a", encoding="utf-8")
+
+        self._entries[path] = entry
+        self._file.write(json.dumps({
+            "path": path, "size": entry.size, "mtime_ns": entry.mtime_ns,
+            "sha256": entry.sha256.hex(), "number": entry.number,
+            "status": entry.status, "error": entry.error
+        }) + "\n")
+        self._file.flush()
+
+    def compact(self):
+        """Rewrites the manifest file with the latest entry of every path
+
+        The new file is written next to the old one and swapped in, so the
+        manifest is never left half written.
+        """
+        self.close()
+        temp = f"{self._path}.tmp"
+        entries, self._entries = self._entries, {}
+        try:
+            self._path, path = temp, self._path
+            for key, entry in entries.items():
+                self.record(key, entry)
+            self.close()
+            os.replace(temp, path)
+        finally:
+            self._path = path
+            self._entries = entries
+
+    def close(self):
+        """Closes the manifest file if it was opened for writing"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self._entries)
+    # endregion
+
+    # region Display Overrides
+    def __repr__(self):
+        return f"Manifest({self._path!r})"
+    # endregion
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """Returns the SHA-256 digest of the contents of a file
+
+    :param path: path of the file
+    :type path: str | os.PathLike
+    :param chunk_size: number of bytes read at a time
+    :type chunk_size: int
+    :rtype: bytes
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.digest()
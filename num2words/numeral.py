@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 """
-This module contains a Numeral class to encapsulate a positive integer and
-provide representation for it in plain English numeral form.
+This module contains a Numeral class to encapsulate an integer and provide
+representation for it in plain English numeral form, along with decimal and
+currency amounts.
 """
 
-from num2words import NumberTooLarge
+from array import array
+from collections import OrderedDict, namedtuple
+from itertools import chain
+from threading import Lock
+from num2words import NumberTooLarge, InvalidNumeral
 
 # region Module Variables
 
@@ -95,6 +100,52 @@ _SIG_UNITS = {
 }
 """dict: significance units when dividing a number by 1000, e.g. thousand"""
 
+_MAX_SIG = max(_SIG_UNITS.keys())
+"""int: highest significance level named in _SIG_UNITS"""
+
+_MAX_DIGITS = 153
+"""int: most digits a number can have, see WordNumeral.set_max_digits"""
+
+_MAX_NUM = 10 ** _MAX_DIGITS
+"""int: smallest number too large to be converted"""
+
+_SCALES = [f" {_SIG_UNITS[sig]}" if sig else "" for sig in range(_MAX_SIG + 1)]
+"""list: significance numerals with a leading space, indexed by level; grown
+by _extend_scales as larger numbers are converted"""
+
+_SCALES_LOCK = Lock()
+"""Lock: serialises growing _SCALES"""
+
+_CW_SMALL = ("n", "m", "b", "tr", "quadr", "quint", "sext", "sept", "oct",
+             "non")
+"""tuple: Conway-Wechsler stems of the first 9 -illions, and of none"""
+
+_CW_UNITS = ("", "un", "duo", "tre", "quattuor", "quinqua", "se", "septe",
+             "octo", "nove")
+"""tuple: Conway-Wechsler unit prefixes"""
+
+_CW_TENS = (("", ""), ("deci", "n"), ("viginti", "ms"), ("triginta", "ns"),
+            ("quadraginta", "ns"), ("quinquaginta", "ns"), ("sexaginta", "n"),
+            ("septuaginta", "n"), ("octoginta", "mx"), ("nonaginta", ""))
+"""tuple: Conway-Wechsler tens prefixes and the letters they add to a unit"""
+
+_CW_HUNDREDS = (("", ""), ("centi", "nx"), ("ducenti", "n"),
+                ("trecenti", "ns"), ("quadringenti", "ns"),
+                ("quingenti", "ns"), ("sescenti", "n"), ("septingenti", "n"),
+                ("octingenti", "mx"), ("nongenti", ""))
+"""tuple: Conway-Wechsler hundreds prefixes and the letters they add to a
+unit"""
+
+_DIGIT_WORDS = {str(d): _SMALL_NUMS[d] if d else "zero" for d in range(10)}
+"""dict: numerals for the digits of a fraction, by digit character"""
+
+_CURRENCIES = {
+    "GBP": ("pound", "pounds", "penny", "pence"),
+    "USD": ("dollar", "dollars", "cent", "cents"),
+    "EUR": ("euro", "euros", "cent", "cents"),
+}
+"""dict: singular and plural names of the unit and hundredth of a currency"""
+
 # endregion
 
 
@@ -102,7 +153,7 @@ class WordNumeral:
     """This is a class for english numerals.
 
     It can be used to get a given integer's representation in plain English.
-    The constructor requires a single positive integer value argument and
+    The constructor requires a single integer value argument and
     returns an object with two read-only attributes
         - ``num`` representing the value passed in
         - ``numeral`` which is the English numeral equivalent of the number
@@ -115,24 +166,38 @@ class WordNumeral:
     numeral representation.
     """
     # region Constructor
+    __slots__ = ("_num", "_numeral", "_style")
+
+    _cache = None
+    """NumeralCache: global cache used by ``to_numeral`` if enabled"""
+
     # TODO consider inheriting from int instead; will simplify the API as we
-    #   won't have to override all of the basic operators
-    def __init__(self, num=0):
+    #   won't have to override all of the basic operators. Note that int
+    #   subclasses cannot declare __slots__ so every object would carry a
+    #   __dict__ again
+    def __init__(self, num=0, style=None):
         """Initialise a Numeral object
 
-        :param num: positive number to be represented as a numeral
+        The number is validated straight away but its numeral is only
+        computed the first time ``numeral`` is read, and then kept.
+
+        :param num: number to be represented as a numeral
         :type num: int
+        :param style: numeral style, British by default, see NumeralStyle
+        :type style: NumeralStyle
         :return: An object of type Numeral representing the num input
         :rtype: Numeral
+        :raises: TypeError, ValueError, NumberTooLarge
         """
-        self._num = num
-        self._numeral = self.to_numeral(num)
+        self._num = self._validate(num)
+        self._numeral = None
+        self._style = style
     # endregion
 
     # region Caller
     def __call__(self, num):
-        self._num = num
-        self._numeral = self.to_numeral(num)
+        self._num = self._validate(num)
+        self._numeral = None
         return self.numeral
     # endregion
 
@@ -143,40 +208,708 @@ class WordNumeral:
 
     @property
     def numeral(self):
+        if self._numeral is None:
+            self._numeral = self.to_numeral(self._num, self._style)
         return self._numeral
+
+    @property
+    def style(self):
+        return self._style
     # endregion
 
     # region Class Methods
     @classmethod
-    def to_numeral(cls, num):
-        """Class method which translates a positive integer to English numeral.
+    def to_numeral(cls, num, style=None):
+        """Class method which translates an integer to English numeral.
 
-        It parses the number recursively ascending the value at 10^3 increments.
-        The num argument is split into a quotient and remainder with divisor
-        equal to 1000. The quotient is passed onto the recursive call along
-        with an incremented significance level. The remainder gets parsed and
-        appended and its significance numeral appended to it.
+        The number is split into groups of 3 digits (thousands, millions,
+        etc.) without recursion, see ``_split_groups``. Each non-zero group
+        is looked up in the precomputed ``_GROUPS`` table and suffixed with
+        its significance numeral (see ``_scale_name``); the least significant
+        group is looked up in ``_TAILS`` which already carries its leading
+        "and" or comma separator. The output is identical to the recursive
+        ``_parse_large`` which is kept as the reference implementation. A
+        negative number is read as 'minus' and the numeral of its absolute
+        value. When a cache has been switched on with ``enable_cache`` the
+        numeral is looked up there first. A ``style`` renders from its own
+        tables, bypassing the global cache, which only holds numerals of the
+        default style.
 
-        :param num: positive integer to be converted to an English numeral
+        :param num: integer to be converted to an English numeral
         :type num: int
+        :param style: numeral style, British by default, see NumeralStyle
+        :type style: NumeralStyle
         :return: English numeral representation of the number
         :rtype: str
+        :raises: TypeError, ValueError, NumberTooLarge
 
         :example:
 
         >>> WordNumeral.to_numeral(1400)
-        'one thousand four hundred'
+        'one thousand, four hundred'
 
         >>> WordNumeral.to_numeral(15025)
         'fifteen thousand and twenty five'
 
-        >>> WordNumeral.to_numeral(337)
-        'three hundred and thirty seven'
+        >>> WordNumeral.to_numeral(-337)
+        'minus three hundred and thirty seven'
 
         >>> WordNumeral.to_numeral(563202086)
-        'five hundred and sixty three million two hundred and two thousand and eighty six'
+        'five hundred and sixty three million, two hundred and two thousand and eighty six'
+        """
+        if style is not None:
+            return style.to_numeral(num)
+        if cls._cache is not None:
+            return cls._cache.to_numeral(num)
+        return cls._render(num)
+
+    @classmethod
+    def _validate(cls, num):
+        """Helper class method which checks num can be converted
+
+        :param num: integer to be converted to an English numeral
+        :type num: int
+        :return: num
+        :rtype: int
+        :raises: TypeError, ValueError, NumberTooLarge
+        """
+        if not isinstance(num, int):
+            raise TypeError(f"'num' must be int, not {type(num)}")
+
+        if not -_MAX_NUM < num < _MAX_NUM:
+            raise _too_large()
+
+        return num
+
+    @classmethod
+    def _render(cls, num):
+        """Helper class method which converts a number bypassing any cache
+
+        :param num: integer to be converted to an English numeral
+        :type num: int
+        :return: English numeral representation of the number
+        :rtype: str
+        :raises: TypeError, ValueError, NumberTooLarge
         """
-        return " ".join(cls._parse_large(num, 0))
+        if not isinstance(num, int):
+            raise TypeError(f"'num' must be int, not {type(num)}")
+
+        if num < 0:
+            return "minus " + cls._render(-num)
+
+        if num >= _MAX_NUM:
+            raise _too_large()
+
+        if num < 1000:
+            return _GROUPS[num] if num else "zero"
+
+        if num < 1000000:
+            lrg, rem = divmod(num, 1000)
+            return _GROUPS[lrg] + _SCALES[1] + _TAILS[rem]
+
+        groups = _split_groups(num)
+        top = len(groups) - 1
+        if top >= len(_SCALES):
+            _extend_scales(top)
+        numeral = [_GROUPS[g] + _SCALES[top - i]
+                   for i, g in enumerate(groups) if g and i < top]
+        return ", ".join(numeral) + _TAILS[groups[-1]]
+
+    @classmethod
+    def iter_words(cls, num, style=None):
+        """Class method which translates an integer piece by piece.
+
+        Yields the numeral of ``to_numeral`` one 3-digit group at a time,
+        most significant first, each piece with its significance numeral and
+        the separator before it, so that ``"".join`` of the pieces is the
+        numeral. The groups of a huge number are read from its digits as
+        they are needed, so neither a list of words nor the whole numeral is
+        ever held in memory, see ``write_numeral``.
+
+        :param num: integer to be converted to an English numeral
+        :type num: int
+        :param style: numeral style, British by default, see NumeralStyle
+        :type style: NumeralStyle
+        :return: consecutive pieces of the English numeral
+        :rtype: Iterator[str]
+        :raises: TypeError, NumberTooLarge
+
+        :example:
+
+        >>> list(WordNumeral.iter_words(-2001006))
+        ['minus ', 'two million', ', one thousand', ' and six']
+        """
+        num = cls._validate(num)
+        if style is None:
+            return _iter_words(num, _GROUPS, _TAILS, ", ")
+        return _iter_words(num, style._groups, style._tails, style._separator)
+
+    @classmethod
+    def write_numeral(cls, num, fileobj, style=None, buffer_size=1 << 16):
+        """Class method which writes the numeral of an integer to a stream.
+
+        The pieces of ``iter_words`` are gathered into writes of about
+        ``buffer_size`` characters, so memory use stays bounded by the
+        buffer and the digits of the number, however long the numeral.
+
+        :param num: integer to be converted to an English numeral
+        :type num: int
+        :param fileobj: text stream to write the numeral to
+        :type fileobj: io.TextIOBase
+        :param style: numeral style, British by default, see NumeralStyle
+        :type style: NumeralStyle
+        :param buffer_size: characters gathered before every write
+        :type buffer_size: int
+        :return: number of characters written
+        :rtype: int
+        :raises: TypeError, NumberTooLarge
+        """
+        written = size = 0
+        pieces = []
+        for piece in cls.iter_words(num, style):
+            pieces.append(piece)
+            size += len(piece)
+            if size >= buffer_size:
+                fileobj.write("".join(pieces))
+                written += size
+                pieces.clear()
+                size = 0
+        if pieces:
+            fileobj.write("".join(pieces))
+        return written + size
+
+    @classmethod
+    def _with_numeral(cls, num, numeral, style=None):
+        """Helper class method which builds an object from a known numeral
+
+        :param num: positive number to be represented as a numeral
+        :type num: int
+        :param numeral: English numeral already rendered for num
+        :type numeral: str
+        :param style: style numeral was rendered in
+        :type style: NumeralStyle
+        :rtype: WordNumeral
+        """
+        obj = cls.__new__(cls)
+        obj._num = num
+        obj._numeral = numeral
+        obj._style = style
+        return obj
+
+    @classmethod
+    def set_max_digits(cls, digits=153):
+        """Class method which sets how many digits a number can have.
+
+        Larger numbers raise NumberTooLarge wherever they are converted.
+        The default of 153 digits covers the significance numerals of
+        ``_SIG_UNITS``; past them the numerals are generated with the
+        Conway-Wechsler system as they are needed, see ``_scale_name``.
+        Conversion time grows a little faster than the number of digits, so
+        the limit bounds the work a single untrusted number can cause.
+
+        :param digits: largest number of digits, not counting a sign
+        :type digits: int
+        :return: the previous limit
+        :rtype: int
+        :raises: ValueError
+
+        :example:
+
+        >>> WordNumeral.set_max_digits(3003)
+        153
+        >>> WordNumeral.to_numeral(10**3000)
+        'one novenonagintanongentillion'
+        """
+        global _MAX_DIGITS, _MAX_NUM
+        if not isinstance(digits, int) or digits < 1:
+            raise ValueError(f"digits must be a positive int, not {digits}")
+
+        previous = _MAX_DIGITS
+        _MAX_DIGITS, _MAX_NUM = digits, 10 ** digits
+        return previous
+
+    @classmethod
+    def enable_cache(cls, maxsize=4096, policy="lru"):
+        """Class method which caches the results of ``to_numeral`` globally.
+
+        Replaces any cache enabled before.
+
+        :param maxsize: maximum number of numerals to keep
+        :type maxsize: int
+        :param policy: eviction policy, either 'lru' or 'lfu'
+        :type policy: str
+        :return: the new cache
+        :rtype: NumeralCache
+        """
+        cls._cache = NumeralCache(maxsize, policy)
+        return cls._cache
+
+    @classmethod
+    def disable_cache(cls):
+        """Class method which switches the global ``to_numeral`` cache off"""
+        cls._cache = None
+
+    @classmethod
+    def cache_info(cls):
+        """Class method which reports the statistics of the global cache
+
+        :return: cache statistics or None if the cache is disabled
+        :rtype: CacheInfo
+        """
+        return None if cls._cache is None else cls._cache.cache_info()
+
+    @classmethod
+    def to_numerals(cls, nums, style=None):
+        """Class method which translates a batch of integers.
+
+        Integer NumPy arrays (or anything exposing ``__array__``, e.g. a
+        pandas Series) and ``array.array`` buffers are split into 3-digit
+        groups column-wise with NumPy and the numerals are assembled from
+        the group tables, those of ``style`` if given, without a Python
+        call per element. Any other iterable, or any input when NumPy is
+        not installed, is converted one ``to_numeral`` call at a time.
+
+        :param nums: integers to be converted to English numerals
+        :type nums: Iterable[int] | array.array | numpy.ndarray
+        :param style: numeral style, British by default, see NumeralStyle
+        :type style: NumeralStyle
+        :return: English numeral representations in input order
+        :rtype: list[str]
+        :raises: TypeError, ValueError, NumberTooLarge
+
+        :example:
+
+        >>> WordNumeral.to_numerals([7, 1006])
+        ['seven', 'one thousand and six']
+        """
+        np = _import_numpy()
+
+        if np is not None and (isinstance(nums, array) or
+                               hasattr(nums, "__array__")):
+            arr = np.asarray(nums)
+            if arr.dtype.kind in "iu":
+                return cls._parse_batch(np, arr.ravel(), style)
+
+        to_numeral = cls.to_numeral if style is None else style.to_numeral
+        return [to_numeral(num) for num in nums]
+
+    @classmethod
+    def range(cls, start, stop=None, step=1):
+        """Class method which translates a range of integers.
+
+        Takes the same arguments as the built-in ``range``. Consecutive
+        numbers usually only differ in their least significant 3-digit
+        groups, so the numeral of the groups above them is kept between
+        numbers and only the groups that changed are rendered again. The
+        last group is appended from ``_TAILS``. The negative numbers of a
+        range are converted as the range of their absolute values, after
+        'minus'.
+
+        :param start: first number, or the stop if it is the only argument
+        :type start: int
+        :param stop: number at which the range stops, excluded
+        :type stop: int
+        :param step: difference between consecutive numbers
+        :type step: int
+        :return: English numeral representations in range order
+        :rtype: Iterator[str]
+        :raises: TypeError, ValueError, NumberTooLarge
+
+        :example:
+
+        >>> list(WordNumeral.range(999, 1002))
+        ['nine hundred and ninety nine', 'one thousand',
+         'one thousand and one']
+        """
+        nums = range(start) if stop is None else range(start, stop, step)
+        if not nums:
+            return iter(())
+
+        high = max(abs(nums[0]), abs(nums[-1]))
+        if high >= _MAX_NUM:
+            raise _too_large()
+        _extend_scales(len(_split_groups(high)) - 1)
+
+        if nums.step > 0:
+            split = len(range(nums.start, min(nums.stop, 0), nums.step))
+            negative, positive = nums[:split], nums[split:]
+        else:
+            split = len(range(nums.start, max(nums.stop, -1), nums.step))
+            positive, negative = nums[:split], nums[split:]
+        if not negative:
+            return cls._iter_range(positive)
+
+        negated = range(-negative.start, -negative.stop, -negative.step)
+        minus = ("minus " + numeral for numeral in cls._iter_range(negated))
+        return chain(minus, cls._iter_range(positive)) if nums.step > 0 \
+            else chain(cls._iter_range(positive), minus)
+
+    @classmethod
+    def _iter_range(cls, nums):
+        """Helper class method which converts a validated range, see range
+
+        ``words[k]`` holds the numeral of ``keys[k]``, the number above the
+        ``k + 1`` least significant groups of the last number converted, times
+        its significance. For every number the levels are compared from the
+        bottom up until one is unchanged, and only the levels below it are
+        rendered again, each appending its group to the one above.
+
+        :param nums: range of positive integers, possibly empty
+        :type nums: range
+        :rtype: Iterator[str]
+        """
+        levels = len(_split_groups(max(nums[0], nums[-1]))) + 1 if nums else 1
+        keys = [None] * levels
+        words = [""] * levels
+        changed = []
+        for num in nums:
+            high, low = divmod(num, 1000)
+            if keys[0] != high:
+                level = 0
+                while high and keys[level] != high:
+                    changed.append(high)
+                    high //= 1000
+                    level += 1
+                upper = words[level] if high else ""
+                while changed:
+                    level -= 1
+                    high = changed.pop()
+                    grp = high % 1000
+                    if grp:
+                        grp = _GROUPS[grp] + _SCALES[level + 1]
+                        upper = f"{upper}, {grp}" if upper else grp
+                    keys[level] = high
+                    words[level] = upper
+                # nothing was rendered if num went down below 1000
+                keys[0] = num // 1000
+                words[0] = upper
+
+            if words[0]:
+                yield words[0] + _TAILS[low]
+            else:
+                yield _GROUPS[low] if low else "zero"
+
+    @classmethod
+    def to_decimal(cls, value, places=None, style=None):
+        """Class method which translates a decimal number to English numeral.
+
+        The whole part is converted by ``to_numeral`` and the digits of the
+        fraction are read out one by one after 'point'. ``places`` fixes the
+        number of digits of the fraction, rounding half up; by default a
+        ``Decimal`` keeps its own and a ``float`` those of its shortest
+        ``repr``. A float is rounded to ``places`` in floating point, e.g.
+        1.005 has 100.49999... hundredths, so pass a ``Decimal`` to round
+        amounts exactly as they are written. Like the whole part, the
+        fraction can have at most 153 digits, see ``set_max_digits``.
+
+        :param value: number to be converted to an English numeral
+        :type value: int | float | decimal.Decimal
+        :param places: number of digits after the decimal point
+        :type places: int
+        :param style: numeral style, British by default, see NumeralStyle
+        :type style: NumeralStyle
+        :return: English numeral representation of the number
+        :rtype: str
+        :raises: TypeError, ValueError, NumberTooLarge
+
+        :example:
+
+        >>> WordNumeral.to_decimal(Decimal("-3.05"))
+        'minus three point zero five'
+
+        >>> WordNumeral.to_decimal(2.5, places=2)
+        'two point five zero'
+        """
+        negative, units, places = _fixed_point(value, places)
+        whole, fraction = divmod(units, 10 ** places)
+        numeral = cls.to_numeral(whole, style)
+        if places:
+            numeral += " point " + " ".join(map(_DIGIT_WORDS.__getitem__,
+                                                f"{fraction:0{places}d}"))
+        return "minus " + numeral if negative else numeral
+
+    @classmethod
+    def to_currency(cls, amount, currency="GBP", style=None):
+        """Class method which translates an amount of money to English words.
+
+        The amount is rounded half up to a whole number of hundredths (see
+        ``to_decimal`` for floats), then its units and hundredths are named
+        in the singular or plural and joined with 'and'. Either part is left
+        out when it is zero, unless both are.
+
+        :param amount: amount of money to be converted
+        :type amount: int | float | decimal.Decimal
+        :param currency: code of a currency in ``_CURRENCIES``, or the names
+            of its unit and hundredth as (singular, plural, singular, plural)
+        :type currency: str | tuple[str]
+        :param style: numeral style, British by default, see NumeralStyle
+        :type style: NumeralStyle
+        :return: the amount in English words
+        :rtype: str
+        :raises: TypeError, ValueError, NumberTooLarge
+
+        :example:
+
+        >>> WordNumeral.to_currency(Decimal("120.05"))
+        'one hundred and twenty pounds and five pence'
+
+        >>> WordNumeral.to_currency(-1.01, "USD")
+        'minus one dollar and one cent'
+        """
+        names = _currency_names(currency)
+        negative, units, _ = _fixed_point(amount, 2)
+        major, minor = divmod(units, 100)
+        groups = _GROUPS if style is None else style._groups
+        return _currency_numeral(negative, major, minor,
+                                 cls.to_numeral(major, style), groups, names)
+
+    @classmethod
+    def to_currencies(cls, amounts, currency="GBP", style=None):
+        """Class method which translates a batch of amounts of money.
+
+        Integer and float NumPy arrays (or anything exposing ``__array__``)
+        and ``array.array`` buffers are rounded to hundredths and split into
+        units and hundredths column-wise, and the units are converted with
+        ``to_numerals``, so the only Python step per amount is joining its
+        words. Floats are rounded half up in floating point, as in
+        ``to_currency``. Any other iterable, or any input when NumPy is not
+        installed, is converted one ``to_currency`` call at a time.
+
+        :param amounts: amounts of money to be converted
+        :type amounts: Iterable[int | float | decimal.Decimal] |
+            array.array | numpy.ndarray
+        :param currency: currency code or names, see ``to_currency``
+        :type currency: str | tuple[str]
+        :param style: numeral style, British by default, see NumeralStyle
+        :type style: NumeralStyle
+        :return: the amounts in English words in input order
+        :rtype: list[str]
+        :raises: TypeError, ValueError, NumberTooLarge
+
+        :example:
+
+        >>> WordNumeral.to_currencies([5, 0.99])
+        ['five pounds', 'ninety nine pence']
+        """
+        names = _currency_names(currency)
+        np = _import_numpy()
+
+        if np is not None and (isinstance(amounts, array) or
+                               hasattr(amounts, "__array__")):
+            arr = np.asarray(amounts).ravel()
+            if arr.dtype.kind == "f":
+                arr = arr.astype(np.float64)
+                if not np.isfinite(arr).all():
+                    raise ValueError("amounts must be finite numbers")
+                units = np.floor(np.abs(arr) * 100 + 0.5)
+                if units.size and units.max() >= 2 ** 63:
+                    amounts = arr.tolist()
+                else:
+                    major, minor = np.divmod(units.astype(np.int64), 100)
+                    return cls._currency_batch(np, arr < 0, major, minor,
+                                               names, style)
+            elif arr.dtype.kind in "iu":
+                major = _numpy_abs(np, arr) if arr.dtype.kind == "i" else \
+                    arr.astype(np.uint64)
+                return cls._currency_batch(np, arr < 0, major,
+                                           np.zeros(arr.shape, np.int64),
+                                           names, style)
+
+        to_currency = cls.to_currency
+        return [to_currency(amount, names, style) for amount in amounts]
+
+    @classmethod
+    def _currency_batch(cls, np, negative, major, minor, names, style):
+        """Helper class method which names split amounts, see to_currencies
+
+        :param np: the numpy module
+        :type np: module
+        :param negative: whether every amount is negative
+        :type negative: numpy.ndarray
+        :param major: units of every amount
+        :type major: numpy.ndarray
+        :param minor: hundredths of every amount
+        :type minor: numpy.ndarray
+        :param names: names of the unit and hundredth, see ``_CURRENCIES``
+        :type names: tuple[str]
+        :param style: numeral style, British by default
+        :type style: NumeralStyle
+        :rtype: list[str]
+        """
+        groups = _GROUPS if style is None else style._groups
+        words = cls._parse_batch(np, major, style)
+        negative &= (major != 0) | (minor != 0)
+        return [_currency_numeral(sign, units, cents, numeral, groups, names)
+                for sign, units, cents, numeral in
+                zip(negative.tolist(), major.tolist(), minor.tolist(), words)]
+
+    @classmethod
+    def _parse_batch(cls, np, arr, style=None):
+        """Helper class method which converts a NumPy integer array
+
+        The array is divided by 1000 once per significance level present in
+        its largest value. Every level is turned into words by indexing a
+        table of group numerals, with and without a leading comma, with the
+        whole column; the columns are then concatenated most significant
+        first. Negative values are converted from their absolute values and
+        'minus' is put in front of them at the end. A ``style`` gives tables
+        built from its own compiled group tables, so it costs the same.
+
+        :param np: the numpy module
+        :type np: module
+        :param arr: 1-dimensional array of integers
+        :type arr: numpy.ndarray
+        :param style: numeral style, British by default
+        :type style: NumeralStyle
+        :return: English numeral representations in input order
+        :rtype: list[str]
+        """
+        if not arr.size:
+            return []
+
+        negative = None
+        if arr.dtype.kind == "i" and arr.min() < 0:
+            negative = arr < 0
+            arr = _numpy_abs(np, arr)
+        elif arr.dtype.itemsize < 8:  # 1000 must fit the dtype of divmod
+            arr = arr.astype(np.int64 if arr.dtype.kind == "i" else
+                             np.uint64)
+
+        if _MAX_DIGITS < 20 and int(arr.max()) >= _MAX_NUM:
+            raise _too_large()
+
+        lrg, rem = np.divmod(arr, 1000)
+        levels = []
+        while lrg.any():
+            lrg, grp = np.divmod(lrg, 1000)
+            levels.append(grp)
+
+        numeral = np.full(arr.shape, "", dtype=object)
+        started = np.zeros(arr.shape, dtype=np.intp)
+        for sig in range(len(levels), 0, -1):
+            grp = levels[sig - 1]
+            numeral += _numpy_table(np, sig, style)[started, grp]
+            started |= grp != 0
+
+        groups, tails = _numpy_table(np, 0, style)
+        small = np.where(arr == 0, "zero", groups[rem])
+        numeral = np.where(arr < 1000, small, numeral + tails[rem])
+        if negative is not None:
+            numeral = np.where(negative, "minus " + numeral, numeral)
+        return numeral.tolist()
+
+    @classmethod
+    def from_numeral(cls, numeral):
+        """Class method which translates an English numeral back to an int.
+
+        It is the inverse of ``to_numeral`` and accepts exactly the numerals
+        it produces: words separated by single spaces, "and" after "hundred"
+        and before a last group below 100, and commas after every other
+        group followed by another one, after 'minus' for a negative number.
+        Every word is looked up once in the ``_NUMERAL_WORDS`` hash table and
+        the groups are parsed left to right with no backtracking, so parsing
+        takes linear time.
+
+        :param numeral: English numeral as produced by ``to_numeral``
+        :type numeral: str
+        :return: the number the numeral represents
+        :rtype: int
+        :raises: TypeError, InvalidNumeral
+
+        :example:
+
+        >>> WordNumeral.from_numeral("fifteen thousand and twenty five")
+        15025
+
+        >>> WordNumeral.from_numeral("fifteen thousand twenty five")
+        InvalidNumeral: ...
+        """
+        if not isinstance(numeral, str):
+            raise TypeError(f"'numeral' must be str, not {type(numeral)}")
+
+        if numeral == "zero":
+            return 0
+
+        negative = numeral.startswith("minus ")
+        if negative and numeral[6:] != "zero":
+            numeral = numeral[6:]
+
+        words = []
+        for word in numeral.split(" "):
+            comma = word.endswith(",")
+            try:
+                kind, value = _NUMERAL_WORDS[word[:-1] if comma else word]
+            except KeyError:
+                kind, value = _unknown_word(word[:-1] if comma else word,
+                                            numeral)
+            words.append((kind, value, comma))
+        words.append((None, None, False))
+
+        def fail(reason):
+            return InvalidNumeral(f"{reason} in {numeral!r}")
+
+        num = 0
+        prev_sig = None
+        i = 0
+        while words[i][0] is not None:
+            joiner = None
+            if prev_sig is not None:
+                if words[i] == ("and", None, False) and not words[i - 1][2]:
+                    joiner = "and"
+                    i += 1
+                elif words[i - 1][2]:
+                    joiner = ","
+                else:
+                    raise fail("missing 'and' or comma between groups")
+
+            start = i
+            kind, value, _ = words[i]
+            group = 0
+            if kind == "unit" and words[i + 1][0] == "hundred":
+                group = value * 100
+                i += 2
+                tens = words[i][0] == "and"
+                if tens:
+                    i += 1
+            else:
+                tens = True
+
+            kind, value, _ = words[i]
+            if tens and kind in ("unit", "teen"):
+                group += value
+                i += 1
+            elif tens and kind == "tens":
+                group += value
+                i += 1
+                if words[i][0] == "unit":
+                    group += words[i][1]
+                    i += 1
+            elif tens:
+                raise fail(f"expected a number below 100, not {kind!r}")
+
+            sig = 0
+            if words[i][0] == "scale":
+                sig = words[i][1]
+                i += 1
+
+            if prev_sig is not None and sig >= prev_sig:
+                raise fail("groups out of order")
+
+            if any(comma for _, _, comma in words[start:i - 1]):
+                raise fail("unexpected comma inside a group")
+
+            if joiner is not None and (joiner == "and") != (sig == 0 and
+                                                            group < 100):
+                raise fail(f"unexpected {joiner!r} before a group")
+
+            num = num * 1000 ** (prev_sig - sig) + group if num else group
+            prev_sig = sig
+
+        if words[-2][2]:
+            raise fail("unexpected trailing comma")
+
+        num *= 1000 ** prev_sig
+        return -num if negative else num
 
     @classmethod
     def _parse_small(cls, num):
@@ -208,7 +941,9 @@ class WordNumeral:
     def _parse_large(cls, num, sig):
         """Helper class method which handles parsing numbers into numerals
 
-        This is the workhorse of the converter where large numbers are handled.
+        This is the original recursive converter. ``to_numeral`` no longer
+        uses it but it is kept as the reference implementation the lookup
+        tables are checked against.
         It parses the number recursively ascending the value at 10^3 increments.
         The num argument is split into a quotient and remainder with divisor
         equal to 1000. The quotient is passed onto the recursive call along
@@ -230,8 +965,8 @@ class WordNumeral:
         if num < 0:
             raise ValueError(f"argument {num} is < 0; positive int expected")
 
-        if sig > max(_SIG_UNITS.keys()):
-            max_sig = _SIG_UNITS[max(_SIG_UNITS.keys())]
+        if sig > _MAX_SIG:
+            max_sig = _SIG_UNITS[_MAX_SIG]
             raise NumberTooLarge(f"can only handle up to {max_sig}s")
 
         if num == 0 and sig == 0:
@@ -299,17 +1034,17 @@ class WordNumeral:
     def __add__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num + other.num)
+        return WordNumeral(self.num + other.num, self._style)
 
     def __sub__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num - other.num)
+        return WordNumeral(self.num - other.num, self._style)
 
     def __mul__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num * other.num)
+        return WordNumeral(self.num * other.num, self._style)
 
     def __truediv__(self, other):
         raise NotImplementedError("cannot guarantee an integer. use // instead")
@@ -317,12 +1052,12 @@ class WordNumeral:
     def __floordiv__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num // other.num)
+        return WordNumeral(self.num // other.num, self._style)
 
     def __mod__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num % other.num)
+        return WordNumeral(self.num % other.num, self._style)
 
     def __divmod__(self, other):
         return self.__floordiv__(other), self.__mod__(other)
@@ -330,31 +1065,832 @@ class WordNumeral:
     def __pow__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num**other.num)
+        return WordNumeral(self.num**other.num, self._style)
 
     def __lshift__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num << other.num)
+        return WordNumeral(self.num << other.num, self._style)
 
     def __rshift__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num >> other.num)
+        return WordNumeral(self.num >> other.num, self._style)
 
     def __and__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num & other.num)
+        return WordNumeral(self.num & other.num, self._style)
 
     def __or__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num | other.num)
+        return WordNumeral(self.num | other.num, self._style)
 
     def __xor__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"must compare with another {type(self)}")
-        return WordNumeral(self.num ^ other.num)
+        return WordNumeral(self.num ^ other.num, self._style)
+    # endregion
+
+
+class CacheInfo(namedtuple("CacheInfo",
+                           "hits misses evictions maxsize currsize")):
+    """Statistics of a NumeralCache as returned by ``cache_info``"""
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class NumeralCache:
+    """This is a bounded, thread-safe cache of English numerals.
+
+    It maps numbers to the numerals returned by ``WordNumeral.to_numeral``
+    and holds at most ``maxsize`` of them. When full, the least recently
+    used ('lru') or the least frequently used ('lfu') number is evicted; LFU
+    ties go to the least recently used number of the lowest frequency.
+
+    A cache can be switched on for every ``to_numeral`` call with
+    ``WordNumeral.enable_cache`` or passed to a single ``Num2Words`` client.
+    """
+    # region Constructor
+    def __init__(self, maxsize=4096, policy="lru", style=None):
+        """Initialise a NumeralCache object
+
+        :param maxsize: maximum number of numerals to keep
+        :type maxsize: int
+        :param policy: eviction policy, either 'lru' or 'lfu'
+        :type policy: str
+        :param style: style of the numerals, British by default
+        :type style: NumeralStyle
+        :raises: ValueError
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f"maxsize must be a positive int, not {maxsize}")
+
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"policy must be 'lru' or 'lfu', not {policy!r}")
+
+        self._maxsize = maxsize
+        self._policy = policy
+        self._style = style
+        self._render = WordNumeral._render if style is None else \
+            style.to_numeral
+        self._lock = Lock()
+        self._numerals = OrderedDict()
+        self._counts = {}
+        self._by_count = {}
+        self._min_count = 0
+        self._hits = self._misses = self._evictions = 0
+
+        if policy == "lru":
+            self._touch, self._insert = self._touch_lru, self._insert_lru
+        else:
+            self._touch, self._insert = self._touch_lfu, self._insert_lfu
+    # endregion
+
+    # region Properties
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @property
+    def policy(self):
+        return self._policy
+
+    @property
+    def style(self):
+        return self._style
+    # endregion
+
+    # region Methods
+    def to_numeral(self, num):
+        """Returns the cached numeral for num, converting it on a miss
+
+        Only exact ``int`` values are cached so that e.g. ``5.0`` still raises
+        a TypeError instead of hitting the entry for ``5``. Errors are never
+        cached.
+
+        :param num: integer to be converted to an English numeral
+        :type num: int
+        :return: English numeral representation of the number
+        :rtype: str
+        :raises: TypeError, ValueError, NumberTooLarge
+        """
+        if type(num) is not int:
+            return self._render(num)
+
+        with self._lock:
+            numeral = self._numerals.get(num)
+            if numeral is not None:
+                self._hits += 1
+                self._touch(num)
+                return numeral
+            self._misses += 1
+
+        numeral = self._render(num)
+
+        with self._lock:
+            if num not in self._numerals:
+                self._insert(num, numeral)
+        return numeral
+
+    def cache_info(self):
+        """Returns hits, misses, evictions, maxsize and current size
+
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             self._maxsize, len(self._numerals))
+
+    def cache_clear(self):
+        """Empties the cache and resets its statistics"""
+        with self._lock:
+            self._numerals.clear()
+            self._counts.clear()
+            self._by_count.clear()
+            self._min_count = 0
+            self._hits = self._misses = self._evictions = 0
+    # endregion
+
+    # region Eviction Policies
+    def _touch_lru(self, num):
+        self._numerals.move_to_end(num)
+
+    def _insert_lru(self, num, numeral):
+        if len(self._numerals) >= self._maxsize:
+            self._numerals.popitem(last=False)
+            self._evictions += 1
+        self._numerals[num] = numeral
+
+    def _touch_lfu(self, num):
+        count = self._counts[num]
+        bucket = self._by_count[count]
+        del bucket[num]
+        if not bucket:
+            del self._by_count[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[num] = count + 1
+        self._by_count.setdefault(count + 1, OrderedDict())[num] = None
+
+    def _insert_lfu(self, num, numeral):
+        if len(self._numerals) >= self._maxsize:
+            bucket = self._by_count[self._min_count]
+            evicted, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._by_count[self._min_count]
+            del self._numerals[evicted]
+            del self._counts[evicted]
+            self._evictions += 1
+        self._numerals[num] = numeral
+        self._counts[num] = 1
+        self._by_count.setdefault(1, OrderedDict())[num] = None
+        self._min_count = 1
     # endregion
 
+    # region Display Overrides
+    def __repr__(self):
+        return (f"NumeralCache(maxsize={self._maxsize}, "
+                f"policy={self._policy!r})")
+    # endregion
+
+
+class NumeralStyle:
+    """This is a compiled English numeral style.
+
+    The words of every 3-digit group, with and without the separator that
+    leads the last group of a number, are worked out once when the style is
+    created into tables like ``_GROUPS`` and ``_TAILS``, and shared by every
+    style with the same options. Converting a number then costs the same
+    whatever the style. The default options give the British numerals of
+    ``WordNumeral.to_numeral``:
+
+        - ``conjunction`` 'one hundred and six', 'one thousand and six'; US
+          style leaves 'and' out: 'one hundred six', 'one thousand six'
+        - ``hyphenate`` 'twenty-five' rather than 'twenty five'
+        - ``commas`` 'one thousand, two hundred' rather than 'one thousand
+          two hundred'
+    """
+    __slots__ = ("_options", "_groups", "_tails", "_separator")
+
+    # region Constructor
+    def __init__(self, conjunction=True, hyphenate=False, commas=True):
+        """Initialise a NumeralStyle object, compiling its tables
+
+        :param conjunction: whether 'and' joins hundreds to tens and the last
+            group below 100 to the groups before it
+        :type conjunction: bool
+        :param hyphenate: whether tens and units are joined with a hyphen
+        :type hyphenate: bool
+        :param commas: whether groups are separated by commas
+        :type commas: bool
+        """
+        self._options = (bool(conjunction), bool(hyphenate), bool(commas))
+        self._groups, self._tails = _style_tables(*self._options)
+        self._separator = ", " if commas else " "
+    # endregion
+
+    # region Properties
+    @property
+    def conjunction(self):
+        return self._options[0]
+
+    @property
+    def hyphenate(self):
+        return self._options[1]
+
+    @property
+    def commas(self):
+        return self._options[2]
+    # endregion
+
+    # region Methods
+    def to_numeral(self, num):
+        """Translates an integer to an English numeral in this style
+
+        Works as ``WordNumeral.to_numeral``, from the tables of the style.
+
+        :param num: integer to be converted to an English numeral
+        :type num: int
+        :return: English numeral representation of the number
+        :rtype: str
+        :raises: TypeError, ValueError, NumberTooLarge
+
+        :example:
+
+        >>> NumeralStyle(conjunction=False, hyphenate=True).to_numeral(1025)
+        'one thousand twenty-five'
+        """
+        if not isinstance(num, int):
+            raise TypeError(f"'num' must be int, not {type(num)}")
+
+        if num < 0:
+            return "minus " + self.to_numeral(-num)
+
+        if num >= _MAX_NUM:
+            raise _too_large()
+
+        groups = self._groups
+        if num < 1000:
+            return groups[num] if num else "zero"
+
+        if num < 1000000:
+            lrg, rem = divmod(num, 1000)
+            return groups[lrg] + _SCALES[1] + self._tails[rem]
+
+        split = _split_groups(num)
+        top = len(split) - 1
+        if top >= len(_SCALES):
+            _extend_scales(top)
+        numeral = [groups[g] + _SCALES[top - i]
+                   for i, g in enumerate(split) if g and i < top]
+        return self._separator.join(numeral) + self._tails[split[-1]]
+    # endregion
+
+    # region Comparison and Pickling
+    def __eq__(self, other):
+        if not isinstance(other, NumeralStyle):
+            return NotImplemented
+        return self._options == other._options
+
+    def __hash__(self):
+        return hash(self._options)
+
+    def __reduce__(self):
+        return NumeralStyle, self._options
+    # endregion
+
+    # region Display Overrides
+    def __repr__(self):
+        conjunction, hyphenate, commas = self._options
+        return (f"NumeralStyle(conjunction={conjunction}, "
+                f"hyphenate={hyphenate}, commas={commas})")
+    # endregion
+
+
+# region Helper Functions
+
+def _too_large():
+    """Returns the error raised for numbers of more than _MAX_DIGITS digits
+
+    :rtype: NumberTooLarge
+    """
+    return NumberTooLarge(f"can only handle up to {_MAX_DIGITS} digits")
+
+
+def _scale_name(sig):
+    """Returns the significance numeral of 1000 ** sig, e.g. 'million'
+
+    Levels in ``_SIG_UNITS`` keep their names. Above them the name of the
+    ``n``-th -illion, ``n = sig - 1``, is composed with the Conway-Wechsler
+    system: every 3-digit group of ``n`` becomes a unit, tens and hundreds
+    prefix (with the letters the next prefix asks of the unit) ending in
+    'illi', 'nilli' for zero, and the last 'illi' is followed by 'on', e.g.
+    'sexagintillion' (sig 61) or 'millinillion' (sig 1001).
+
+    :param sig: significance level
+    :type sig: int
+    :rtype: str
+    """
+    if sig <= _MAX_SIG:
+        return _SIG_UNITS[sig]
+
+    prefixes = []
+    n = sig - 1
+    while n:
+        n, grp = divmod(n, 1000)
+        prefixes.append(_cw_prefix(grp) + "illi")
+    return "".join(reversed(prefixes)) + "on"
+
+
+def _cw_prefix(grp):
+    """Returns the Conway-Wechsler prefix of a 3-digit group, e.g. 'sexagint'
+
+    :param grp: group value, 0 to 999
+    :type grp: int
+    :rtype: str
+    """
+    if grp < 10:
+        return _CW_SMALL[grp]
+
+    hundreds, rem = divmod(grp, 100)
+    tens, units = divmod(rem, 10)
+    tens, tens_marks = _CW_TENS[tens]
+    hundreds, hundreds_marks = _CW_HUNDREDS[hundreds]
+    marks = tens_marks if tens else hundreds_marks
+    unit = _CW_UNITS[units]
+    if units == 3 and ("s" in marks or "x" in marks):
+        unit += "s"
+    elif units == 6 and marks.strip("mn"):
+        unit += marks.strip("mn")[0]
+    elif units in (7, 9) and marks.strip("sx"):
+        unit += marks.strip("sx")[0]
+    return (unit + tens + hundreds)[:-1]
+
+
+def _scale_level(word, top):
+    """Returns the significance level a Conway-Wechsler name stands for
+
+    The inverse of ``_scale_name`` for levels above ``_SIG_UNITS``: the
+    prefix before every 'illi' is looked up in ``_CW_GROUPS`` and the groups
+    are read as a number in base 1000, without generating any other name.
+    Reading stops as soon as the level is beyond ``top``.
+
+    :param word: word ending in 'illion'
+    :type word: str
+    :param top: highest significance level accepted
+    :type top: int
+    :return: significance level or None if word is not a scale name up to
+        top
+    :rtype: int
+    """
+    if not _CW_GROUPS:
+        _CW_GROUPS.update((_cw_prefix(grp), grp) for grp in range(1000))
+
+    n = 0
+    for prefix in word[:-2].split("illi")[:-1]:
+        grp = _CW_GROUPS.get(prefix)
+        if grp is None:
+            return None
+        n = n * 1000 + grp
+        if n >= top:
+            return None
+    # e.g. a leading 'nilli' spells the same level in a non-standard way
+    return n + 1 if _scale_name(n + 1) == word else None
+
+
+def _unknown_word(word, numeral):
+    """Looks up a word missing from ``_NUMERAL_WORDS`` for ``from_numeral``
+
+    A word ending in 'illion' may name a significance level whose numeral
+    has not been generated yet, so it is read as a Conway-Wechsler name and
+    accepted if its level is within the digits limit.
+
+    :param word: word of numeral
+    :type word: str
+    :param numeral: English numeral being parsed
+    :type numeral: str
+    :return: kind and value of the word
+    :rtype: tuple[str, int]
+    :raises: InvalidNumeral
+    """
+    if word.endswith("illion"):
+        sig = _scale_level(word, (_MAX_DIGITS - 1) // 3)
+        if sig is not None and sig > _MAX_SIG:
+            return "scale", sig
+    raise InvalidNumeral(f"unexpected word {word!r} in {numeral!r}")
+
+
+def _extend_scales(top):
+    """Grows ``_SCALES`` to cover every significance level up to top
+
+    The names are generated once and kept, and added to ``_NUMERAL_WORDS``
+    so that ``from_numeral`` reads them back.
+
+    :param top: highest significance level needed
+    :type top: int
+    """
+    with _SCALES_LOCK:
+        for sig in range(len(_SCALES), top + 1):
+            name = _scale_name(sig)
+            _NUMERAL_WORDS[name] = ("scale", sig)
+            _SCALES.append(f" {name}")
+
+
+def _import_numpy():
+    """Returns the numpy module or None when the optional extra is missing"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _numpy_abs(np, arr):
+    """Returns the absolute values of an integer array as unsigned integers
+
+    Unlike ``numpy.abs`` this holds the absolute value of the most negative
+    int64, 2 ** 63.
+
+    :param np: the numpy module
+    :type np: module
+    :param arr: array of integers
+    :type arr: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+    return np.abs(arr.astype(np.int64)).astype(np.uint64)
+
+
+def _fixed_point(value, places=None):
+    """Converts a number to a whole number of hundredths, thousandths, etc.
+
+    The absolute value is rounded half up to ``places`` digits after the
+    decimal point. A ``Decimal`` is rounded from its exact integer ratio,
+    so the result does not depend on the precision of the ``decimal``
+    context. A ``float`` is scaled and rounded in floating point, as NumPy
+    does in ``WordNumeral.to_currencies``. Without ``places`` the digits of
+    a ``Decimal``, or of the shortest ``repr`` of a ``float``, are kept.
+    Like whole numbers, fractions are limited to ``_MAX_DIGITS`` digits.
+
+    :param value: number to convert
+    :type value: int | float | decimal.Decimal
+    :param places: number of digits after the decimal point
+    :type places: int
+    :return: whether the rounded value is below zero, its absolute value in
+        units of ``10 ** -places``, and places
+    :rtype: tuple[bool, int, int]
+    :raises: TypeError, ValueError, NumberTooLarge
+    """
+    if places is not None and (not isinstance(places, int) or places < 0):
+        raise ValueError(f"places must be an int >= 0, not {places!r}")
+    if places is not None and places > _MAX_DIGITS:
+        raise _too_large()
+
+    if isinstance(value, int):
+        places = places or 0
+        return value < 0, abs(value) * 10 ** places, places
+
+    import decimal
+    if isinstance(value, float):
+        if value != value or value in (float("inf"), float("-inf")):
+            raise ValueError(f"argument {value} is not a finite number")
+        if places is not None:
+            units = int(abs(value) * 10 ** places + 0.5)
+            return value < 0 and units > 0, units, places
+        value = decimal.Decimal(repr(value))
+    elif not isinstance(value, decimal.Decimal):
+        raise TypeError(f"'value' must be int, float or Decimal, not "
+                        f"{type(value)}")
+
+    if not value.is_finite():
+        raise ValueError(f"argument {value} is not a finite number")
+
+    if places is None:
+        places = max(0, -value.as_tuple().exponent)
+        if places > _MAX_DIGITS:
+            raise _too_large()
+    if value.adjusted() < -places - 1:
+        return False, 0, places
+    if value.adjusted() >= _MAX_DIGITS:
+        raise _too_large()
+
+    numerator, denominator = value.as_integer_ratio()
+    units, rem = divmod(abs(numerator) * 10 ** places, denominator)
+    units += 2 * rem >= denominator
+    return numerator < 0 and units > 0, units, places
+
+
+def _currency_names(currency):
+    """Returns the names of the unit and hundredth of a currency
+
+    :param currency: code of a currency in ``_CURRENCIES``, or its names
+    :type currency: str | tuple[str]
+    :return: singular and plural of the unit, then of the hundredth
+    :rtype: tuple[str]
+    :raises: ValueError
+    """
+    if isinstance(currency, str):
+        try:
+            return _CURRENCIES[currency]
+        except KeyError:
+            raise ValueError(f"unknown currency {currency!r}, expected one "
+                             f"of {sorted(_CURRENCIES)}") from None
+
+    names = tuple(currency)
+    if len(names) != 4 or not all(isinstance(n, str) for n in names):
+        raise ValueError(f"currency names must be 4 str, not {currency!r}")
+    return names
+
+
+def _currency_numeral(negative, major, minor, numeral, groups, names):
+    """Names an amount of money split into units and hundredths
+
+    :param negative: whether the amount is below zero
+    :type negative: bool
+    :param major: number of units
+    :type major: int
+    :param minor: number of hundredths, below 100
+    :type minor: int
+    :param numeral: numeral of major
+    :type numeral: str
+    :param groups: numerals of every 3-digit group, e.g. ``_GROUPS``
+    :type groups: tuple[str]
+    :param names: names of the unit and hundredth, see ``_CURRENCIES``
+    :type names: tuple[str]
+    :rtype: str
+    """
+    unit, units, cent, cents = names
+    if not minor:
+        words = f"{numeral} {unit if major == 1 else units}"
+    elif not major:
+        words = f"{groups[minor]} {cent if minor == 1 else cents}"
+    else:
+        words = (f"{numeral} {unit if major == 1 else units} and "
+                 f"{groups[minor]} {cent if minor == 1 else cents}")
+    return "minus " + words if negative else words
+
+
+def _split_groups(num):
+    """Splits a positive integer into 3-digit groups, most significant first
+
+    Up to ``_SPLIT_BITS`` the groups are peeled off with ``divmod`` by 1000,
+    which for numbers this size beats formatting the number as a string.
+    Above it every ``divmod`` costs time proportional to the length of the
+    number, making the loop quadratic, so the number is formatted with a
+    single ``str`` call instead and the digits are read 3 at a time. ``str``
+    is itself quadratic, and refused past ``sys.get_int_max_str_digits``,
+    so above ``_DECIMAL_BITS`` the digits come from ``_int_to_str``.
+
+    :param num: positive integer to split
+    :type num: int
+    :return: 3-digit group values, most significant first
+    :rtype: list[int]
+    """
+    if num.bit_length() <= _SPLIT_BITS:
+        groups = []
+        while num:
+            num, rem = divmod(num, 1000)
+            groups.append(rem)
+        groups.reverse()
+        return groups
+
+    digits = _group_digits(num)
+    return list(map(_DIGIT_GROUPS.__getitem__,
+                    [digits[i:i + 3] for i in range(0, len(digits), 3)]))
+
+
+def _iter_words(num, groups, tails, separator):
+    """Yields the numeral of a validated integer piece by piece
+
+    :param num: integer to convert
+    :type num: int
+    :param groups: numerals of every 3-digit group, e.g. ``_GROUPS``
+    :type groups: tuple[str]
+    :param tails: numerals of every last group, e.g. ``_TAILS``
+    :type tails: tuple[str]
+    :param separator: separator of groups before the last one
+    :type separator: str
+    :rtype: Iterator[str]
+    """
+    if num < 0:
+        yield "minus "
+        num = -num
+
+    if num < 1000:
+        yield groups[num] if num else "zero"
+        return
+
+    count, split = _iter_groups(num)
+    _extend_scales(count - 1)
+    lead = ""
+    for level in range(count - 1, 0, -1):
+        grp = next(split)
+        if grp:
+            yield lead + groups[grp] + _SCALES[level]
+            lead = separator
+    yield tails[next(split)]
+
+
+def _iter_groups(num):
+    """Counts and iterates the 3-digit groups of a positive integer
+
+    Works as ``_split_groups`` but the groups of a number above
+    ``_SPLIT_BITS`` are read from its digits one at a time, as values shared
+    through ``_DIGIT_GROUPS``, rather than kept in a list.
+
+    :param num: positive integer to split
+    :type num: int
+    :return: the number of groups and the groups, most significant first
+    :rtype: tuple[int, Iterator[int]]
+    """
+    if num.bit_length() <= _SPLIT_BITS:
+        groups = _split_groups(num)
+        return len(groups), iter(groups)
+
+    digits = _group_digits(num)
+    return len(digits) // 3, map(_DIGIT_GROUPS.__getitem__,
+                                 (digits[i:i + 3]
+                                  for i in range(0, len(digits), 3)))
+
+
+def _group_digits(num):
+    """Formats a positive integer in decimal, zero padded to whole groups
+
+    :param num: positive integer to format
+    :type num: int
+    :return: decimal digits, a multiple of 3 of them
+    :rtype: str
+    """
+    try:
+        digits = str(num) if num.bit_length() <= _DECIMAL_BITS else \
+            _int_to_str(num)
+    except ValueError:
+        digits = _int_to_str(num)
+    pad = -len(digits) % 3
+    return "00"[:pad] + digits if pad else digits
+
+
+def _int_to_str(num):
+    """Formats a huge positive integer in decimal in subquadratic time
+
+    The number is split in halves by bit shifts, which take linear time,
+    down to pieces ``decimal.Decimal`` converts directly, and the pieces are
+    put together again with exact ``decimal`` arithmetic, whose large
+    multiplications are subquadratic. The powers of 2 are computed once per
+    call; as the halves always split at the same widths, there are only
+    about two per level.
+
+    :param num: positive integer to format
+    :type num: int
+    :return: decimal digits of num
+    :rtype: str
+    """
+    import decimal
+    powers = {}
+
+    def power(width):
+        if width not in powers:
+            powers[width] = decimal.Decimal(2) ** width
+        return powers[width]
+
+    def convert(n, width):
+        if width <= _SPLIT_BITS:
+            return decimal.Decimal(n)
+        half = width >> 1
+        high = n >> half
+        return convert(n - (high << half), half) + \
+            convert(high, width - half) * power(half)
+
+    with decimal.localcontext() as ctx:
+        ctx.prec = decimal.MAX_PREC
+        ctx.Emax = decimal.MAX_EMAX
+        ctx.traps[decimal.Inexact] = True
+        return str(convert(num, num.bit_length()))
+
+
+def _numpy_table(np, sig, style=None):
+    """Returns a NumPy object array of group numerals for a significance level
+
+    For ``sig`` 0 the rows are ``_GROUPS`` and ``_TAILS``, or the tables of
+    ``style``. For higher levels the rows are the group numerals suffixed
+    with the significance numeral, without and with a leading separator,
+    and an empty string for group 0. The arrays are built on first use and
+    cached in ``_NUMPY_TABLES`` by level and style options.
+
+    :param np: the numpy module
+    :type np: module
+    :param sig: significance level
+    :type sig: int
+    :param style: numeral style, British by default
+    :type style: NumeralStyle
+    :return: 2 by 1000 array indexed by separator flag and group value
+    :rtype: numpy.ndarray
+    """
+    key = sig if style is None else (sig, style._options)
+    try:
+        return _NUMPY_TABLES[key]
+    except KeyError:
+        pass
+
+    if style is None:
+        groups, tails, separator = _GROUPS, _TAILS, ", "
+    else:
+        groups, tails, separator = style._groups, style._tails, \
+            style._separator
+    if sig == 0:
+        rows = [groups, tails]
+    else:
+        words = [groups[n] + _SCALES[sig] if n else "" for n in range(1000)]
+        rows = [words, [separator + w if w else "" for w in words]]
+
+    table = np.empty((2, 1000), dtype=object)
+    table[:] = rows
+    return _NUMPY_TABLES.setdefault(key, table)
+
+
+def _style_tables(conjunction, hyphenate, commas):
+    """Returns the group and tail tables of a numeral style
+
+    Tables are built once per combination of options and then reused.
+
+    :param conjunction: whether 'and' is used, see NumeralStyle
+    :type conjunction: bool
+    :param hyphenate: whether tens and units are hyphenated
+    :type hyphenate: bool
+    :param commas: whether groups are separated by commas
+    :type commas: bool
+    :return: numerals of every group and of every last group
+    :rtype: tuple[tuple[str], tuple[str]]
+    """
+    options = (conjunction, hyphenate, commas)
+    if options not in _STYLE_TABLES:
+        joiner = "-" if hyphenate else " "
+        groups = []
+        for n in range(1000):
+            h, r = divmod(n, 100)
+            words = [f"{_SMALL_NUMS[h]} hundred"] if h else []
+            if r and h and conjunction:
+                words.append("and")
+            if r:
+                tens, units = divmod(r, 10)
+                words.append(_SMALL_NUMS[r] if r < 20 or not units else
+                             joiner.join((_SMALL_NUMS[tens * 10],
+                                          _SMALL_NUMS[units])))
+            groups.append(" ".join(words))
+
+        lead = " and " if conjunction else " "
+        separator = ", " if commas else " "
+        tails = tuple("" if n == 0 else
+                      f"{lead}{groups[n]}" if n < 100 else
+                      f"{separator}{groups[n]}" for n in range(1000))
+        _STYLE_TABLES[options] = (tuple(groups), tails)
+    return _STYLE_TABLES[options]
+
+# endregion
+
+
+# region Lookup Tables
+
+_GROUPS = tuple(" ".join(w for w in WordNumeral._parse_small(n) if w)
+                for n in range(1000))
+"""tuple: numerals for every 3-digit group, e.g. 'one hundred and six'"""
+
+_TAILS = tuple("" if n == 0 else
+               f" and {_GROUPS[n]}" if n < 100 else
+               f", {_GROUPS[n]}" for n in range(1000))
+"""tuple: numerals for the last 3-digit group with its leading separator"""
+
+_NUMERAL_WORDS = dict(
+    [(_SMALL_NUMS[n], ("unit", n)) for n in range(1, 10)] +
+    [(_SMALL_NUMS[n], ("teen", n)) for n in range(10, 20)] +
+    [(_SMALL_NUMS[n], ("tens", n)) for n in range(20, 100, 10)] +
+    [(_SIG_UNITS[sig], ("scale", sig)) for sig in range(1, _MAX_SIG + 1)] +
+    [("hundred", ("hundred", 100)), ("and", ("and", None))])
+"""dict: kind and value of every word a numeral is made of, by word"""
+
+_DIGIT_GROUPS = {f"{n:03d}": n for n in range(1000)}
+"""dict: 3-digit group values by their zero padded string, e.g. '007': 7"""
+
+_SPLIT_BITS = 1300
+"""int: size above which _split_groups reads the digits of a str (~400)"""
+
+_DECIMAL_BITS = 40000
+"""int: size above which _split_groups formats with _int_to_str (~12000)"""
+
+_CW_GROUPS = {}
+"""dict: 3-digit group values by their Conway-Wechsler prefix, built on first
+use by _scale_level"""
+
+_NUMPY_TABLES = {}
+"""dict: NumPy group numeral tables by level and style, see _numpy_table"""
+
+_STYLE_TABLES = {}
+"""dict: group and tail tables of numeral styles by options, see
+NumeralStyle"""
+
+# endregion
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+The module contains a small HTTP service converting numbers and text to
+English numerals, built on the standard library's ``http.server`` only. A
+single process serves every caller through one shared ``NumeralCache``.
+
+Endpoints, all answering JSON:
+
+    - ``GET /numeral?n=1015`` the numeral of a number
+    - ``POST /numerals`` the numerals of a JSON array of numbers
+    - ``POST /text`` the numeral of the number in the UTF-8 request body,
+      see ``Num2Words.text_to_numeral``
+    - ``GET /cache`` the statistics of the shared cache
+
+Run it with ``python -m num2words.server [--host HOST] [--port PORT]``.
+"""
+import argparse
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from num2words.client import Num2Words
+from num2words.numeral import NumeralCache
+from num2words.utils import Error
+
+_MAX_BODY = 1 << 24
+"""int: largest request body accepted, in bytes"""
+
+
+class NumeralServer(ThreadingHTTPServer):
+    """
+    This is a threaded HTTP server converting numbers to English numerals.
+
+    Every connection is served on its own thread and kept open between
+    requests (HTTP/1.1 keep-alive), so requests a client sends back to back
+    on a connection without waiting for the answers are answered in order.
+    All threads render through the same cache.
+    """
+    # region Constructor
+    daemon_threads = True
+
+    def __init__(self, address, cache=None, quiet=True):
+        """Initialise a NumeralServer object, listening on address
+
+        :param address: host and port to listen on, port 0 picks a free one
+        :type address: tuple[str, int]
+        :param cache: cache shared by every request, by default a
+            ``NumeralCache(maxsize=65536)``
+        :type cache: NumeralCache
+        :param quiet: whether to skip logging every request to stderr
+        :type quiet: bool
+        """
+        self.cache = NumeralCache(maxsize=65536) if cache is None else cache
+        self.client = Num2Words(cache=self.cache)
+        self.quiet = quiet
+        super().__init__(address, NumeralRequestHandler)
+    # endregion
+
+    # region Properties
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+    # endregion
+
+
+class NumeralRequestHandler(BaseHTTPRequestHandler):
+    """Request handler of the NumeralServer endpoints"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    # region Methods
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/numeral":
+            values = parse_qs(url.query).get("n")
+            if not values:
+                return self._send(400, {"error": "missing query parameter n"})
+            try:
+                num = int(values[0])
+                numeral = self.server.cache.to_numeral(num)
+            except (Error, ValueError) as e:
+                return self._send(400, {"error": str(e)})
+            self._send(200, {"number": num, "numeral": numeral})
+        elif url.path == "/cache":
+            self._send(200, self.server.cache.cache_info()._asdict())
+        else:
+            self._send(404, {"error": f"no such endpoint {url.path}"})
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        if path not in ("/numerals", "/text"):
+            return self._send(404, {"error": f"no such endpoint {path}"},
+                              close=True)
+
+        try:
+            body = self._read_body()
+        except ValueError as e:
+            return self._send(400, {"error": str(e)}, close=True)
+
+        if path == "/text":
+            try:
+                numeral = self.server.client.text_to_numeral(
+                    body.decode("utf-8"))
+            except (Error, ValueError) as e:
+                return self._send(400, {"error": str(e)})
+            return self._send(200, {"numeral": numeral})
+
+        try:
+            nums = json.loads(body)
+            if not isinstance(nums, list):
+                raise ValueError("request body must be a JSON array")
+            to_numeral = self.server.cache.to_numeral
+            numerals = [to_numeral(num) for num in nums]
+        except (Error, ValueError, TypeError) as e:
+            return self._send(400, {"error": f"{type(e).__name__}: {e}"})
+        self._send(200, numerals)
+
+    def _read_body(self):
+        """Reads the request body announced by its Content-Length
+
+        :rtype: bytes
+        :raises: ValueError
+        """
+        length = int(self.headers.get("Content-Length", 0))
+        if not 0 <= length <= _MAX_BODY:
+            raise ValueError(f"Content-Length must be 0 to {_MAX_BODY}")
+        return self.rfile.read(length)
+
+    def _send(self, code, payload, close=False):
+        """Sends a JSON response, keeping the connection open unless close
+
+        :param code: HTTP status code
+        :type code: int
+        :param payload: object to send as JSON
+        :type payload: object
+        :param close: whether to close the connection afterwards
+        :type close: bool
+        """
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+    # endregion
+
+
+def main(argv=None):
+    """Runs a NumeralServer until interrupted
+
+    :param argv: arguments, defaults to ``sys.argv[1:]``
+    :type argv: list[str]
+    :return: exit status
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Serve English numerals "
+                                                 "over HTTP")
+    parser.add_argument('--host', type=str, default="127.0.0.1",
+                        help="address to listen on")
+    parser.add_argument('--port', type=int, default=8080,
+                        help="port to listen on")
+    parser.add_argument('--cache-size', type=int, default=65536,
+                        dest="cache_size", help="numerals kept in the cache")
+    parser.add_argument('--verbose', action="store_true",
+                        help="log every request to stderr")
+    args = parser.parse_args(argv)
+
+    cache = NumeralCache(maxsize=args.cache_size)
+    with NumeralServer((args.host, args.port), cache,
+                       quiet=not args.verbose) as server:
+        print(f"serving on {server.url}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+The module contains a Stats class a Num2Words client can record its work
+in: timing histograms of the stages of a conversion and counters of inputs,
+outcomes and bytes read, exported as a dict, JSON or Prometheus text.
+"""
+import json
+from bisect import bisect_left
+from threading import Lock
+
+_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3,
+            2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+            10.0)
+"""tuple: default upper bounds, in seconds, of the histogram buckets"""
+
+STAGES = ("read", "extract", "render")
+"""tuple: stages of a conversion
+
+    - ``read`` opening and reading a file
+    - ``extract`` finding the number in the text with the handler
+    - ``render`` converting the number to its numeral
+"""
+
+COUNTERS = {
+    "files": "Files converted",
+    "texts": "Texts converted",
+    "numbers": "Numbers converted to numerals",
+    "invalid": "Inputs without a single valid number",
+    "errors": "Conversions that raised an exception",
+    "read_bytes": "Bytes read from files",
+}
+"""dict: description of every counter by name"""
+
+
+class Histogram:
+    """This is a histogram of durations with fixed bucket bounds."""
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    # region Constructor
+    def __init__(self, bounds=_BUCKETS):
+        """Initialise an empty Histogram object
+
+        :param bounds: increasing upper bounds of the buckets, in seconds
+        :type bounds: tuple[float]
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+    # endregion
+
+    # region Methods
+    def observe(self, value):
+        """Adds a value to the bucket of the smallest bound >= value
+
+        Values above every bound go to a last, unbounded, bucket.
+
+        :param value: duration in seconds
+        :type value: float
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Returns the count of values <= every bound, and of all values
+
+        :rtype: list[tuple[float, int]]
+        """
+        total = 0
+        result = []
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+    # endregion
+
+
+class Stats:
+    """
+    This is a thread-safe record of the work of a Num2Words client.
+
+    Pass an instance as ``Num2Words(stats=Stats())`` to time every stage of
+    a conversion (see ``STAGES``) in a ``Histogram`` and count inputs,
+    outcomes and bytes (see ``COUNTERS``). Clients without stats skip the
+    timing altogether. ``observe`` and ``add`` are the hooks the client
+    calls, so a subclass can forward them elsewhere as well.
+    """
+    # region Constructor
+    def __init__(self, buckets=_BUCKETS):
+        """Initialise an empty Stats object
+
+        :param buckets: upper bounds of the histogram buckets, in seconds
+        :type buckets: tuple[float]
+        """
+        self._buckets = tuple(buckets)
+        self._lock = Lock()
+        self.reset()
+    # endregion
+
+    # region Properties
+    @property
+    def histograms(self):
+        return self._histograms
+
+    @property
+    def counters(self):
+        return self._counters
+    # endregion
+
+    # region Methods
+    def observe(self, stage, seconds):
+        """Records the duration of a stage of a conversion
+
+        :param stage: one of ``STAGES``
+        :type stage: str
+        :param seconds: duration of the stage
+        :type seconds: float
+        """
+        with self._lock:
+            self._histograms[stage].observe(seconds)
+
+    def add(self, counter, value=1):
+        """Increments a counter
+
+        :param counter: one of ``COUNTERS``
+        :type counter: str
+        :param value: amount to add
+        :type value: int
+        """
+        with self._lock:
+            self._counters[counter] += value
+
+    def reset(self):
+        """Clears every histogram and counter"""
+        with self._lock:
+            self._histograms = {stage: Histogram(self._buckets)
+                                for stage in STAGES}
+            self._counters = dict.fromkeys(COUNTERS, 0)
+
+    def to_dict(self):
+        """Returns a snapshot of the histograms and counters
+
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "stages": {stage: {"count": h.count, "sum": h.sum,
+                                   "buckets": [[b, n] for b, n in
+                                               h.cumulative()[:-1]]}
+                           for stage, h in self._histograms.items()},
+                "counters": dict(self._counters),
+            }
+
+    def to_json(self):
+        """Returns a snapshot of the histograms and counters as JSON
+
+        :rtype: str
+        """
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self, prefix="num2words"):
+        """Returns a snapshot in the Prometheus text exposition format
+
+        The stages make up one ``<prefix>_stage_seconds`` histogram with a
+        ``stage`` label, every counter is a ``<prefix>_<name>_total``.
+
+        :param prefix: prefix of the metric names
+        :type prefix: str
+        :rtype: str
+        """
+        name = f"{prefix}_stage_seconds"
+        lines = [f"# HELP {name} Time spent in each stage of a conversion.",
+                 f"# TYPE {name} histogram"]
+        with self._lock:
+            for stage, h in self._histograms.items():
+                for bound, count in h.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{le}"}}'
+                                 f' {count}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {h.sum!r}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {h.count}')
+
+            for counter, value in self._counters.items():
+                name = f"{prefix}_{counter}_total"
+                lines += [f"# HELP {name} {COUNTERS[counter]}.",
+                          f"# TYPE {name} counter",
+                          f"{name} {value}"]
+        return "\n".join(lines) + "\n"
+    # endregion
+
+    # region Display Overrides
+    def __repr__(self):
+        return f"Stats({self._counters})"
+    # endregion
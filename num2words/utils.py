@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import re
 
 
 # region Exceptions
@@ -15,6 +16,11 @@ class NumberTooLarge(Error):
 class InvalidNumber(Error):
     """Raises an error when the input string does not contain a valid number"""
     pass
+
+
+class InvalidNumeral(Error):
+    """Raises an error when the input string is not a valid English numeral"""
+    pass
 # endregion
 
 
@@ -49,12 +55,116 @@ def input_handler(input_string: str) -> int:
     >>> input_handler("I received 23 456,9 KGs.")
     InvalidNumber: ...
     """
-    words = input_string.split()
-    with_digits = [w for w in words if any(map(str.isdigit, list(w)))]
-    numeric = [w for w in with_digits if w.isnumeric()]
+    words = _digit_words(input_string)
+    first = next(words, None)
 
-    if len(numeric) != 1 or len(with_digits) != 1:
+    if first is None or next(words, None) is not None \
+            or not first[1].isnumeric():
         raise InvalidNumber("none or multiple numeric words founds")
 
-    num = int([w for w in with_digits if w.isnumeric()].pop())
-    return num
+    return int(first[1])
+
+
+def chunked_input_handler(chunks) -> int:
+    """Same as ``input_handler`` but reads the text as a stream of chunks,
+    e.g. blocks read from a large file, so the text never has to be held in
+    memory at once. A word split across two chunks is carried over to the
+    next one. Scanning stops as soon as a second word containing a digit is
+    found.
+
+    :param chunks: consecutive pieces of the text to search
+    :type chunks: Iterable[str]
+    :return: the number detected in the text
+    :raise: InvalidNumber
+    :example:
+
+    >>> chunked_input_handler(["We processed 91", "21 records."])
+    9121
+    """
+    found = None
+    for _, text in _word_aligned(chunks):
+        for _, word in _digit_words(text):
+            if found is not None:
+                raise InvalidNumber("none or multiple numeric words founds")
+            found = word
+
+    if found is None or not found.isnumeric():
+        raise InvalidNumber("none or multiple numeric words founds")
+
+    return int(found)
+
+
+def _word_aligned(chunks):
+    """Re-cuts a stream of text chunks so that no word spans two pieces.
+
+    The trailing partial word of every chunk is held back and prepended to
+    the next one; the last partial word is yielded at the end. Chunks with
+    no whitespace at all are only joined once their word ends.
+
+    :param chunks: consecutive pieces of a text
+    :type chunks: Iterable[str]
+    :return: offset in the text and piece of text ending on a whitespace
+    :rtype: Iterator[tuple[int, str]]
+    """
+    offset = 0
+    carry = []
+    for chunk in chunks:
+        cut = len(chunk)
+        while cut and not chunk[cut - 1].isspace():
+            cut -= 1
+
+        if not cut:
+            carry.append(chunk)
+            continue
+
+        text = "".join(carry) + chunk[:cut]
+        carry = [chunk[cut:]]
+        yield offset, text
+        offset += len(text)
+
+    text = "".join(carry)
+    if text:
+        yield offset, text
+
+
+_CANDIDATE = re.compile(r"[^\s\x00-/:-\x7f\u00c0-\u065f\u4e00-\u9fff]")
+"""Pattern: an ASCII digit or a non-ASCII char outside of digit-free blocks"""
+
+_WORD_END = re.compile(r"\S*")
+"""Pattern: the rest of a whitespace separated word"""
+
+
+def _digit_words(text, pos=0):
+    """Lazily finds the whitespace separated words containing a digit.
+
+    A word counts if any of its characters passes ``str.isdigit``, exactly
+    like ``text.split()`` followed by a per character check, but in a single
+    pass so that callers can stop at the second word. A compiled pattern
+    jumps to the next character that may be a digit: an ASCII digit or a
+    non-ASCII character outside of blocks free of digits (Latin, Greek,
+    Cyrillic, Hebrew and Arabic letters, CJK ideographs). Only the words
+    around those characters are looked at; the ones without an ASCII digit
+    are checked in Python since no pattern covers exactly the digits, such
+    as '٣' or '²', that ``str.isdigit`` accepts.
+
+    :param text: text to scan
+    :type text: str
+    :param pos: offset to start scanning from; must be the start of a word
+    :type pos: int
+    :return: offset and word for each word containing a digit
+    :rtype: Iterator[tuple[int, str]]
+    """
+    search = _CANDIDATE.search
+    word_end = _WORD_END.match
+
+    match = search(text, pos)
+    while match is not None:
+        start = match.start()
+        end = word_end(text, start).end()
+        while start > pos and not text[start - 1].isspace():
+            start -= 1
+
+        word = text[start:end]
+        if word.isascii() or any(map(str.isdigit, word)):
+            yield start, word
+        match = search(text, end)
@@ -7,7 +7,12 @@ README = (HERE / "README.md").read_text()
 
 setup(
     name='num-to-words',
+    python_requires='>=3.7',
     install_requires=['pytest'],
+    extras_require={
+        'numpy': ['numpy'],
+        'parquet': ['pyarrow'],
+    },
     version='1.0.0',
     packages=['num2words'],
     url='https://github.com/zachzIAM/num-to-words',
@@ -20,7 +25,7 @@ setup(
     classifiers=[
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3.7",
     ],
     entry_points={
         "console_scripts": [
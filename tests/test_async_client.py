@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import pytest
+from pathlib import Path
+from num2words import AsyncNum2Words, NumeralCache, input_handler
+
+_INPUTS = Path(__file__).parent / "test_inputs"
+
+
+@pytest.mark.parametrize("file_name, status, answer", [
+    ("test1.txt", "ok", "five hundred and thirty six"),
+    ("test8.txt", "invalid", "number invalid"),
+    ("NOT_HERE.txt", "missing", None)
+])
+def test_convert(file_name, status, answer):
+    result = asyncio.run(AsyncNum2Words().convert(str(_INPUTS / file_name)))
+    assert (result.status, result.numeral) == (status, answer)
+
+
+@pytest.mark.parametrize("input_string, answer", [
+    ("We processed 9121 records.", "nine thousand, one hundred and twenty "
+                                   "one"),
+    ("On average only 36% succeed", "number invalid")
+])
+def test_text_to_numeral(input_string, answer):
+    cache = NumeralCache()
+    client = AsyncNum2Words(cache=cache)
+    assert asyncio.run(client.text_to_numeral(input_string)) == answer
+
+
+@pytest.mark.parametrize("size, on_loop", [(10, True), (10**5, False)])
+def test_text_to_numeral_executor(size, on_loop):
+    threads = []
+
+    def handler(text):
+        threads.append(threading.current_thread())
+        return input_handler(text)
+
+    text = "x" * size + " 7"
+    client = AsyncNum2Words(handler)
+    assert asyncio.run(client.text_to_numeral(text)) == "seven"
+    assert (threads == [threading.main_thread()]) == on_loop
+
+
+@pytest.mark.parametrize("max_concurrency, chunksize", [(1, 1), (3, 2),
+                                                       (64, 16)])
+def test_as_completed(max_concurrency, chunksize):
+    paths = sorted(str(p) for p in _INPUTS.iterdir()) * 3
+    client = AsyncNum2Words(max_concurrency=max_concurrency)
+
+    async def collect():
+        return [r async for r in client.as_completed(iter(paths), chunksize)]
+
+    results = asyncio.run(collect())
+    assert sorted(r.path for r in results) == sorted(paths)
+    assert sum(r.status == "ok" for r in results) == 8 * 3
+
+
+def test_max_concurrency_invalid():
+    with pytest.raises(ValueError):
+        AsyncNum2Words(max_concurrency=0)
+
+
+def test_reuse_across_event_loops():
+    client = AsyncNum2Words(max_concurrency=1)
+    path = str(_INPUTS / "test1.txt")
+
+    async def convert():
+        # more jobs than max_concurrency, so they wait on the semaphore
+        return await asyncio.gather(*(client.convert(path) for _ in range(4)))
+
+    for _ in range(2):
+        assert [r.numeral for r in asyncio.run(convert())] == \
+            ["five hundred and thirty six"] * 4
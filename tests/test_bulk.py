@@ -0,0 +1,90 @@
+import io
+import pytest
+from num2words import InvalidNumber, NumberTooLarge, NumeralStyle
+from num2words.__main__ import main
+from num2words.bulk import convert_csv, convert_parquet
+
+_CSV = "id,amount\na,5\nb,-12\nc,1006\nd,9223372036854775808\n"
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_csv(batch_size, workers):
+    out = io.StringIO()
+    assert convert_csv(io.StringIO(_CSV), out, "amount",
+                       batch_size=batch_size, workers=workers) == 4
+    assert out.getvalue() == (
+        "id,amount,amount_words\n"
+        "a,5,five\n"
+        "b,-12,minus twelve\n"
+        "c,1006,one thousand and six\n"
+        "d,9223372036854775808,\"nine quintillion, two hundred and twenty "
+        "three quadrillion, three hundred and seventy two trillion, thirty "
+        "six billion, eight hundred and fifty four million, seven hundred "
+        "and seventy five thousand, eight hundred and eight\"\n")
+
+
+@pytest.mark.parametrize("kwargs, answer", [
+    ({"output_column": "amount"}, "id,amount\na,five\nb,minus twelve\n"),
+    ({"style": NumeralStyle(hyphenate=True)},
+     "id,amount,amount_words\na,5,five\nb,-25,minus twenty-five\n"),
+    ({"delimiter": ";"}, "id;amount;amount_words\na;5;five\nb;-12;"
+                         "minus twelve\n"),
+])
+def test_convert_csv_options(kwargs, answer):
+    text = "id,amount\na,5\nb,-12\n"
+    if "style" in kwargs:
+        text = text.replace("12", "25")
+    if "delimiter" in kwargs:
+        text = text.replace(",", ";")
+    out = io.StringIO()
+    convert_csv(io.StringIO(text), out, "amount", **kwargs)
+    assert out.getvalue() == answer
+
+
+@pytest.mark.parametrize("value, error, message", [
+    ("4.5", InvalidNumber, "row 2: '4.5' is not an integer"),
+    ("", InvalidNumber, "row 2: '' is not an integer"),
+    ("1" * 160, NumberTooLarge, "row 2: can only handle up to 153 digits"),
+])
+def test_convert_csv_errors(value, error, message):
+    text = f"amount\n7\n{value}\n8\n"
+    with pytest.raises(error, match=message):
+        convert_csv(io.StringIO(text), io.StringIO(), "amount")
+
+    out = io.StringIO()
+    assert convert_csv(io.StringIO(text), out, "amount", errors="blank") == 3
+    assert out.getvalue() == \
+        f"amount,amount_words\n7,seven\n{value},\n8,eight\n"
+
+
+@pytest.mark.parametrize("text, kwargs", [
+    ("", {}),
+    ("id\n1\n", {}),
+    ("amount\n1\n", {"batch_size": 0}),
+    ("amount\n1\n", {"errors": "ignore"}),
+])
+def test_convert_csv_invalid(text, kwargs):
+    with pytest.raises(ValueError):
+        convert_csv(io.StringIO(text), io.StringIO(), "amount", **kwargs)
+
+
+def test_convert_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    pq.write_table(pa.table({"amount": pa.array([5, None, -12])}),
+                   tmp_path / "in.parquet")
+    assert convert_parquet(tmp_path / "in.parquet", tmp_path / "out.parquet",
+                           "amount", batch_size=2) == 3
+    table = pq.read_table(tmp_path / "out.parquet")
+    assert table.column("amount_words").to_pylist() == \
+        ["five", None, "minus twelve"]
+
+
+def test_main_bulk(tmp_path, capsys):
+    (tmp_path / "in.csv").write_text("n\n21\n", encoding="utf-8")
+    assert main(["bulk", str(tmp_path / "in.csv"), "-c", "n"]) == 0
+    assert capsys.readouterr().out == "n,n_words\n21,twenty one\n"
+
+    assert main(["bulk", str(tmp_path / "in.csv"), "-c", "x"]) == 1
+    assert capsys.readouterr().err == "error: no column 'x' in ['n']\n"
@@ -1,5 +1,10 @@
+import io
+import os
 import pytest
-from num2words import Num2Words
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from num2words import Num2Words, NumeralCache, iter_paths, input_handler, \
+    Manifest, Stats, NumeralStyle
 
 
 @pytest.mark.parametrize("file_path, answer", [
@@ -86,3 +91,239 @@ def test_num2words(file_path, answer):
 def test_num2words(input_string, answer):
     n2w = Num2Words()
     assert n2w.text_to_numeral(input_string) == answer
+
+
+def test_num2words_cache():
+    cache = NumeralCache(maxsize=10)
+    n2w = Num2Words(cache=cache)
+    for _ in range(3):
+        assert n2w.text_to_numeral("We processed 9121 records.") == \
+            "nine thousand, one hundred and twenty one"
+    assert n2w.cache_info() == (2, 1, 0, 10, 1)
+    assert Num2Words().cache_info() is None
+
+
+_INPUTS = Path(__file__).parent / "test_inputs"
+
+
+@pytest.mark.parametrize("sources, answer", [
+    ([str(_INPUTS / "test1.txt")], ["test1.txt"]),
+    ([str(_INPUTS / "NOT_HERE.txt")], ["NOT_HERE.txt"]),
+    ([str(_INPUTS / "test1?.txt")], [f"test1{i}.txt" for i in range(10)]),
+    ([str(_INPUTS)], sorted(p.name for p in _INPUTS.iterdir())),
+    ([str(_INPUTS / "test2.txt"), str(_INPUTS / "test[34].txt")],
+     ["test2.txt", "test3.txt", "test4.txt"])
+])
+def test_iter_paths(sources, answer):
+    assert sorted(Path(p).name for p in iter_paths(sources)) == sorted(answer)
+
+
+def test_iter_paths_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO(
+        f"{_INPUTS / 'test1.txt'}\n\n{_INPUTS / 'test2.txt'}\n"))
+    assert [Path(p).name for p in iter_paths(["-"])] == ["test1.txt",
+                                                        "test2.txt"]
+
+
+def _failing_handler(text):
+    if "pump" in text:
+        raise RuntimeError("boom")
+    return input_handler(text)
+
+
+_MANY = [str(_INPUTS / f"test{i}.txt") for i in (1, 8, 17)] + \
+    [str(_INPUTS / "NOT_HERE.txt"), str(_INPUTS)]
+
+
+@pytest.mark.parametrize("workers, ordered", [(1, True), (2, True),
+                                              (2, False), (None, True)])
+def test_process_many(workers, ordered):
+    n2w = Num2Words()
+    results = list(n2w.process_many(_MANY, workers=workers, chunksize=2,
+                                    ordered=ordered))
+    if not ordered:
+        results.sort(key=lambda r: _MANY.index(r.path))
+    assert [r.path for r in results] == _MANY
+    assert [r.status for r in results] == ["ok", "invalid", "ok", "missing",
+                                           "missing"]
+    assert results[0] == (_MANY[0], 536, "five hundred and thirty six", "ok",
+                          None)
+    assert results[1].numeral == "number invalid"
+    assert results[2].number == 1234567890987654321
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_process_many_bounded(ordered):
+    taken = []
+    paths = (taken.append(i) or _MANY[i % len(_MANY)] for i in range(10000))
+    results = Num2Words().process_many(paths, workers=2, chunksize=4,
+                                       ordered=ordered)
+    next(results)
+    assert len(taken) <= 4 * 5
+    assert sum(1 for _ in results) == 9999
+
+
+def test_convert_threads():
+    stats = Stats()
+    n2w = Num2Words(cache=NumeralCache(maxsize=2), stats=stats)
+    paths = _MANY * 200
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(n2w.convert, paths))
+    assert results == [Num2Words().convert(path) for path in paths]
+    assert [r.status for r in results[:5]] == ["ok", "invalid", "ok",
+                                               "missing", "missing"]
+    assert n2w.file_path is None and n2w.num == 0
+    assert stats.counters["files"] == len(paths)
+    assert stats.counters["numbers"] == 400
+    info = n2w.cache_info()
+    assert info.hits + info.misses == 400
+
+
+def test_process_many_errors(tmp_path):
+    big = tmp_path / "big.txt"
+    big.write_text(f"A {10**160} of them", encoding="utf-8")
+    paths = [str(_INPUTS / "test1.txt"), str(big), str(_INPUTS / "test2.txt")]
+    results = list(Num2Words(_failing_handler).process_many(paths, workers=2))
+    assert [r.status for r in results] == ["error", "too large", "ok"]
+    assert results[0].error == "RuntimeError: boom"
+    assert results[1].number == 10**160
+
+
+def test_process_many_manifest(tmp_path):
+    seen = []
+
+    def handler(text):
+        seen.append(text)
+        return input_handler(text)
+
+    paths = []
+    for i, text in enumerate(["1 a", "2 b", "3 c", "4 and 5", "6 f"]):
+        paths.append(str(tmp_path / f"{i}.txt"))
+        Path(paths[-1]).write_text(text, encoding="utf-8")
+    paths.append(str(tmp_path / "NOT_HERE.txt"))
+    manifest = tmp_path / "manifest.jsonl"
+    n2w = Num2Words(handler)
+
+    # interrupted after the first two files
+    for _ in zip(range(2), n2w.process_many(paths, 1, manifest=manifest)):
+        pass
+    assert len(Manifest(manifest)) == 2 and len(seen) == 2
+    expected = list(n2w.process_many(paths, 1, manifest=manifest))
+    assert len(seen) == 5
+    assert expected == list(n2w.process_many(paths, 1))
+    assert len(seen) == 10
+
+    # modified, touched but unchanged, and unchanged files
+    Path(paths[0]).write_text("7 g", encoding="utf-8")
+    os.utime(paths[0], ns=(1, 1))
+    os.utime(paths[1], ns=(2, 2))
+    del seen[:]
+    results = list(n2w.process_many(paths, 1, manifest=manifest))
+    assert seen == ["7 g"]
+    assert results[0].numeral == "seven" and results[1:] == expected[1:]
+    assert [r.status for r in results] == ["ok", "ok", "ok", "invalid", "ok",
+                                           "missing"]
+
+    records = Manifest(manifest)
+    assert len(records) == 5 and records.get(paths[1]).mtime_ns == 2
+    records.compact()
+    with open(manifest, encoding="utf-8") as f:
+        assert len(f.readlines()) == 5
+    assert list(Num2Words().process_many(paths, 2, manifest=records)) == \
+        results
+
+
+@pytest.mark.parametrize("keep_contents, chunk_size", [(False, 1),
+                                                       (False, 7),
+                                                       (True, 7)])
+def test_num2words_chunked(keep_contents, chunk_size):
+    n2w = Num2Words(keep_contents=keep_contents, chunk_size=chunk_size)
+    for i, answer in [(17, "one quintillion"), (8, "number invalid"),
+                      (3, "ten thousand and twenty two")]:
+        assert n2w(str(_INPUTS / f"test{i}.txt")).startswith(answer)
+    if keep_contents:
+        assert n2w.file_contents == \
+            (_INPUTS / "test3.txt").read_text(encoding="utf-8")
+    else:
+        assert n2w.file_contents is None
+    assert n2w.num == 10022
+    assert "10022" in str(n2w)
+
+
+_DOCUMENT = ("In 2019 we shipped 136819 units,\nup 36% on 2018 ²\n"
+             "and 0.25 of 7 boxes were lost 12")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 20])
+def test_iter_numbers(chunk_size):
+    n2w = Num2Words(chunk_size=chunk_size)
+    found = list(n2w.iter_numbers(_DOCUMENT))
+    assert [(o, n) for o, n, _ in found] == [(3, 2019), (19, 136819),
+                                             (43, 2018), (62, 7), (80, 12)]
+    assert all(_DOCUMENT[o:].startswith(str(n)) for o, n, _ in found)
+    assert found[-1][2] == "twelve"
+    assert list(n2w.iter_numbers(io.StringIO(_DOCUMENT))) == found
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 20])
+def test_rewrite(chunk_size, tmp_path):
+    n2w = Num2Words(chunk_size=chunk_size)
+    answer = ("In two thousand and nineteen we shipped one hundred and thirty "
+              "six thousand, eight hundred and nineteen units,\nup 36% on two "
+              "thousand and eighteen ²\nand 0.25 of seven boxes were lost "
+              "twelve")
+    assert n2w.rewrite(_DOCUMENT) == answer
+
+    path = tmp_path / "document.txt"
+    path.write_text(_DOCUMENT, encoding="utf-8")
+    out = io.StringIO()
+    assert n2w.rewrite(path, out) is None
+    assert out.getvalue() == answer
+
+
+@pytest.mark.parametrize("keep_contents", [False, True])
+def test_num2words_stats(keep_contents):
+    stats = Stats()
+    n2w = Num2Words(stats=stats, keep_contents=keep_contents)
+    assert n2w(str(_INPUTS / "test1.txt")) == "five hundred and thirty six"
+    assert n2w(str(_INPUTS / "test8.txt")) == "number invalid"
+    assert n2w.text_to_numeral("The 42 boxes") == "forty two"
+    with pytest.raises(ZeroDivisionError):
+        Num2Words(lambda text: 1 // 0, stats=stats).text_to_numeral("1")
+    results = list(n2w.process_many([str(_INPUTS / "test2.txt"),
+                                     str(_INPUTS / "NOT_HERE.txt")], 1))
+    assert [r.status for r in results] == ["ok", "missing"]
+
+    size = sum(len((_INPUTS / f"test{i}.txt").read_bytes()) for i in (1, 8, 2))
+    assert stats.counters == {"files": 4, "texts": 2, "numbers": 3,
+                              "invalid": 1, "errors": 2, "read_bytes": size}
+    assert {s: h.count for s, h in stats.histograms.items()} == \
+        {"read": 3, "extract": 5, "render": 3}
+
+    data = stats.to_dict()
+    assert data["counters"]["numbers"] == 3
+    assert data["stages"]["read"]["buckets"][-1][1] <= 3
+
+    text = stats.to_prometheus()
+    assert 'num2words_stage_seconds_bucket{stage="read",le="+Inf"} 3\n' in text
+    assert 'num2words_stage_seconds_count{stage="extract"} 5\n' in text
+    assert "# TYPE num2words_files_total counter\nnum2words_files_total 4\n" \
+        in text
+    stats.reset()
+    assert stats.counters["files"] == 0
+
+
+def test_num2words_style():
+    us = NumeralStyle(conjunction=False, hyphenate=True)
+    path = str(_INPUTS / "test1.txt")
+    answer = "five hundred thirty-six"
+    assert Num2Words(style=us)(path) == answer
+    n2w = Num2Words(cache=NumeralCache(style=us))
+    assert n2w.style == us and n2w(path) == answer
+    assert n2w.word_numeral == answer
+    assert [r.numeral for r in Num2Words(style=us).process_many([path], 2)] \
+        == [answer]
+    assert Num2Words(cache=NumeralCache(), style=NumeralStyle())(path) == \
+        "five hundred and thirty six"
+    with pytest.raises(ValueError):
+        Num2Words(cache=NumeralCache(), style=us)
@@ -0,0 +1,78 @@
+import io
+import json
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+from num2words.__main__ import main, serve
+
+_INPUTS = Path(__file__).parent / "test_inputs"
+
+
+@pytest.mark.parametrize("argv, status, answer", [
+    (["-n", "1015"], None, "one thousand and fifteen\n"),
+    (["-f", str(_INPUTS / "test1.txt")], None,
+     "five hundred and thirty six\n"),
+    (["-p", str(_INPUTS / "test1.txt"), str(_INPUTS / "test8.txt")], 0,
+     f"{_INPUTS / 'test1.txt'}\tfive hundred and thirty six\n"
+     f"{_INPUTS / 'test8.txt'}\tnumber invalid\n"),
+    (["-p", str(_INPUTS / "NOT_HERE.txt")], 1,
+     f"{_INPUTS / 'NOT_HERE.txt'}\terror: {_INPUTS / 'NOT_HERE.txt'} is not "
+     f"a file\n")
+])
+def test_main(argv, status, answer, capsys):
+    assert main(argv) == status
+    assert capsys.readouterr().out == answer
+
+
+def test_lazy_import():
+    code = ("import sys, num2words\n"
+            "loaded = lambda: sorted(m for m in sys.modules\n"
+            "                        if m.startswith('num2words.'))\n"
+            "print(loaded())\n"
+            "num2words.WordNumeral\n"
+            "print(loaded())\n"
+            "from num2words import Num2Words\n"
+            "print('multiprocessing' in sys.modules, loaded())\n")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                         text=True, check=True).stdout.splitlines()
+    assert out == [
+        "[]",
+        "['num2words.numeral', 'num2words.utils']",
+        "False ['num2words.client', 'num2words.numeral', 'num2words.utils']"
+    ]
+
+
+@pytest.mark.parametrize("name", ["utils", "numeral", "client", "bulk"])
+def test_submodule_attributes(name):
+    import num2words
+    assert getattr(num2words, name) is sys.modules[f"num2words.{name}"]
+    assert name not in num2words.__all__
+
+
+_LINES = b"12\nabc 5 x\n\n1 2\n\xff\n" + str(10**160).encode() + b"\r\n7"
+
+
+@pytest.mark.parametrize("data", [_LINES, _LINES + b"\n"])
+def test_serve(data):
+    out = io.BytesIO()
+    assert serve(io.BufferedReader(io.BytesIO(data)), out) == 1
+    lines = out.getvalue().decode("utf-8").split("\n")
+    assert lines[:2] == ["twelve", "five"] and lines[-2:] == ["seven", ""]
+    assert all(line.startswith("error: ") for line in lines[2:6])
+
+
+def test_serve_jsonl():
+    out = io.BytesIO()
+    assert serve(io.BufferedReader(io.BytesIO(b"8\n9 x\n")), out,
+                 jsonl=True) == 0
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == [
+        {"line": 1, "numeral": "eight"}, {"line": 2, "numeral": "nine"}]
+
+
+def test_serve_long_line():
+    # a line spanning many reads is put together from its pieces
+    data = b"x" * 300000 + b" 12 " + b"y" * 300000 + b"\n3"
+    out = io.BytesIO()
+    assert serve(io.BufferedReader(io.BytesIO(data), 1 << 12), out) == 0
+    assert out.getvalue() == b"twelve\nthree\n"
@@ -1,6 +1,15 @@
+import io
+import pickle
 import pytest
-from random import randint
-from num2words import WordNumeral, NumberTooLarge
+from array import array
+from decimal import Decimal
+from itertools import product
+from concurrent.futures import ThreadPoolExecutor
+from random import Random, randint
+from num2words import WordNumeral, NumberTooLarge, NumeralCache, \
+    InvalidNumeral, NumeralStyle
+from num2words.numeral import _split_groups, _scale_name, _scale_level, \
+    _GROUPS, _TAILS
 
 
 @pytest.mark.parametrize("num, answer", [
@@ -82,11 +91,452 @@ def test_to_numeral(num, answer):
 
 
 @pytest.mark.parametrize("num, answer", [
-    (0.5, TypeError), (-136, ValueError), (-0.7, TypeError),
-    ("test", TypeError), (10**153, NumberTooLarge),
+    (0.5, TypeError), (-0.7, TypeError), ("test", TypeError),
+    (10**153, NumberTooLarge), (-10**153, NumberTooLarge),
     (randint(10**153, 10**154), NumberTooLarge),
     (randint(10**153, 10**160), NumberTooLarge)
 ])
 def test_to_numeral_error(num, answer):
     with pytest.raises(answer):
         WordNumeral.to_numeral(num)
+
+
+@pytest.mark.parametrize("num, answer", [
+    (-1, "minus one"), (-1015, "minus one thousand and fifteen"),
+    (-10**6, "minus one million"),
+    (-(10**153 - 1), "minus " + WordNumeral.to_numeral(10**153 - 1))
+])
+def test_to_numeral_negative(num, answer):
+    assert WordNumeral.to_numeral(num) == answer
+    assert WordNumeral(num).numeral == answer
+    assert NumeralCache().to_numeral(num) == answer
+    assert NumeralStyle().to_numeral(num) == answer
+    assert WordNumeral.from_numeral(answer) == num
+
+
+@pytest.mark.parametrize("num", list(range(0, 2000)) + [
+    10**3, 10**6 + 99, 10**9 + 100, 10**12 + 10**3, 10**152, 10**153 - 1,
+    randint(10**5, 10**18), randint(10**18, 10**60),
+    randint(10**60, 10**153 - 1)
+])
+def test_to_numeral_matches_recursive(num):
+    expected = " ".join(WordNumeral._parse_large(num, 0))
+    assert WordNumeral.to_numeral(num) == expected
+
+
+_BATCH = [0, 7, 100, 1006, 10**6, 123456789, 10**12 + 10**3 + 1,
+          2**62, 2**63 - 1, -1, -1006, -2**63]
+
+
+@pytest.mark.parametrize("nums", [
+    _BATCH, tuple(_BATCH), array('q', _BATCH), array('L', [0, 3, 1000]),
+    [], [10**120, 5]
+])
+def test_to_numerals(nums):
+    nums = list(nums)
+    assert WordNumeral.to_numerals(nums) == [WordNumeral.to_numeral(n)
+                                             for n in nums]
+
+
+@pytest.mark.parametrize("dtype", ["int64", "int32", "uint16", "uint64",
+                                   "int8", "uint8"])
+def test_to_numerals_numpy(dtype):
+    np = pytest.importorskip("numpy")
+    info = np.iinfo(dtype)
+    nums = [n for n in (0, 1, 999, 1000, 1001, info.max // 1001, info.max,
+                        info.min, info.min // 1001)
+            if info.min <= n <= info.max]
+    answer = [WordNumeral.to_numeral(n) for n in nums]
+    assert WordNumeral.to_numerals(np.array(nums, dtype=dtype)) == answer
+    if dtype in ("int8", "uint8"):
+        nums = array("b" if dtype == "int8" else "B", nums)
+        assert WordNumeral.to_numerals(nums) == answer
+
+
+@pytest.mark.parametrize("options", list(product([True, False], repeat=3)))
+def test_to_numerals_style(options):
+    np = pytest.importorskip("numpy")
+    style = NumeralStyle(*options)
+    rand = Random(20)
+    nums = [0, 5, -25, 1006, 10**6 + 21, 2**63 - 1, -2**63] + [
+        rand.randint(-10**rand.randint(1, 18), 10**rand.randint(1, 18))
+        for _ in range(500)]
+    answer = [style.to_numeral(n) for n in nums]
+    assert WordNumeral.to_numerals(np.array(nums), style) == answer
+    assert WordNumeral.to_numerals(nums, style) == answer
+
+
+@pytest.mark.parametrize("nums, answer", [
+    ([1, 0.5], TypeError), (array('d', [1.0]), TypeError),
+    ([10**153], NumberTooLarge), ([1, -10**153], NumberTooLarge)
+])
+def test_to_numerals_error(nums, answer):
+    with pytest.raises(answer):
+        WordNumeral.to_numerals(nums)
+
+
+@pytest.mark.parametrize("num", [
+    1, 999, 1000, 10**152, 2**1300 - 1, 2**1300, 2**1300 + 1, 10**400 + 7,
+    randint(10**400, 10**2000), int("1000" * 300)
+])
+def test_split_groups(num):
+    groups = _split_groups(num)
+    assert groups[0] != 0
+    assert all(0 <= g < 1000 for g in groups)
+    assert int("".join(f"{g:03d}" for g in groups)) == num
+
+
+def test_split_groups_huge():
+    # past the default limit of int to str conversions
+    for num in [10**5000 + 7, randint(10**13000, 10**14000)]:
+        groups = _split_groups(num)
+        assert groups[0] != 0 and all(0 <= g < 1000 for g in groups)
+        assert sum(g * 1000**i for i, g in enumerate(reversed(groups))) == num
+
+
+@pytest.mark.parametrize("num", [
+    0, 7, -7, 1000, 1006, -2001006, 10**6, 10**152 + 7, -(10**153 - 1),
+    randint(10**20, 10**153 - 1)
+])
+@pytest.mark.parametrize("style", [None, NumeralStyle(False, True, False)])
+def test_iter_words(num, style):
+    numeral = WordNumeral.to_numeral(num, style)
+    assert "".join(WordNumeral.iter_words(num, style)) == numeral
+    out = io.StringIO()
+    assert WordNumeral.write_numeral(num, out, style, buffer_size=20) == \
+        len(numeral)
+    assert out.getvalue() == numeral
+
+
+def test_write_numeral_huge():
+    WordNumeral.set_max_digits(20000)
+    try:
+        num = randint(10**19000, 10**20000 - 1)
+        out = io.StringIO()
+        WordNumeral.write_numeral(num, out)
+        assert out.getvalue() == WordNumeral.to_numeral(num)
+        with pytest.raises(NumberTooLarge):
+            WordNumeral.iter_words(10**20000)
+    finally:
+        WordNumeral.set_max_digits()
+    with pytest.raises(TypeError):
+        WordNumeral.write_numeral(1.5, out)
+
+
+@pytest.mark.parametrize("sig, answer", [
+    (2, "million"), (17, "sexdecillion"), (51, "quinquagintillion"),
+    (52, "unquinquagintillion"), (61, "sexagintillion"),
+    (101, "centillion"), (104, "trescentillion"), (107, "sexcentillion"),
+    (108, "septencentillion"), (1001, "millinillion"),
+    (1002, "millimillion"), (1000001, "millinillinillion"),
+    (123457, "tresviginticentillisesquinquagintaquadringentillion")
+])
+def test_scale_name(sig, answer):
+    assert _scale_name(sig) == answer
+    if sig > 50:
+        assert _scale_level(answer, sig) == sig
+        assert _scale_level(answer, sig - 1) is None
+
+
+def test_max_digits():
+    assert WordNumeral.set_max_digits(3003) == 153
+    try:
+        assert WordNumeral.to_numeral(10**3000) == \
+            "one novenonagintanongentillion"
+        for num in [10**153, -10**3003 + 1, randint(10**2000, 10**3003 - 1)]:
+            assert WordNumeral.from_numeral(WordNumeral.to_numeral(num)) == num
+        assert list(WordNumeral.range(10**156 - 1, 10**156 + 1))[1] == \
+            "one unquinquagintillion"
+        with pytest.raises(NumberTooLarge):
+            WordNumeral.to_numeral(10**3003)
+        assert WordNumeral.set_max_digits(4) == 3003
+        with pytest.raises(NumberTooLarge):
+            NumeralStyle().to_numeral(-10000)
+        with pytest.raises(NumberTooLarge):
+            WordNumeral.to_numerals(array('q', [1, 10000]))
+        assert WordNumeral.set_max_digits(2) == 4
+        with pytest.raises(NumberTooLarge):
+            WordNumeral.to_numeral(500)
+        with pytest.raises(NumberTooLarge):
+            NumeralStyle().to_numeral(500)
+        with pytest.raises(NumberTooLarge):
+            WordNumeral.to_numerals(array('q', [500]))
+        assert WordNumeral.to_numeral(99) == "ninety nine"
+    finally:
+        WordNumeral.set_max_digits()
+    with pytest.raises(NumberTooLarge):
+        WordNumeral.to_numeral(10**153)
+    with pytest.raises(ValueError):
+        WordNumeral.set_max_digits(0)
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_numeral_cache(policy):
+    cache = NumeralCache(maxsize=2, policy=policy)
+    for num in [1, 1, 2, 1, 3, 1, 2]:
+        assert cache.to_numeral(num) == WordNumeral.to_numeral(num)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (3, 4, 2)
+    assert info.evictions == 2
+    assert info.hit_rate == 3 / 7
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 0, 2, 0)
+
+
+@pytest.mark.parametrize("policy, evicted", [("lru", 1), ("lfu", 3)])
+def test_numeral_cache_eviction(policy, evicted):
+    cache = NumeralCache(maxsize=2, policy=policy)
+    for num in [1, 1, 3, 4]:
+        cache.to_numeral(num)
+    hits = cache.cache_info().hits
+    cache.to_numeral(evicted)
+    assert cache.cache_info().hits == hits
+
+
+@pytest.mark.parametrize("num, answer", [
+    (5.0, TypeError), (10**153, NumberTooLarge)
+])
+def test_numeral_cache_error(num, answer):
+    cache = NumeralCache()
+    cache.to_numeral(5)
+    with pytest.raises(answer):
+        cache.to_numeral(num)
+    assert cache.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("maxsize, policy", [(0, "lru"), (10, "fifo")])
+def test_numeral_cache_invalid(maxsize, policy):
+    with pytest.raises(ValueError):
+        NumeralCache(maxsize, policy)
+
+
+def test_enable_cache():
+    try:
+        cache = WordNumeral.enable_cache(maxsize=10, policy="lfu")
+        assert WordNumeral.to_numeral(42) == WordNumeral.to_numeral(42)
+        assert WordNumeral(42).numeral == "forty two"
+        assert WordNumeral.cache_info() == cache.cache_info()
+        assert cache.cache_info()[:2] == (2, 1)
+    finally:
+        WordNumeral.disable_cache()
+    assert WordNumeral.cache_info() is None
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_numeral_cache_threads(policy):
+    cache = NumeralCache(maxsize=50, policy=policy)
+    nums = [randint(0, 100) for _ in range(2000)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        numerals = list(pool.map(cache.to_numeral, nums))
+    assert numerals == [WordNumeral.to_numeral(n) for n in nums]
+    info = cache.cache_info()
+    assert info.hits + info.misses == len(nums)
+    assert info.currsize <= 50
+
+
+def test_from_numeral_round_trip():
+    nums = list(range(0, 5000)) + [10**153 - 1, 10**150, 10**6 + 99] + \
+        [randint(0, 10**randint(4, 153) - 1) for _ in range(5000)]
+    for num in nums:
+        assert WordNumeral.from_numeral(WordNumeral.to_numeral(num)) == num
+
+
+@pytest.mark.parametrize("numeral", [
+    "", "and", "hundred", "thousand", "zero zero", "one zero", "six,",
+    "one hundred twenty", "twenty  one", "twenty, one", "ten one",
+    "one hundred and", "one hundred hundred", "one hundred, and six",
+    "one hundred and and six", "one thousand six", "one thousand, six",
+    "one thousand and one hundred", "one thousand and one hundred and six",
+    "two million and five thousand", "one million one thousand",
+    "one thousand, one million", "one million, thousand", "one thousand,",
+    "One thousand", "one thousand , six", "eleventy"
+])
+def test_from_numeral_error(numeral):
+    with pytest.raises(InvalidNumeral):
+        WordNumeral.from_numeral(numeral)
+
+
+def test_from_numeral_only_accepts_to_numeral():
+    rng = Random(0)
+    for _ in range(20000):
+        words = WordNumeral.to_numeral(rng.randint(0, 10**rng.randint(1, 30)))
+        words = words.split(" ")
+        i = rng.randrange(len(words))
+        mutation = rng.choice([
+            lambda w: w.pop(i), lambda w: w.insert(i, rng.choice(w)),
+            lambda w: w.__setitem__(i, w[i].rstrip(",") if "," in w[i] else
+                                    w[i] + ","),
+            lambda w: w.insert(i, "and")
+        ])
+        mutation(words)
+        numeral = " ".join(words)
+        try:
+            num = WordNumeral.from_numeral(numeral)
+        except InvalidNumeral:
+            continue
+        assert WordNumeral.to_numeral(num) == numeral
+
+
+@pytest.mark.parametrize("value, places, answer", [
+    (Decimal("-3.05"), None, "minus three point zero five"),
+    (Decimal("3.10"), None, "three point one zero"),
+    (Decimal("2.5E+3"), None, "two thousand, five hundred"),
+    (Decimal("1234.5678"), 2, "one thousand, two hundred and thirty four "
+                              "point five seven"),
+    (Decimal("-0.004"), 2, "zero point zero zero"),
+    (Decimal("0.995"), 2, "one point zero zero"),
+    (Decimal("1E-400"), 3, "zero point zero zero zero"),
+    (0.1, None, "zero point one"), (2.5, 2, "two point five zero"),
+    (1.005, 2, "one point zero zero"), (-7, 1, "minus seven point zero"),
+    (12, None, "twelve")
+])
+def test_to_decimal(value, places, answer):
+    assert WordNumeral.to_decimal(value, places) == answer
+
+
+@pytest.mark.parametrize("value, places, answer", [
+    ("1.5", None, TypeError), (Decimal("NaN"), None, ValueError),
+    (float("inf"), 2, ValueError), (1.5, -1, ValueError),
+    (Decimal("1E+153"), 2, NumberTooLarge), (-1e153, None, NumberTooLarge),
+    (Decimal("1E-154"), None, NumberTooLarge),
+    (Decimal("1E-999999999"), None, NumberTooLarge),
+    (Decimal("0.5"), 154, NumberTooLarge), (7, 10**9, NumberTooLarge)
+])
+def test_to_decimal_error(value, places, answer):
+    with pytest.raises(answer):
+        WordNumeral.to_decimal(value, places)
+
+
+@pytest.mark.parametrize("amount, currency, answer", [
+    (Decimal("120.05"), "GBP", "one hundred and twenty pounds and five pence"),
+    (Decimal("-1.01"), "USD", "minus one dollar and one cent"),
+    (1, "EUR", "one euro"), (0, "GBP", "zero pounds"),
+    (0.01, "GBP", "one penny"), (Decimal("0.999"), "GBP", "one pound"),
+    (Decimal("-0.001"), "GBP", "zero pounds"),
+    (2.5, ("rand", "rand", "cent", "cents"), "two rand and fifty cents"),
+    (10**6, "USD", "one million dollars")
+])
+def test_to_currency(amount, currency, answer):
+    assert WordNumeral.to_currency(amount, currency) == answer
+    assert WordNumeral.to_currencies([amount], currency) == [answer]
+
+
+@pytest.mark.parametrize("currency", ["XYZ", ("pound", "pounds")])
+def test_to_currency_error(currency):
+    with pytest.raises(ValueError):
+        WordNumeral.to_currency(5, currency)
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32", "int64", "uint32",
+                                   "uint64"])
+def test_to_currencies_numpy(dtype):
+    np = pytest.importorskip("numpy")
+    rand = Random(21)
+    amounts = np.array([0, 1, 99.99, 1e6] + [
+        rand.uniform(-10**rand.randint(0, 9), 10**rand.randint(0, 9))
+        for _ in range(500)]).astype(dtype)
+    if dtype.startswith("u"):
+        amounts = np.abs(amounts)
+    answer = [WordNumeral.to_currency(a) for a in amounts.tolist()]
+    assert WordNumeral.to_currencies(amounts) == answer
+    us = NumeralStyle(conjunction=False, hyphenate=True)
+    assert WordNumeral.to_currencies(amounts, "USD", us) == \
+        [WordNumeral.to_currency(a, "USD", us) for a in amounts.tolist()]
+
+
+def test_to_currencies_uint64():
+    np = pytest.importorskip("numpy")
+    amounts = [0, 2**63 - 1, 2**63, 2**64 - 1]
+    assert WordNumeral.to_currencies(np.array(amounts, dtype=np.uint64)) == \
+        [WordNumeral.to_currency(a) for a in amounts]
+
+
+def test_from_numeral_type_error():
+    with pytest.raises(TypeError):
+        WordNumeral.from_numeral(15)
+
+
+def test_word_numeral_lazy():
+    n = WordNumeral(456123) * WordNumeral(15)
+    assert not hasattr(n, "__dict__")
+    assert n._numeral is None
+    assert n.num == 6841845
+    assert n._numeral is None
+    assert str(n) == WordNumeral.to_numeral(6841845)
+    assert n._numeral == str(n)
+    assert n(12) == "twelve" and n.num == 12
+
+
+@pytest.mark.parametrize("num, answer", [
+    (0.5, TypeError), (-10**153, NumberTooLarge), (10**153, NumberTooLarge)
+])
+def test_word_numeral_error(num, answer):
+    with pytest.raises(answer):
+        WordNumeral(num)
+    with pytest.raises(answer):
+        WordNumeral()(num)
+
+
+@pytest.mark.parametrize("args", [
+    (1,), (0, 2500), (998, 1003), (999990, 1000010, 3),
+    (10**18 - 5, 10**18 + 5),
+    (10**20, 10**20 - 3000, -7), (10**7, 0, -999999), (5, 10**7, 999999),
+    (10**153 - 1002, 10**153), (10**40, 10**42, 10**37 + 1001), (10, 10),
+    (10, 0), (-1, 4), (4, -2, -1), (-2500, 1200, 7), (1002, -998, -1000),
+    (-10**12 - 5, -10**12 + 5), (-10**153 + 1, -10**153 + 1003)
+])
+def test_range(args):
+    assert list(WordNumeral.range(*args)) == \
+        [WordNumeral.to_numeral(n) for n in range(*args)]
+
+
+@pytest.mark.parametrize("args, answer", [
+    ((0.5, 4), TypeError), ((10**153 - 1, 10**153 + 1), NumberTooLarge),
+    ((0, -10**153 - 1, -10**153), NumberTooLarge)
+])
+def test_range_error(args, answer):
+    with pytest.raises(answer):
+        WordNumeral.range(*args)
+
+
+def test_default_style():
+    style = NumeralStyle()
+    assert style._groups == _GROUPS and style._tails == _TAILS
+    rand = Random(20)
+    for digits in range(1, 154):
+        num = rand.randint(0, 10**digits - 1)
+        assert style.to_numeral(num) == WordNumeral.to_numeral(num)
+
+
+@pytest.mark.parametrize("options, num, answer", [
+    ((False, False, True), 105, "one hundred five"),
+    ((False, False, True), 1005, "one thousand five"),
+    ((False, False, True), 2_000_110, "two million, one hundred ten"),
+    ((True, True, True), 1_025, "one thousand and twenty-five"),
+    ((True, True, True), 90, "ninety"),
+    ((True, True, True), 17, "seventeen"),
+    ((True, False, False), 1_234_567, "one million two hundred and thirty "
+                                      "four thousand five hundred and sixty "
+                                      "seven"),
+    ((False, True, False), 10**30 + 42, "one nonillion forty-two"),
+    ((False, True, False), 0, "zero"),
+])
+def test_style(options, num, answer):
+    style = NumeralStyle(*options)
+    assert style.to_numeral(num) == answer
+    assert WordNumeral.to_numeral(num, style) == answer
+    assert pickle.loads(pickle.dumps(style)) == style
+
+
+def test_style_word_numeral():
+    us = NumeralStyle(conjunction=False)
+    n = WordNumeral(105, us) + WordNumeral(1000)
+    assert n.style is us and str(n) == "one thousand, one hundred five"
+    cache = NumeralCache(style=us)
+    assert cache.to_numeral(1005) == cache.to_numeral(1005) == \
+        "one thousand five"
+    assert cache.cache_info().hits == 1
+    with pytest.raises(TypeError):
+        us.to_numeral(5.0)
+    with pytest.raises(NumberTooLarge):
+        us.to_numeral(10**153)
@@ -0,0 +1,69 @@
+import json
+import socket
+import threading
+import pytest
+from http.client import HTTPConnection
+from num2words import NumeralCache
+from num2words.server import NumeralServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = NumeralServer(("127.0.0.1", 0), NumeralCache(maxsize=16))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _request(conn, method, url, body=None):
+    conn.request(method, url, body)
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+@pytest.mark.parametrize("method, url, body, status, answer", [
+    ("GET", "/numeral?n=1015", None, 200,
+     {"number": 1015, "numeral": "one thousand and fifteen"}),
+    ("GET", "/numeral?n=-4", None, 200,
+     {"number": -4, "numeral": "minus four"}),
+    ("GET", f"/numeral?n={10**153}", None, 400,
+     {"error": "can only handle up to 153 digits"}),
+    ("GET", "/numeral?n=x", None, 400, None),
+    ("GET", "/numeral", None, 400, {"error": "missing query parameter n"}),
+    ("GET", "/nothing", None, 404, {"error": "no such endpoint /nothing"}),
+    ("POST", "/numerals", "[7, 12, 7]", 200, ["seven", "twelve", "seven"]),
+    ("POST", "/numerals", '{"n": 7}', 400,
+     {"error": "ValueError: request body must be a JSON array"}),
+    ("POST", "/numerals", '[7, "12"]', 400, None),
+    ("POST", "/text", "The 42 boxes", 200, {"numeral": "forty two"}),
+    ("POST", "/text", "4 or 2", 200, {"numeral": "number invalid"}),
+    ("POST", "/text", f"The {10**153} boxes", 400,
+     {"error": "can only handle up to 153 digits"}),
+    ("POST", "/text", f"The {'9' * 5000} boxes", 400, None),
+])
+def test_server(server, method, url, body, status, answer):
+    conn = HTTPConnection(*server.server_address)
+    try:
+        # all requests of a test go over the same kept alive connection
+        for _ in range(2):
+            code, payload = _request(conn, method, url, body)
+            assert code == status
+            assert answer is None or payload == answer
+    finally:
+        conn.close()
+
+
+def test_server_pipelining(server):
+    request = "GET /numeral?n={} HTTP/1.1\r\nHost: localhost\r\n\r\n"
+    with socket.create_connection(server.server_address) as sock:
+        sock.sendall("".join(request.format(n) for n in range(5)).encode())
+        data = b""
+        while data.count(b"}") < 5:
+            data += sock.recv(65536)
+    bodies = [json.loads(part[part.index(b"{"):] + b"}")
+              for part in data.split(b"}")[:5]]
+    assert [b["number"] for b in bodies] == list(range(5))
+    assert bodies[4]["numeral"] == "four"
+    assert server.cache.cache_info().hits > 0
@@ -1,5 +1,7 @@
 import pytest
-from num2words import input_handler, InvalidNumber
+from random import choice, randint
+from num2words import input_handler, chunked_input_handler, InvalidNumber
+from num2words.utils import _CANDIDATE
 
 
 @pytest.mark.parametrize("input_str, answer", [
@@ -27,4 +29,53 @@ def test_input_handler(input_str, answer):
 ])
 def test_input_handler_error(input_str, answer):
     with pytest.raises(answer):
-        input_handler(input_str)
\ No newline at end of file
+        input_handler(input_str)
+
+
+def _split_handler(input_string):
+    """The original split based implementation of input_handler"""
+    words = input_string.split()
+    with_digits = [w for w in words if any(map(str.isdigit, list(w)))]
+    numeric = [w for w in with_digits if w.isnumeric()]
+    if len(numeric) != 1 or len(with_digits) != 1:
+        raise InvalidNumber("none or multiple numeric words founds")
+    return int(numeric.pop())
+
+
+def _outcome(handler, input_str):
+    try:
+        return handler(input_str)
+    except Exception as e:
+        return type(e)
+
+
+_ALPHABET = "ab.,#%-/ \t\n  \x1c05٣²①½é一"
+
+
+@pytest.mark.parametrize("input_str", [
+    "", "   ", "42", " 42 ", "٣٤", "x² 3", "²", "①", "½", "½ 5", "a 5",
+    "7 8", "7\x1c8", "café 12", "12 café", "一 12", "a5 b", "#5",
+    "1\n2", "no digits here", "9" * 5000
+] + ["".join(choice(_ALPHABET) for _ in range(randint(0, 12)))
+     for _ in range(1000)])
+def test_input_handler_matches_split(input_str):
+    assert _outcome(input_handler, input_str) == \
+        _outcome(_split_handler, input_str)
+
+
+def test_candidate_excludes_no_digits():
+    excluded = [chr(c) for c in range(0x110000)
+                if not _CANDIDATE.match(chr(c))]
+    assert not any(c.isdigit() for c in excluded)
+
+
+@pytest.mark.parametrize("input_str", [
+    "", "42", "We processed 9121 records.", "a  5", "12 café 3",
+    "x² 3", "٣٤ and", "one\ntwo 7\n"
+] + ["".join(choice(_ALPHABET) for _ in range(randint(0, 20)))
+     for _ in range(100)])
+@pytest.mark.parametrize("size", [1, 2, 5])
+def test_chunked_input_handler(input_str, size):
+    chunks = [input_str[i:i + size] for i in range(0, len(input_str), size)]
+    assert _outcome(chunked_input_handler, chunks) == \
+        _outcome(input_handler, input_str)